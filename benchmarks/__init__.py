@@ -0,0 +1 @@
+"""Benchmarks of ``ground.context.Context`` methods."""
@@ -0,0 +1,104 @@
+import argparse
+import sys
+from pathlib import Path
+
+from .inputs import SCALAR_TYPES
+from .reporting import dump, load, write_regressions
+from .running import measure, to_cases, to_methods_names, to_regressions
+
+DEFAULT_SIZES = (10, 100, 1000)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmarks public methods of `ground.context.Context`.',
+    )
+    parser.add_argument(
+        '--methods',
+        nargs='+',
+        default=None,
+        help='names of methods to benchmark (all by default)',
+    )
+    parser.add_argument(
+        '--scalars',
+        nargs='+',
+        choices=list(SCALAR_TYPES),
+        default=list(SCALAR_TYPES),
+        help='types of coordinates',
+    )
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        default=list(DEFAULT_SIZES),
+        help='sizes of sequence-like inputs',
+    )
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=0.1,
+        help='minimum duration of a single measurement in seconds',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3, help='number of measurements'
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0, help='seed of inputs generation'
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=None,
+        help='path to write JSON results to (standard output by default)',
+    )
+    parser.add_argument(
+        '--baseline',
+        type=Path,
+        default=None,
+        help='path to JSON results of a previous run to compare with',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='maximum allowed relative slowdown compared to the baseline',
+    )
+    args = parser.parse_args()
+    methods_names = to_methods_names()
+    if args.methods is not None:
+        unknown_methods_names = set(args.methods).difference(methods_names)
+        if unknown_methods_names:
+            parser.error(
+                'unknown methods: ' + ', '.join(sorted(unknown_methods_names))
+            )
+        methods_names = args.methods
+    measurements = []
+    for case in to_cases(methods_names, args.scalars, args.sizes):
+        measurement = measure(
+            case, min_time=args.min_time, repeat=args.repeat, seed=args.seed
+        )
+        sys.stderr.write(
+            f'{case.method}[{case.scalar}'
+            + ('' if case.size is None else f', {case.size}')
+            + f']: {measurement.seconds:.3e}s\n'
+        )
+        measurements.append(measurement)
+    if args.output is None:
+        dump(measurements, sys.stdout)
+    else:
+        with args.output.open('w') as stream:
+            dump(measurements, stream)
+    if args.baseline is None:
+        return 0
+    with args.baseline.open() as stream:
+        baseline = load(stream)
+    regressions = to_regressions(
+        measurements, baseline, threshold=args.threshold
+    )
+    write_regressions(regressions, args.threshold, sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,239 @@
+import math
+from collections.abc import Callable, Mapping, Sequence
+from fractions import Fraction
+from random import Random
+from typing import Any, Final
+
+from ground.affine import AffineTransform
+from ground.context import Context
+
+MAX_COORDINATE: Final[int] = 10**6
+MIN_CONTOUR_VERTICES_COUNT: Final[int] = 8
+POLYGONS_SPACING: Final[int] = 3 * MAX_COORDINATE
+SCALAR_TYPES: Final[Mapping[str, type[Any]]] = {
+    'int': int,
+    'float': float,
+    'Fraction': Fraction,
+}
+
+
+class InputsFactory:
+    """Produces reproducible pseudo-random inputs of a given size."""
+
+    def __init__(
+        self, context: Context[Any], random: Random, size: int, /
+    ) -> None:
+        self.context, self.random, self.size = context, random, size
+
+    def affine_transform(self, /) -> Any:
+        return AffineTransform(*[self.scalar() for _ in range(6)])
+
+    def box(self, /) -> Any:
+        min_x, max_x = sorted((self.scalar(), self.scalar()))
+        min_y, max_y = sorted((self.scalar(), self.scalar()))
+        return self.context.box_cls(min_x, max_x, min_y, max_y)
+
+    def boxes(self, /) -> list[Any]:
+        return [self.box() for _ in range(self.size)]
+
+    def contour(self, /) -> Any:
+        return self._to_contour(
+            0.0, 0.0, max(self.size, MIN_CONTOUR_VERTICES_COUNT)
+        )
+
+    def contours(self, /) -> list[Any]:
+        return [
+            self._to_contour(
+                index * POLYGONS_SPACING, 0.0, MIN_CONTOUR_VERTICES_COUNT
+            )
+            for index in range(self.size)
+        ]
+
+    def count(self, /) -> int:
+        return self.random.randint(1, max(self.size, 1))
+
+    def crossing_segments(self, /) -> tuple[Any, Any]:
+        return self._to_crossing_segment(), self._to_crossing_segment()
+
+    def multipoint(self, /) -> Any:
+        return self.context.multipoint_cls(self.points())
+
+    def multipolygon(self, /) -> Any:
+        return self.context.multipolygon_cls(self.polygons())
+
+    def multisegment(self, /) -> Any:
+        return self.context.multisegment_cls(self.segments())
+
+    def non_singleton_multipoint(self, /) -> tuple[Any]:
+        return (
+            self.context.multipoint_cls(
+                [self.point() for _ in range(max(self.size, 2))]
+            ),
+        )
+
+    def parallel_segments(self, /) -> tuple[list[Any]]:
+        # parallel segments do not intersect,
+        # while their bounding boxes pairwise overlap
+        point_cls, scalar = self.context.point_cls, self._to_scalar
+        return (
+            [
+                self.context.segment_cls(
+                    point_cls(scalar(index), scalar(0)),
+                    point_cls(
+                        scalar(index + MAX_COORDINATE), scalar(MAX_COORDINATE)
+                    ),
+                )
+                for index in range(self.size)
+            ],
+        )
+
+    def point(self, /) -> Any:
+        return self.context.point_cls(self.scalar(), self.scalar())
+
+    def points(self, /) -> list[Any]:
+        return [self.point() for _ in range(self.size)]
+
+    def polygon(self, /) -> Any:
+        return self._to_polygon(
+            0.0, 0.0, max(self.size, MIN_CONTOUR_VERTICES_COUNT)
+        )
+
+    def polygons(self, /) -> list[Any]:
+        return [
+            self._to_polygon(
+                index * POLYGONS_SPACING, 0.0, MIN_CONTOUR_VERTICES_COUNT
+            )
+            for index in range(self.size)
+        ]
+
+    def scalar(self, /) -> Any:
+        return self._to_scalar(
+            self.random.uniform(-MAX_COORDINATE, MAX_COORDINATE)
+        )
+
+    def segment(self, /) -> Any:
+        start = self.point()
+        end = self.point()
+        while end == start:
+            end = self.point()
+        return self.context.segment_cls(start, end)
+
+    def segments(self, /) -> list[Any]:
+        return [self.segment() for _ in range(self.size)]
+
+    def _to_contour(
+        self,
+        center_x: float,
+        center_y: float,
+        vertices_count: int,
+        /,
+        *,
+        clockwise: bool = False,
+        max_radius: float = MAX_COORDINATE,
+    ) -> Any:
+        # vertices sorted by angle around the center form
+        # a star-shaped (hence simple) polygon,
+        # jittered angles stay within their sectors,
+        # so rounding coordinates does not break the order
+        sector = 2 * math.pi / vertices_count
+        point_cls = self.context.point_cls
+        vertices = []
+        for index in range(vertices_count):
+            angle = (index + 0.5 + self.random.uniform(-0.25, 0.25)) * sector
+            radius = self.random.uniform(max_radius / 2, max_radius)
+            vertices.append(
+                point_cls(
+                    self._to_scalar(center_x + radius * math.cos(angle)),
+                    self._to_scalar(center_y + radius * math.sin(angle)),
+                )
+            )
+        if clockwise:
+            vertices.reverse()
+        return self.context.contour_cls(vertices)
+
+    def _to_crossing_segment(self, /) -> Any:
+        # segments symmetric with respect to the origin cross at it
+        x, y = self.scalar(), self.scalar()
+        point_cls = self.context.point_cls
+        return self.context.segment_cls(point_cls(x, y), point_cls(-x, -y))
+
+    def _to_polygon(
+        self, center_x: float, center_y: float, vertices_count: int, /
+    ) -> Any:
+        return self.context.polygon_cls(
+            self._to_contour(center_x, center_y, vertices_count),
+            [
+                self._to_contour(
+                    center_x,
+                    center_y,
+                    3,
+                    clockwise=True,
+                    max_radius=MAX_COORDINATE / 4,
+                )
+            ],
+        )
+
+    def _to_scalar(self, value: float, /) -> Any:
+        coordinate_factory = self.context.coordinate_factory
+        if coordinate_factory is int:
+            return round(value)
+        if coordinate_factory is Fraction:
+            return Fraction(round(value * 1000), 1000)
+        assert coordinate_factory is float, coordinate_factory
+        return value
+
+
+ArgumentsFactory = Callable[[InputsFactory], Sequence[Any]]
+
+#: factories of positional arguments by annotations of parameters
+ANNOTATIONS_FACTORIES: Final[Mapping[str, Callable[[InputsFactory], Any]]] = {
+    '_AffineTransform[_ScalarT]': InputsFactory.affine_transform,
+    '_Box[_ScalarT]': InputsFactory.box,
+    '_Contour[_ScalarT]': InputsFactory.contour,
+    '_Iterable[_Point[_ScalarT]]': InputsFactory.points,
+    '_Multipoint[_ScalarT]': InputsFactory.multipoint,
+    '_Multipolygon[_ScalarT]': InputsFactory.multipolygon,
+    '_Multisegment[_ScalarT]': InputsFactory.multisegment,
+    (
+        '_Multisegment[_ScalarT] | _prepared.PreparedMultisegment[_ScalarT]'
+    ): InputsFactory.multisegment,
+    '_Point[_ScalarT]': InputsFactory.point,
+    '_Polygon[_ScalarT]': InputsFactory.polygon,
+    '_ScalarT': InputsFactory.scalar,
+    '_Segment[_ScalarT]': InputsFactory.segment,
+    'int': InputsFactory.count,
+    '_Sequence[_Box[_ScalarT]]': InputsFactory.boxes,
+    '_Sequence[_Contour[_ScalarT]]': InputsFactory.contours,
+    '_Sequence[_Point[_ScalarT]]': InputsFactory.points,
+    '_Sequence[_Point[_ScalarT]] | _Buffer': InputsFactory.points,
+    '_Sequence[_Polygon[_ScalarT]]': InputsFactory.polygons,
+    '_Sequence[_Segment[_ScalarT]]': InputsFactory.segments,
+}
+#: annotations of parameters which inputs depend on size
+SIZED_ANNOTATIONS: Final[frozenset[str]] = frozenset(
+    [
+        '_Contour[_ScalarT]',
+        '_Iterable[_Point[_ScalarT]]',
+        '_Multipoint[_ScalarT]',
+        '_Multipolygon[_ScalarT]',
+        '_Multisegment[_ScalarT]',
+        '_Multisegment[_ScalarT] | _prepared.PreparedMultisegment[_ScalarT]',
+        '_Polygon[_ScalarT]',
+        '_Sequence[_Box[_ScalarT]]',
+        '_Sequence[_Contour[_ScalarT]]',
+        '_Sequence[_Point[_ScalarT]]',
+        '_Sequence[_Point[_ScalarT]] | _Buffer',
+        '_Sequence[_Polygon[_ScalarT]]',
+        '_Sequence[_Segment[_ScalarT]]',
+        'int',
+    ]
+)
+#: factories of arguments for methods with preconditions on inputs
+METHODS_ARGUMENTS_FACTORIES: Final[Mapping[str, ArgumentsFactory]] = {
+    'multipoint_closest_pair': InputsFactory.non_singleton_multipoint,
+    'multipoint_nearest_neighbours': InputsFactory.non_singleton_multipoint,
+    'segments_intersection': InputsFactory.crossing_segments,
+    'segments_intersections': InputsFactory.parallel_segments,
+}
+#: methods which are not benchmarked
+SKIPPED_METHODS: Final[frozenset[str]] = frozenset(['replace'])
@@ -0,0 +1,59 @@
+import json
+import platform
+from collections.abc import Iterable, Sequence
+from typing import Any, TextIO
+
+import ground
+
+from .running import Case, Measurement, Regression
+
+
+def dump(measurements: Iterable[Measurement], stream: TextIO, /) -> None:
+    json.dump(
+        {
+            'ground': ground.__version__,
+            'implementation': platform.python_implementation(),
+            'python': platform.python_version(),
+            'results': [
+                {
+                    'method': measurement.case.method,
+                    'scalar': measurement.case.scalar,
+                    'size': measurement.case.size,
+                    'seconds': measurement.seconds,
+                }
+                for measurement in measurements
+            ],
+        },
+        stream,
+        indent=2,
+    )
+    stream.write('\n')
+
+
+def load(stream: TextIO, /) -> dict[Case, float]:
+    raw: dict[str, Any] = json.load(stream)
+    return {
+        Case(result['method'], result['scalar'], result['size']): result[
+            'seconds'
+        ]
+        for result in raw['results']
+    }
+
+
+def write_regressions(
+    regressions: Sequence[Regression], threshold: float, stream: TextIO, /
+) -> None:
+    if not regressions:
+        stream.write(f'No regressions above {threshold:.0%} found.\n')
+        return
+    stream.write(
+        f'Found {len(regressions)} regression(s) above {threshold:.0%}:\n'
+    )
+    for regression in regressions:
+        case = regression.case
+        stream.write(
+            f'  {case.method}[{case.scalar}'
+            + ('' if case.size is None else f', {case.size}')
+            + f']: {regression.baseline_seconds:.3e}s -> '
+            f'{regression.seconds:.3e}s (x{regression.ratio:.2f})\n'
+        )
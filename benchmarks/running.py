@@ -0,0 +1,162 @@
+import inspect
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from random import Random
+from typing import Any, NamedTuple
+
+from ground.context import Context
+
+from .inputs import (
+    ANNOTATIONS_FACTORIES,
+    InputsFactory,
+    METHODS_ARGUMENTS_FACTORIES,
+    SCALAR_TYPES,
+    SIZED_ANNOTATIONS,
+    SKIPPED_METHODS,
+)
+
+
+class Case(NamedTuple):
+    method: str
+    scalar: str
+    size: int | None
+
+
+class Measurement(NamedTuple):
+    case: Case
+    seconds: float
+
+
+class Regression(NamedTuple):
+    case: Case
+    baseline_seconds: float
+    seconds: float
+
+    @property
+    def ratio(self, /) -> float:
+        return self.seconds / self.baseline_seconds
+
+
+def to_methods_names() -> list[str]:
+    """Returns names of public ``Context`` methods to benchmark."""
+    return [
+        name
+        for name, member in vars(Context).items()
+        if (
+            not name.startswith('_')
+            and name not in SKIPPED_METHODS
+            and inspect.isfunction(member)
+        )
+    ]
+
+
+def is_sized(method_name: str, /) -> bool:
+    return method_name in METHODS_ARGUMENTS_FACTORIES or any(
+        parameter.annotation in SIZED_ANNOTATIONS
+        for parameter in _to_positional_parameters(method_name)
+    )
+
+
+def to_arguments(
+    method_name: str, inputs_factory: InputsFactory, /
+) -> Sequence[Any]:
+    try:
+        arguments_factory = METHODS_ARGUMENTS_FACTORIES[method_name]
+    except KeyError:
+        return [
+            ANNOTATIONS_FACTORIES[parameter.annotation](inputs_factory)
+            for parameter in _to_positional_parameters(method_name)
+        ]
+    else:
+        return arguments_factory(inputs_factory)
+
+
+def to_cases(
+    methods_names: Iterable[str],
+    scalars_names: Iterable[str],
+    sizes: Sequence[int],
+    /,
+) -> Iterator[Case]:
+    scalars_names = list(scalars_names)
+    for method_name in methods_names:
+        method_sizes: list[int | None] = (
+            [*sizes] if is_sized(method_name) else [None]
+        )
+        for scalar_name in scalars_names:
+            for size in method_sizes:
+                yield Case(method_name, scalar_name, size)
+
+
+def measure(
+    case: Case, /, *, min_time: float, repeat: int, seed: int
+) -> Measurement:
+    """Returns the best time of a single call of the method."""
+    context = Context(
+        coordinate_factory=SCALAR_TYPES[case.scalar], sqrt=math.sqrt
+    )
+    arguments = to_arguments(
+        case.method,
+        InputsFactory(
+            context, Random(f'{seed}:{case.method}'), case.size or 1
+        ),
+    )
+    method = getattr(context, case.method)
+    call: Callable[[], Any] = _to_call(method, arguments)
+    number = 1
+    while (elapsed := _time(call, number)) < min_time:
+        number *= 2
+    return Measurement(
+        case,
+        min([elapsed, *[_time(call, number) for _ in range(repeat - 1)]])
+        / number,
+    )
+
+
+def to_regressions(
+    measurements: Iterable[Measurement],
+    baseline: Mapping[Case, float],
+    /,
+    *,
+    threshold: float,
+) -> list[Regression]:
+    """
+    Returns measurements which are slower than baseline ones
+    by more than the given fraction.
+    """
+    return [
+        Regression(measurement.case, baseline_seconds, measurement.seconds)
+        for measurement in measurements
+        if (
+            (baseline_seconds := baseline.get(measurement.case)) is not None
+            and measurement.seconds > baseline_seconds * (1 + threshold)
+        )
+    ]
+
+
+def _to_call(
+    method: Callable[..., Any], arguments: Sequence[Any], /
+) -> Callable[[], Any]:
+    if isinstance(method(*arguments), Iterator):
+        return lambda: deque(method(*arguments), maxlen=0)
+    return lambda: method(*arguments)
+
+
+def _time(call: Callable[[], Any], number: int, /) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        call()
+    return time.perf_counter() - start
+
+
+def _to_positional_parameters(method_name: str, /) -> list[inspect.Parameter]:
+    return [
+        parameter
+        for parameter in list(
+            inspect.signature(
+                getattr(Context, method_name)
+            ).parameters.values()
+        )[1:]
+        if parameter.kind is inspect.Parameter.POSITIONAL_ONLY
+    ]
@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any, Final, Generic
+
+from reprit.base import generate_repr
+from typing_extensions import Self
+
+import ground
+
+from .geometries import Point as _Point
+from .hints import (
+    Contour,
+    Empty,
+    Linear,
+    Mix,
+    Multipoint,
+    Multipolygon,
+    Multisegment,
+    Point,
+    Polygon,
+    ScalarT,
+    Segment,
+    Shaped,
+)
+from .packing import pack_mix, pack_points, pack_segments
+from .rotation.plain import point_to_step, rotate_point_around_origin
+from .scaling.plain import scale_point
+from .translation.plain import translate_point
+
+MODULE_NAME: Final[str] = f'{ground.__name__}.affine'
+
+
+class AffineTransform(Generic[ScalarT]):
+    """
+    **AffineTransform** is a mapping of the plane
+    which takes a point with coordinates ``(x, y)`` to the point
+    with coordinates ``(xx * x + xy * y + step_x, yx * x + yy * y + step_y)``.
+
+    Rotations, scalings & translations compose into a single transform,
+    so a geometry can be transformed by them in a single pass.
+
+    >>> from fractions import Fraction
+    >>> from ground.affine import AffineTransform
+    >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+    >>> transform = identity.rotated_around_origin(0, 1).scaled(2, 3)
+    >>> transform == AffineTransform(0, -2, 3, 0, 0, 0)
+    True
+    >>> transform.translated(1, 1) == AffineTransform(0, -2, 3, 0, 1, 1)
+    True
+    >>> transform.determinant == 6
+    True
+    >>> transform.is_degenerate
+    False
+    >>> identity.scaled(1, 0).is_degenerate
+    True
+    """
+
+    @property
+    def determinant(self, /) -> ScalarT:
+        """
+        Returns determinant of the linear part of the transform,
+        i.e. the signed factor by which areas are multiplied.
+        """
+        return self._xx * self._yy - self._xy * self._yx
+
+    @property
+    def is_degenerate(self, /) -> bool:
+        """
+        Checks if the transform maps the plane onto a line or a point.
+        """
+        return bool(self._xx * self._yy == self._xy * self._yx)
+
+    @property
+    def step_x(self, /) -> ScalarT:
+        """Returns abscissa of the image of the origin."""
+        return self._step_x
+
+    @property
+    def step_y(self, /) -> ScalarT:
+        """Returns ordinate of the image of the origin."""
+        return self._step_y
+
+    @property
+    def xx(self, /) -> ScalarT:
+        """Returns coefficient of abscissa in the image abscissa."""
+        return self._xx
+
+    @property
+    def xy(self, /) -> ScalarT:
+        """Returns coefficient of ordinate in the image abscissa."""
+        return self._xy
+
+    @property
+    def yx(self, /) -> ScalarT:
+        """Returns coefficient of abscissa in the image ordinate."""
+        return self._yx
+
+    @property
+    def yy(self, /) -> ScalarT:
+        """Returns coefficient of ordinate in the image ordinate."""
+        return self._yy
+
+    def rotated(
+        self, cosine: ScalarT, sine: ScalarT, center: Point[ScalarT], /
+    ) -> Self:
+        """
+        Returns transform followed by rotation by given angle
+        around given center.
+        """
+        return self.rotated_around_origin(cosine, sine).translated(
+            *point_to_step(center, cosine, sine)
+        )
+
+    def rotated_around_origin(self, cosine: ScalarT, sine: ScalarT, /) -> Self:
+        """
+        Returns transform followed by rotation by given angle around origin.
+        """
+        return self._from_images(
+            rotate_point_around_origin(
+                _Point(self._xx, self._yx), cosine, sine, _Point
+            ),
+            rotate_point_around_origin(
+                _Point(self._xy, self._yy), cosine, sine, _Point
+            ),
+            rotate_point_around_origin(
+                _Point(self._step_x, self._step_y), cosine, sine, _Point
+            ),
+        )
+
+    def scaled(self, factor_x: ScalarT, factor_y: ScalarT, /) -> Self:
+        """Returns transform followed by scaling by given factors."""
+        return self._from_images(
+            scale_point(
+                _Point(self._xx, self._yx), factor_x, factor_y, _Point
+            ),
+            scale_point(
+                _Point(self._xy, self._yy), factor_x, factor_y, _Point
+            ),
+            scale_point(
+                _Point(self._step_x, self._step_y), factor_x, factor_y, _Point
+            ),
+        )
+
+    def then(self, other: AffineTransform[ScalarT], /) -> Self:
+        """Returns transform followed by the other one."""
+        return self._from_images(
+            _Point(
+                other._xx * self._xx + other._xy * self._yx,
+                other._yx * self._xx + other._yy * self._yx,
+            ),
+            _Point(
+                other._xx * self._xy + other._xy * self._yy,
+                other._yx * self._xy + other._yy * self._yy,
+            ),
+            transform_point(_Point(self._step_x, self._step_y), other, _Point),
+        )
+
+    def translated(self, step_x: ScalarT, step_y: ScalarT, /) -> Self:
+        """Returns transform followed by translation by given step."""
+        return self._from_images(
+            _Point(self._xx, self._yx),
+            _Point(self._xy, self._yy),
+            translate_point(
+                _Point(self._step_x, self._step_y), step_x, step_y, _Point
+            ),
+        )
+
+    _step_x: ScalarT
+    _step_y: ScalarT
+    _xx: ScalarT
+    _xy: ScalarT
+    _yx: ScalarT
+    _yy: ScalarT
+
+    def _from_images(
+        self,
+        x_unit_image: Point[ScalarT],
+        y_unit_image: Point[ScalarT],
+        origin_image: Point[ScalarT],
+        /,
+    ) -> Self:
+        # linear part is determined by images of unit vectors,
+        # while translation part is the image of the origin
+        return type(self)(
+            x_unit_image.x,
+            y_unit_image.x,
+            x_unit_image.y,
+            y_unit_image.y,
+            origin_image.x,
+            origin_image.y,
+        )
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_step_x', '_step_y', '_xx', '_xy', '_yx', '_yy'
+
+    def __new__(
+        cls,
+        xx: ScalarT,
+        xy: ScalarT,
+        yx: ScalarT,
+        yy: ScalarT,
+        step_x: ScalarT,
+        step_y: ScalarT,
+        /,
+    ) -> Self:
+        self = super().__new__(cls)
+        (
+            self._xx,
+            self._xy,
+            self._yx,
+            self._yy,
+            self._step_x,
+            self._step_y,
+        ) = xx, xy, yx, yy, step_x, step_y
+        return self
+
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            self._xx == other._xx
+            and self._xy == other._xy
+            and self._yx == other._yx
+            and self._yy == other._yy
+            and self._step_x == other._step_x
+            and self._step_y == other._step_y
+            if isinstance(other, AffineTransform)
+            else NotImplemented
+        )
+
+    def __hash__(self, /) -> int:
+        return hash(
+            (
+                self._xx,
+                self._xy,
+                self._yx,
+                self._yy,
+                self._step_x,
+                self._step_y,
+            )
+        )
+
+    __repr__ = generate_repr(__new__, with_module_name=True)
+
+
+def transform_contour(
+    contour: Contour[ScalarT],
+    transform: AffineTransform[ScalarT],
+    contour_cls: type[Contour[ScalarT]],
+    multipoint_cls: type[Multipoint[ScalarT]],
+    point_cls: type[Point[ScalarT]],
+    segment_cls: type[Segment[ScalarT]],
+    /,
+) -> Contour[ScalarT] | Multipoint[ScalarT] | Segment[ScalarT]:
+    return (
+        transform_vertices_degenerate(
+            contour.vertices, transform, multipoint_cls, point_cls, segment_cls
+        )
+        if transform.is_degenerate
+        else contour_cls(
+            transform_points(contour.vertices, transform, point_cls)
+        )
+    )
+
+
+def transform_multipoint(
+    multipoint: Multipoint[ScalarT],
+    transform: AffineTransform[ScalarT],
+    multipoint_cls: type[Multipoint[ScalarT]],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> Multipoint[ScalarT]:
+    points = transform_points(multipoint.points, transform, point_cls)
+    return multipoint_cls(
+        list(dict.fromkeys(points)) if transform.is_degenerate else points
+    )
+
+
+def transform_multipolygon(
+    multipolygon: Multipolygon[ScalarT],
+    transform: AffineTransform[ScalarT],
+    contour_cls: type[Contour[ScalarT]],
+    multipoint_cls: type[Multipoint[ScalarT]],
+    multipolygon_cls: type[Multipolygon[ScalarT]],
+    multisegment_cls: type[Multisegment[ScalarT]],
+    point_cls: type[Point[ScalarT]],
+    polygon_cls: type[Polygon[ScalarT]],
+    segment_cls: type[Segment[ScalarT]],
+    /,
+) -> Multipoint[ScalarT] | Multipolygon[ScalarT] | Multisegment[ScalarT]:
+    if not transform.is_degenerate:
+        return multipolygon_cls(
+            [
+                transform_polygon_non_degenerate(
+                    polygon, transform, contour_cls, point_cls, polygon_cls
+                )
+                for polygon in multipolygon.polygons
+            ]
+        )
+    if _is_collapsing(transform):
+        return multipoint_cls([point_cls(transform.step_x, transform.step_y)])
+    return multisegment_cls(
+        [
+            _to_points_hull_segment(
+                transform_points(
+                    polygon.border.vertices, transform, point_cls
+                ),
+                segment_cls,
+            )
+            for polygon in multipolygon.polygons
+        ]
+    )
+
+
+def transform_multisegment(
+    multisegment: Multisegment[ScalarT],
+    transform: AffineTransform[ScalarT],
+    empty: Empty[ScalarT],
+    mix_cls: type[Mix[ScalarT]],
+    multipoint_cls: type[Multipoint[ScalarT]],
+    multisegment_cls: type[Multisegment[ScalarT]],
+    point_cls: type[Point[ScalarT]],
+    segment_cls: type[Segment[ScalarT]],
+    /,
+) -> (
+    Empty[ScalarT]
+    | Linear[ScalarT]
+    | Mix[ScalarT]
+    | Multipoint[ScalarT]
+    | Shaped[ScalarT]
+):
+    transformed_points: list[Point[ScalarT]] = []
+    transformed_segments: list[Segment[ScalarT]] = []
+    for segment in multisegment.segments:
+        start, end = transform_points(
+            (segment.start, segment.end), transform, point_cls
+        )
+        if start == end:
+            transformed_points.append(start)
+        else:
+            transformed_segments.append(segment_cls(start, end))
+    return pack_mix(
+        pack_points(
+            list(dict.fromkeys(transformed_points)), empty, multipoint_cls
+        ),
+        pack_segments(transformed_segments, empty, multisegment_cls),
+        empty,
+        empty,
+        mix_cls,
+    )
+
+
+def transform_point(
+    point: Point[ScalarT],
+    transform: AffineTransform[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> Point[ScalarT]:
+    x, y = point.x, point.y
+    return point_cls(
+        transform.xx * x + transform.xy * y + transform.step_x,
+        transform.yx * x + transform.yy * y + transform.step_y,
+    )
+
+
+def transform_points(
+    points: Iterable[Point[ScalarT]],
+    transform: AffineTransform[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> list[Point[ScalarT]]:
+    xx, xy, yx, yy, step_x, step_y = (
+        transform.xx,
+        transform.xy,
+        transform.yx,
+        transform.yy,
+        transform.step_x,
+        transform.step_y,
+    )
+    return [
+        point_cls(
+            xx * point.x + xy * point.y + step_x,
+            yx * point.x + yy * point.y + step_y,
+        )
+        for point in points
+    ]
+
+
+def transform_polygon(
+    polygon: Polygon[ScalarT],
+    transform: AffineTransform[ScalarT],
+    contour_cls: type[Contour[ScalarT]],
+    multipoint_cls: type[Multipoint[ScalarT]],
+    point_cls: type[Point[ScalarT]],
+    polygon_cls: type[Polygon[ScalarT]],
+    segment_cls: type[Segment[ScalarT]],
+    /,
+) -> Multipoint[ScalarT] | Polygon[ScalarT] | Segment[ScalarT]:
+    return (
+        transform_vertices_degenerate(
+            polygon.border.vertices,
+            transform,
+            multipoint_cls,
+            point_cls,
+            segment_cls,
+        )
+        if transform.is_degenerate
+        else transform_polygon_non_degenerate(
+            polygon, transform, contour_cls, point_cls, polygon_cls
+        )
+    )
+
+
+def transform_polygon_non_degenerate(
+    polygon: Polygon[ScalarT],
+    transform: AffineTransform[ScalarT],
+    contour_cls: type[Contour[ScalarT]],
+    point_cls: type[Point[ScalarT]],
+    polygon_cls: type[Polygon[ScalarT]],
+    /,
+) -> Polygon[ScalarT]:
+    return polygon_cls(
+        contour_cls(
+            transform_points(polygon.border.vertices, transform, point_cls)
+        ),
+        [
+            contour_cls(transform_points(hole.vertices, transform, point_cls))
+            for hole in polygon.holes
+        ],
+    )
+
+
+def transform_segment(
+    segment: Segment[ScalarT],
+    transform: AffineTransform[ScalarT],
+    multipoint_cls: type[Multipoint[ScalarT]],
+    point_cls: type[Point[ScalarT]],
+    segment_cls: type[Segment[ScalarT]],
+    /,
+) -> Multipoint[ScalarT] | Segment[ScalarT]:
+    start, end = transform_points(
+        (segment.start, segment.end), transform, point_cls
+    )
+    return multipoint_cls([start]) if start == end else segment_cls(start, end)
+
+
+def transform_vertices_degenerate(
+    vertices: Sequence[Point[ScalarT]],
+    transform: AffineTransform[ScalarT],
+    multipoint_cls: type[Multipoint[ScalarT]],
+    point_cls: type[Point[ScalarT]],
+    segment_cls: type[Segment[ScalarT]],
+    /,
+) -> Multipoint[ScalarT] | Segment[ScalarT]:
+    return (
+        multipoint_cls([point_cls(transform.step_x, transform.step_y)])
+        if _is_collapsing(transform)
+        else _to_points_hull_segment(
+            transform_points(vertices, transform, point_cls), segment_cls
+        )
+    )
+
+
+def _is_collapsing(transform: AffineTransform[Any], /) -> bool:
+    return not (transform.xx or transform.xy or transform.yx or transform.yy)
+
+
+def _to_points_hull_segment(
+    points: Sequence[Point[ScalarT]], segment_cls: type[Segment[ScalarT]], /
+) -> Segment[ScalarT]:
+    # images of a region under a degenerate transform are collinear,
+    # so the extreme ones are the endpoints of their hull
+    return segment_cls(min(points), max(points))
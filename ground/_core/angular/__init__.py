@@ -1 +1,5 @@
-from .context import Context as Context, plain_context as plain_context
+from .context import (
+    Context as Context,
+    filtered_context as filtered_context,
+    plain_context as plain_context,
+)
@@ -1,14 +1,20 @@
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, Sequence
 from typing import Any, Generic, TypeAlias
 
 from reprit import serializers
 from reprit.base import generate_repr
-from typing_extensions import Self
+from typing_extensions import Buffer, Self
 
 from ground._core.enums import Kind, Orientation
 from ground._core.hints import HasRepr, Point, QuaternaryPointFunction, ScalarT
 
-from .plain import kind as plain_kind, orientation as plain_orientation
+from .filtered.kind import kind as filtered_kind
+from .filtered.orientation import orientation as filtered_orientation
+from .filtered.orientations import orientations as filtered_orientations
+from .plain.kind import kind as plain_kind
+from .plain.orientation import orientation as plain_orientation
+from .plain.orientations import orientations as plain_orientations
 
 AngularKindEvaluator: TypeAlias = Callable[
     [
@@ -30,6 +36,16 @@ AngularOrientationEvaluator: TypeAlias = Callable[
     ],
     Orientation,
 ]
+AngularOrientationsEvaluator: TypeAlias = Callable[
+    [
+        Sequence[Point[ScalarT]] | Buffer,
+        Sequence[Point[ScalarT]] | Buffer,
+        Sequence[Point[ScalarT]] | Buffer,
+        QuaternaryPointFunction[ScalarT, ScalarT],
+        ScalarT,
+    ],
+    'array[int]',
+]
 
 
 class Context(HasRepr, Generic[ScalarT]):
@@ -41,10 +57,15 @@ class Context(HasRepr, Generic[ScalarT]):
     def orientation(self, /) -> AngularOrientationEvaluator[ScalarT]:
         return self._orientation
 
+    @property
+    def orientations(self, /) -> AngularOrientationsEvaluator[ScalarT]:
+        return self._orientations
+
     _kind: AngularKindEvaluator[ScalarT]
     _orientation: AngularOrientationEvaluator[ScalarT]
+    _orientations: AngularOrientationsEvaluator[ScalarT]
 
-    __slots__ = '_kind', '_orientation'
+    __slots__ = '_kind', '_orientation', '_orientations'
 
     def __new__(
         cls,
@@ -52,11 +73,27 @@ class Context(HasRepr, Generic[ScalarT]):
         *,
         kind: AngularKindEvaluator[ScalarT],
         orientation: AngularOrientationEvaluator[ScalarT],
+        orientations: AngularOrientationsEvaluator[ScalarT],
     ) -> Self:
         self = super().__new__(cls)
-        self._kind, self._orientation = kind, orientation
+        self._kind, self._orientation, self._orientations = (
+            kind,
+            orientation,
+            orientations,
+        )
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            (
+                self._kind is other._kind
+                and self._orientation is other._orientation
+                and self._orientations is other._orientations
+            )
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
@@ -64,6 +101,13 @@ class Context(HasRepr, Generic[ScalarT]):
     )
 
 
+filtered_context: Context[Any] = Context(
+    kind=filtered_kind,
+    orientation=filtered_orientation,
+    orientations=filtered_orientations,
+)
 plain_context: Context[Any] = Context(
-    kind=plain_kind, orientation=plain_orientation
+    kind=plain_kind,
+    orientation=plain_orientation,
+    orientations=plain_orientations,
 )
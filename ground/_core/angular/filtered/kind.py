@@ -0,0 +1,60 @@
+from ground._core.enums import Kind
+from ground._core.filtering import to_float, to_fraction
+from ground._core.hints import Point, QuaternaryPointFunction, ScalarT
+from ground._core.primitive import to_sign
+
+from .orientation import ERROR_BOUND_FACTOR, MAGNITUDE_OFFSET
+
+
+def kind(
+    vertex: Point[ScalarT],
+    first_ray_point: Point[ScalarT],
+    second_ray_point: Point[ScalarT],
+    _dot_product: QuaternaryPointFunction[ScalarT, ScalarT],
+    _zero: ScalarT,
+    /,
+) -> Kind:
+    try:
+        vertex_x, vertex_y = to_float(vertex.x), to_float(vertex.y)
+        first_ray_point_x, first_ray_point_y = (
+            to_float(first_ray_point.x),
+            to_float(first_ray_point.y),
+        )
+        second_ray_point_x, second_ray_point_y = (
+            to_float(second_ray_point.x),
+            to_float(second_ray_point.y),
+        )
+    except OverflowError:
+        return exact_kind(vertex, first_ray_point, second_ray_point)
+    product = (first_ray_point_x - vertex_x) * (
+        second_ray_point_x - vertex_x
+    ) + (first_ray_point_y - vertex_y) * (second_ray_point_y - vertex_y)
+    error_bound = ERROR_BOUND_FACTOR * (
+        (abs(first_ray_point_x) + abs(vertex_x) + MAGNITUDE_OFFSET)
+        * (abs(second_ray_point_x) + abs(vertex_x) + MAGNITUDE_OFFSET)
+        + (abs(first_ray_point_y) + abs(vertex_y) + MAGNITUDE_OFFSET)
+        * (abs(second_ray_point_y) + abs(vertex_y) + MAGNITUDE_OFFSET)
+    )
+    if product > error_bound:
+        return Kind.ACUTE
+    if -product > error_bound:
+        return Kind.OBTUSE
+    return exact_kind(vertex, first_ray_point, second_ray_point)
+
+
+def exact_kind(
+    vertex: Point[ScalarT],
+    first_ray_point: Point[ScalarT],
+    second_ray_point: Point[ScalarT],
+    /,
+) -> Kind:
+    vertex_x, vertex_y = to_fraction(vertex.x), to_fraction(vertex.y)
+    return Kind(
+        to_sign(
+            (to_fraction(first_ray_point.x) - vertex_x)
+            * (to_fraction(second_ray_point.x) - vertex_x)
+            + (to_fraction(first_ray_point.y) - vertex_y)
+            * (to_fraction(second_ray_point.y) - vertex_y),
+            to_fraction(0),
+        )
+    )
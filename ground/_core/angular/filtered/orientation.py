@@ -0,0 +1,68 @@
+from typing import Final
+
+from ground._core.enums import Orientation
+from ground._core.filtering import UNIT_ROUNDOFF, to_float, to_fraction
+from ground._core.hints import Point, QuaternaryPointFunction, ScalarT
+from ground._core.primitive import to_sign
+
+# rounding errors of the determinant evaluated in floating point arithmetic
+# (including conversions of coordinates) do not exceed
+# the permanent of its coordinates magnitudes scaled by the factor,
+# magnitudes are shifted by the offset
+# to cover conversions of tiny coordinates & underflows as well
+MAGNITUDE_OFFSET: Final[float] = 2.0**-500
+ERROR_BOUND_FACTOR: Final[float] = 8 * UNIT_ROUNDOFF
+
+
+def orientation(
+    vertex: Point[ScalarT],
+    first_ray_point: Point[ScalarT],
+    second_ray_point: Point[ScalarT],
+    _cross_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    _zero: ScalarT,
+    /,
+) -> Orientation:
+    try:
+        vertex_x, vertex_y = to_float(vertex.x), to_float(vertex.y)
+        first_ray_point_x, first_ray_point_y = (
+            to_float(first_ray_point.x),
+            to_float(first_ray_point.y),
+        )
+        second_ray_point_x, second_ray_point_y = (
+            to_float(second_ray_point.x),
+            to_float(second_ray_point.y),
+        )
+    except OverflowError:
+        return exact_orientation(vertex, first_ray_point, second_ray_point)
+    determinant = (first_ray_point_x - vertex_x) * (
+        second_ray_point_y - vertex_y
+    ) - (first_ray_point_y - vertex_y) * (second_ray_point_x - vertex_x)
+    error_bound = ERROR_BOUND_FACTOR * (
+        (abs(first_ray_point_x) + abs(vertex_x) + MAGNITUDE_OFFSET)
+        * (abs(second_ray_point_y) + abs(vertex_y) + MAGNITUDE_OFFSET)
+        + (abs(first_ray_point_y) + abs(vertex_y) + MAGNITUDE_OFFSET)
+        * (abs(second_ray_point_x) + abs(vertex_x) + MAGNITUDE_OFFSET)
+    )
+    if determinant > error_bound:
+        return Orientation.COUNTERCLOCKWISE
+    if -determinant > error_bound:
+        return Orientation.CLOCKWISE
+    return exact_orientation(vertex, first_ray_point, second_ray_point)
+
+
+def exact_orientation(
+    vertex: Point[ScalarT],
+    first_ray_point: Point[ScalarT],
+    second_ray_point: Point[ScalarT],
+    /,
+) -> Orientation:
+    vertex_x, vertex_y = to_fraction(vertex.x), to_fraction(vertex.y)
+    return Orientation(
+        to_sign(
+            (to_fraction(first_ray_point.x) - vertex_x)
+            * (to_fraction(second_ray_point.y) - vertex_y)
+            - (to_fraction(first_ray_point.y) - vertex_y)
+            * (to_fraction(second_ray_point.x) - vertex_x),
+            to_fraction(0),
+        )
+    )
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from fractions import Fraction
+
+from typing_extensions import Buffer
+
+from ground._core.angular.plain.orientations import to_points_sequences
+from ground._core.arrays import numpy, to_coordinates
+from ground._core.hints import Point, QuaternaryPointFunction, ScalarT
+from ground._core.primitive import to_sign
+
+from .orientation import ERROR_BOUND_FACTOR, MAGNITUDE_OFFSET, orientation
+
+
+def orientations(
+    vertices: Sequence[Point[ScalarT]] | Buffer,
+    first_ray_points: Sequence[Point[ScalarT]] | Buffer,
+    second_ray_points: Sequence[Point[ScalarT]] | Buffer,
+    cross_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    zero: ScalarT,
+    /,
+) -> array[int]:
+    vertices_coordinates, first_ray_points_coordinates = (
+        to_coordinates(vertices),
+        to_coordinates(first_ray_points),
+    )
+    second_ray_points_coordinates = to_coordinates(second_ray_points)
+    if (
+        vertices_coordinates is not None
+        and first_ray_points_coordinates is not None
+        and second_ray_points_coordinates is not None
+    ):
+        return coordinates_orientations(
+            vertices_coordinates,
+            first_ray_points_coordinates,
+            second_ray_points_coordinates,
+        )
+    vertices, first_ray_points, second_ray_points = to_points_sequences(
+        vertices,
+        first_ray_points,
+        second_ray_points,
+        vertices_coordinates,
+        first_ray_points_coordinates,
+        second_ray_points_coordinates,
+    )
+    return array(
+        'b',
+        [
+            orientation(
+                vertex, first_ray_point, second_ray_point, cross_producer, zero
+            )
+            for vertex, first_ray_point, second_ray_point in zip(
+                vertices, first_ray_points, second_ray_points, strict=True
+            )
+        ],
+    )
+
+
+def coordinates_orientations(
+    vertices_coordinates: memoryview[float],
+    first_ray_points_coordinates: memoryview[float],
+    second_ray_points_coordinates: memoryview[float],
+    /,
+) -> array[int]:
+    if not (
+        len(vertices_coordinates)
+        == len(first_ray_points_coordinates)
+        == len(second_ray_points_coordinates)
+    ):
+        raise ValueError(
+            'Coordinates buffers should have the same size, but found '
+            f'{len(vertices_coordinates)}, '
+            f'{len(first_ray_points_coordinates)} '
+            f'and {len(second_ray_points_coordinates)}.'
+        )
+    if numpy is not None:
+        vertices_array = numpy.frombuffer(
+            vertices_coordinates, dtype=numpy.float64
+        )
+        first_ray_points_array = numpy.frombuffer(
+            first_ray_points_coordinates, dtype=numpy.float64
+        )
+        second_ray_points_array = numpy.frombuffer(
+            second_ray_points_coordinates, dtype=numpy.float64
+        )
+        vertices_xs, vertices_ys = vertices_array[::2], vertices_array[1::2]
+        first_ray_points_xs, first_ray_points_ys = (
+            first_ray_points_array[::2],
+            first_ray_points_array[1::2],
+        )
+        second_ray_points_xs, second_ray_points_ys = (
+            second_ray_points_array[::2],
+            second_ray_points_array[1::2],
+        )
+        determinants = (first_ray_points_xs - vertices_xs) * (
+            second_ray_points_ys - vertices_ys
+        ) - (first_ray_points_ys - vertices_ys) * (
+            second_ray_points_xs - vertices_xs
+        )
+        vertices_xs_magnitudes, vertices_ys_magnitudes = (
+            numpy.abs(vertices_xs),
+            numpy.abs(vertices_ys),
+        )
+        errors_bounds = ERROR_BOUND_FACTOR * (
+            (
+                numpy.abs(first_ray_points_xs)
+                + vertices_xs_magnitudes
+                + MAGNITUDE_OFFSET
+            )
+            * (
+                numpy.abs(second_ray_points_ys)
+                + vertices_ys_magnitudes
+                + MAGNITUDE_OFFSET
+            )
+            + (
+                numpy.abs(first_ray_points_ys)
+                + vertices_ys_magnitudes
+                + MAGNITUDE_OFFSET
+            )
+            * (
+                numpy.abs(second_ray_points_xs)
+                + vertices_xs_magnitudes
+                + MAGNITUDE_OFFSET
+            )
+        )
+        signs = numpy.where(
+            determinants > errors_bounds,
+            1,
+            numpy.where(-determinants > errors_bounds, -1, 0),
+        ).astype(numpy.int8)
+        for index in numpy.flatnonzero(signs == 0).tolist():
+            signs[index] = _to_exact_sign(
+                vertices_xs[index],
+                vertices_ys[index],
+                first_ray_points_xs[index],
+                first_ray_points_ys[index],
+                second_ray_points_xs[index],
+                second_ray_points_ys[index],
+            )
+        return array('b', signs.tobytes())
+    result = array('b')
+    for (
+        vertex_x,
+        vertex_y,
+        first_ray_point_x,
+        first_ray_point_y,
+        second_ray_point_x,
+        second_ray_point_y,
+    ) in zip(
+        vertices_coordinates[::2],
+        vertices_coordinates[1::2],
+        first_ray_points_coordinates[::2],
+        first_ray_points_coordinates[1::2],
+        second_ray_points_coordinates[::2],
+        second_ray_points_coordinates[1::2],
+        strict=True,
+    ):
+        determinant = (first_ray_point_x - vertex_x) * (
+            second_ray_point_y - vertex_y
+        ) - (first_ray_point_y - vertex_y) * (second_ray_point_x - vertex_x)
+        error_bound = ERROR_BOUND_FACTOR * (
+            (abs(first_ray_point_x) + abs(vertex_x) + MAGNITUDE_OFFSET)
+            * (abs(second_ray_point_y) + abs(vertex_y) + MAGNITUDE_OFFSET)
+            + (abs(first_ray_point_y) + abs(vertex_y) + MAGNITUDE_OFFSET)
+            * (abs(second_ray_point_x) + abs(vertex_x) + MAGNITUDE_OFFSET)
+        )
+        result.append(
+            1
+            if determinant > error_bound
+            else (
+                -1
+                if -determinant > error_bound
+                else _to_exact_sign(
+                    vertex_x,
+                    vertex_y,
+                    first_ray_point_x,
+                    first_ray_point_y,
+                    second_ray_point_x,
+                    second_ray_point_y,
+                )
+            )
+        )
+    return result
+
+
+def _to_exact_sign(
+    vertex_x: float,
+    vertex_y: float,
+    first_ray_point_x: float,
+    first_ray_point_y: float,
+    second_ray_point_x: float,
+    second_ray_point_y: float,
+    /,
+) -> int:
+    exact_vertex_x, exact_vertex_y = Fraction(vertex_x), Fraction(vertex_y)
+    return to_sign(
+        (Fraction(first_ray_point_x) - exact_vertex_x)
+        * (Fraction(second_ray_point_y) - exact_vertex_y)
+        - (Fraction(first_ray_point_y) - exact_vertex_y)
+        * (Fraction(second_ray_point_x) - exact_vertex_x),
+        Fraction(0),
+    )
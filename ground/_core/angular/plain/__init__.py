@@ -1,2 +0,0 @@
-from .kind import kind as kind
-from .orientation import orientation as orientation
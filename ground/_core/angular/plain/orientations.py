@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+from typing_extensions import Buffer
+
+from ground._core.arrays import is_points_sequence, numpy, to_coordinates
+from ground._core.hints import Point, QuaternaryPointFunction, ScalarT
+from ground._core.primitive import to_sign
+
+
+def orientations(
+    vertices: Sequence[Point[ScalarT]] | Buffer,
+    first_ray_points: Sequence[Point[ScalarT]] | Buffer,
+    second_ray_points: Sequence[Point[ScalarT]] | Buffer,
+    cross_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    zero: ScalarT,
+    /,
+) -> array[int]:
+    vertices_coordinates, first_ray_points_coordinates = (
+        to_coordinates(vertices),
+        to_coordinates(first_ray_points),
+    )
+    second_ray_points_coordinates = to_coordinates(second_ray_points)
+    if (
+        vertices_coordinates is not None
+        and first_ray_points_coordinates is not None
+        and second_ray_points_coordinates is not None
+    ):
+        return coordinates_orientations(
+            vertices_coordinates,
+            first_ray_points_coordinates,
+            second_ray_points_coordinates,
+        )
+    vertices, first_ray_points, second_ray_points = to_points_sequences(
+        vertices,
+        first_ray_points,
+        second_ray_points,
+        vertices_coordinates,
+        first_ray_points_coordinates,
+        second_ray_points_coordinates,
+    )
+    return array(
+        'b',
+        [
+            to_sign(
+                cross_producer(
+                    vertex, first_ray_point, vertex, second_ray_point
+                ),
+                zero,
+            )
+            for vertex, first_ray_point, second_ray_point in zip(
+                vertices, first_ray_points, second_ray_points, strict=True
+            )
+        ],
+    )
+
+
+def to_points_sequences(
+    vertices: Sequence[Point[ScalarT]] | Buffer,
+    first_ray_points: Sequence[Point[ScalarT]] | Buffer,
+    second_ray_points: Sequence[Point[ScalarT]] | Buffer,
+    vertices_coordinates: memoryview[float] | None,
+    first_ray_points_coordinates: memoryview[float] | None,
+    second_ray_points_coordinates: memoryview[float] | None,
+    /,
+) -> tuple[
+    Sequence[Point[ScalarT]],
+    Sequence[Point[ScalarT]],
+    Sequence[Point[ScalarT]],
+]:
+    if not (
+        isinstance(vertices, Sequence)
+        and is_points_sequence(vertices, vertices_coordinates)
+        and isinstance(first_ray_points, Sequence)
+        and is_points_sequence(first_ray_points, first_ray_points_coordinates)
+        and isinstance(second_ray_points, Sequence)
+        and is_points_sequence(
+            second_ray_points, second_ray_points_coordinates
+        )
+    ):
+        raise TypeError(
+            'Vertices & rays points should be '
+            'either all buffers or all sequences of points, but found '
+            f'{type(vertices)!r}, {type(first_ray_points)!r} '
+            f'and {type(second_ray_points)!r}.'
+        )
+    return vertices, first_ray_points, second_ray_points
+
+
+def coordinates_orientations(
+    vertices_coordinates: memoryview[float],
+    first_ray_points_coordinates: memoryview[float],
+    second_ray_points_coordinates: memoryview[float],
+    /,
+) -> array[int]:
+    if not (
+        len(vertices_coordinates)
+        == len(first_ray_points_coordinates)
+        == len(second_ray_points_coordinates)
+    ):
+        raise ValueError(
+            'Coordinates buffers should have the same size, but found '
+            f'{len(vertices_coordinates)}, '
+            f'{len(first_ray_points_coordinates)} '
+            f'and {len(second_ray_points_coordinates)}.'
+        )
+    if numpy is not None:
+        vertices_array = numpy.frombuffer(
+            vertices_coordinates, dtype=numpy.float64
+        )
+        first_ray_points_array = numpy.frombuffer(
+            first_ray_points_coordinates, dtype=numpy.float64
+        )
+        second_ray_points_array = numpy.frombuffer(
+            second_ray_points_coordinates, dtype=numpy.float64
+        )
+        vertices_xs, vertices_ys = vertices_array[::2], vertices_array[1::2]
+        return array(
+            'b',
+            numpy.sign(
+                (first_ray_points_array[::2] - vertices_xs)
+                * (second_ray_points_array[1::2] - vertices_ys)
+                - (first_ray_points_array[1::2] - vertices_ys)
+                * (second_ray_points_array[::2] - vertices_xs)
+            )
+            .astype(numpy.int8)
+            .tobytes(),
+        )
+    return array(
+        'b',
+        [
+            to_sign(
+                (first_ray_point_x - vertex_x)
+                * (second_ray_point_y - vertex_y)
+                - (first_ray_point_y - vertex_y)
+                * (second_ray_point_x - vertex_x),
+                0.0,
+            )
+            for (
+                vertex_x,
+                vertex_y,
+                first_ray_point_x,
+                first_ray_point_y,
+                second_ray_point_x,
+                second_ray_point_y,
+            ) in zip(
+                vertices_coordinates[::2],
+                vertices_coordinates[1::2],
+                first_ray_points_coordinates[::2],
+                first_ray_points_coordinates[1::2],
+                second_ray_points_coordinates[::2],
+                second_ray_points_coordinates[1::2],
+                strict=True,
+            )
+        ],
+    )
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+import numpy
+from typing_extensions import Buffer
+
+from ground._core.angular.plain.orientations import (
+    coordinates_orientations,
+    orientations as plain_orientations,
+    to_points_sequences,
+)
+from ground._core.arrays import to_coordinates
+from ground._core.hints import Point, QuaternaryPointFunction, ScalarT
+from ground._core.vector.plain.cross import multiply as plain_cross_multiply
+from ground._core.vectorization import to_points_array
+
+
+def orientations(
+    vertices: Sequence[Point[ScalarT]] | Buffer,
+    first_ray_points: Sequence[Point[ScalarT]] | Buffer,
+    second_ray_points: Sequence[Point[ScalarT]] | Buffer,
+    cross_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    zero: ScalarT,
+    /,
+) -> array[int]:
+    vertices_coordinates, first_ray_points_coordinates = (
+        to_coordinates(vertices),
+        to_coordinates(first_ray_points),
+    )
+    second_ray_points_coordinates = to_coordinates(second_ray_points)
+    if (
+        vertices_coordinates is not None
+        and first_ray_points_coordinates is not None
+        and second_ray_points_coordinates is not None
+    ):
+        return coordinates_orientations(
+            vertices_coordinates,
+            first_ray_points_coordinates,
+            second_ray_points_coordinates,
+        )
+    vertices, first_ray_points, second_ray_points = to_points_sequences(
+        vertices,
+        first_ray_points,
+        second_ray_points,
+        vertices_coordinates,
+        first_ray_points_coordinates,
+        second_ray_points_coordinates,
+    )
+    if cross_producer is not plain_cross_multiply:
+        # custom cross product can not be vectorized
+        return plain_orientations(
+            vertices, first_ray_points, second_ray_points, cross_producer, zero
+        )
+    if not len(vertices) == len(first_ray_points) == len(second_ray_points):
+        raise ValueError(
+            'Sequences should have the same size, but found '
+            f'{len(vertices)}, {len(first_ray_points)} '
+            f'and {len(second_ray_points)}.'
+        )
+    coordinate_factory = type(zero)
+    vertices_array = to_points_array(vertices, coordinate_factory)
+    first_ray_vectors = (
+        to_points_array(first_ray_points, coordinate_factory) - vertices_array
+    )
+    second_ray_vectors = (
+        to_points_array(second_ray_points, coordinate_factory) - vertices_array
+    )
+    cross_products = (
+        first_ray_vectors[:, 0] * second_ray_vectors[:, 1]
+        - first_ray_vectors[:, 1] * second_ray_vectors[:, 0]
+    )
+    return array(
+        'b',
+        (
+            (cross_products > zero).astype(numpy.int8)
+            - (cross_products < zero).astype(numpy.int8)
+        ).tobytes(),
+    )
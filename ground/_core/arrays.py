@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import accumulate, chain
+from operator import attrgetter
+from types import ModuleType
+from typing import Any, Final, overload
+
+from typing_extensions import Buffer, Self
+
+import ground
+
+from . import geometries, hints
+
+numpy: ModuleType | None
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+COORDINATES_FORMAT: Final = 'd'
+DEFAULT_POINT_CLS: Final[type[hints.Point[float]]] = geometries.Point
+MODULE_NAME: Final[str] = f'{ground.__name__}.arrays'
+
+
+class PointArray(Sequence[hints.Point[float]]):
+    """
+    **PointArray** is a compact sequence of points
+    backed by a buffer of interleaved coordinates
+    (abscissa & ordinate of the first point,
+    abscissa & ordinate of the second point, etc.)
+    of ``float`` values.
+
+    Points are constructed lazily on access,
+    coordinates are not copied and can be viewed without copying
+    through ``coordinates`` property
+    (or directly through the buffer protocol on Python 3.12+).
+
+    >>> from array import array
+    >>> from ground.arrays import PointArray
+    >>> points = PointArray(array('d', [0.0, 0.0, 1.0, 0.0, 0.0, 1.0]))
+    >>> len(points)
+    3
+    >>> points[1]
+    Point(1.0, 0.0)
+    >>> points[::2]
+    PointArray(array('d', [0.0, 0.0, 0.0, 1.0]))
+    """
+
+    @property
+    def coordinates(self, /) -> memoryview[float]:
+        """Returns read-only view of interleaved coordinates."""
+        return self._coordinates
+
+    @property
+    def point_cls(self, /) -> type[hints.Point[float]]:
+        """Returns type of points."""
+        return self._point_cls
+
+    _coordinates: memoryview[float]
+    _point_cls: type[hints.Point[float]]
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_coordinates', '_point_cls'
+
+    def __new__(
+        cls,
+        coordinates: Buffer,
+        /,
+        *,
+        point_cls: type[hints.Point[float]] = DEFAULT_POINT_CLS,
+    ) -> Self:
+        """Constructs point array given buffer of interleaved coordinates."""
+        coordinates_view = to_coordinates(coordinates)
+        if coordinates_view is None:
+            raise TypeError(
+                'Coordinates should support buffer protocol, '
+                f'but found {type(coordinates)!r}.'
+            )
+        self = super().__new__(cls)
+        self._coordinates, self._point_cls = (
+            # read-only view is cast back to coordinates format
+            # since its type does not keep it
+            coordinates_view.toreadonly().cast('B').cast(COORDINATES_FORMAT),
+            point_cls,
+        )
+        return self
+
+    def __buffer__(self, flags: int, /) -> memoryview[Any]:
+        return self._coordinates
+
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            self._coordinates == other._coordinates
+            if isinstance(other, PointArray)
+            else NotImplemented
+        )
+
+    @overload
+    def __getitem__(self, index: int, /) -> hints.Point[float]: ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> Self: ...
+
+    def __getitem__(self, index: int | slice, /) -> hints.Point[float] | Self:
+        coordinates = self._coordinates
+        if isinstance(index, slice):
+            indices = range(len(self))[index]
+            return type(self)(
+                coordinates[2 * indices.start : 2 * indices.stop]
+                if indices.step == 1
+                else array(
+                    COORDINATES_FORMAT,
+                    [
+                        coordinate
+                        for index in indices
+                        for coordinate in coordinates[
+                            2 * index : 2 * index + 2
+                        ]
+                    ],
+                ),
+                point_cls=self._point_cls,
+            )
+        size = len(self)
+        if not -size <= index < size:
+            raise IndexError(
+                f'Index should be in range({-size}, {size}), '
+                f'but found {index}.'
+            )
+        if index < 0:
+            index += size
+        return self._point_cls(
+            coordinates[2 * index], coordinates[2 * index + 1]
+        )
+
+    def __iter__(self, /) -> Iterator[hints.Point[float]]:
+        coordinates = self._coordinates
+        return map(self._point_cls, coordinates[::2], coordinates[1::2])
+
+    def __len__(self, /) -> int:
+        return len(self._coordinates) // 2
+
+    def __repr__(self, /) -> str:
+        return (
+            f'{type(self).__qualname__}('
+            f'{array(COORDINATES_FORMAT, self._coordinates)!r}'
+            + (
+                ''
+                if self._point_cls is DEFAULT_POINT_CLS
+                else f', point_cls={self._point_cls.__qualname__}'
+            )
+            + ')'
+        )
+
+
+def is_points_sequence(
+    value: Sequence[Any], coordinates: memoryview[float] | None, /
+) -> bool:
+    # point arrays are both buffers & sequences of points
+    return coordinates is None or isinstance(value, PointArray)
+
+
+def to_vertices_coordinates(
+    vertices: PointArray, /
+) -> tuple[Sequence[Any], Sequence[Any]]:
+    # vertices are split into abscissas & ordinates
+    # without constructing points
+    coordinates = vertices.coordinates
+    return coordinates[::2], coordinates[1::2]
+
+
+def to_contours_coordinates(
+    contours: Iterable[hints.Contour[Any]], /
+) -> tuple[list[Any], list[Any], list[int]]:
+    # vertices of the contours are flattened into abscissas & ordinates
+    # with offsets of the first vertex of each contour
+    # followed by the total vertices count
+    vertices_sequences = [contour.vertices for contour in contours]
+    offsets = [0, *accumulate(map(len, vertices_sequences))]
+    if all(
+        isinstance(vertices, PointArray) for vertices in vertices_sequences
+    ):
+        coordinates = list(
+            chain.from_iterable(
+                map(attrgetter('coordinates'), vertices_sequences)
+            )
+        )
+        return coordinates[::2], coordinates[1::2], offsets
+    vertices = list(chain.from_iterable(vertices_sequences))
+    return (
+        [vertex.x for vertex in vertices],
+        [vertex.y for vertex in vertices],
+        offsets,
+    )
+
+
+def to_coordinates(value: Any, /) -> memoryview[float] | None:
+    if isinstance(value, PointArray):
+        return value.coordinates
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return None
+    if view.format != COORDINATES_FORMAT:
+        raise TypeError(
+            'Coordinates buffer should have format '
+            f'{COORDINATES_FORMAT!r}, but found {view.format!r}.'
+        )
+    if not view.c_contiguous:
+        raise ValueError('Coordinates buffer should be C-contiguous.')
+    result = view.cast('B').cast(COORDINATES_FORMAT)
+    if len(result) % 2:
+        raise ValueError(
+            'Coordinates buffer should have even size, '
+            f'but found {len(result)}.'
+        )
+    return result
@@ -1,7 +1,135 @@
+from __future__ import annotations
+
 from collections.abc import Iterable
+from typing import Any, Final, Generic
+
+from typing_extensions import Self
+
+import ground
 
+from .arrays import numpy, to_coordinates
 from .hints import Box, Contour, Point, Polygon, ScalarT, Segment
 
+MODULE_NAME: Final[str] = f'{ground.__name__}.boxed'
+# below this number of coordinates
+# overhead of vectorized reduction outweighs its speedup
+MIN_VECTORIZED_COORDINATES_COUNT: Final[int] = 128
+
+
+class BoxAccumulator(Generic[ScalarT]):
+    """
+    **BoxAccumulator** is a running extent of geometries
+    which are added one at a time.
+
+    >>> import math
+    >>> from fractions import Fraction
+    >>> from ground.boxed import BoxAccumulator
+    >>> from ground.context import Context
+    >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+    >>> Box, Point, Segment = (
+    ...     context.box_cls,
+    ...     context.point_cls,
+    ...     context.segment_cls,
+    ... )
+    >>> accumulator = context.box_accumulator()
+    >>> isinstance(accumulator, BoxAccumulator)
+    True
+    >>> accumulator.is_empty
+    True
+    >>> accumulator.add_point(Point(1, 0))
+    >>> accumulator.add_segment(Segment(Point(0, 1), Point(2, 1)))
+    >>> accumulator.to_box() == Box(0, 2, 0, 1)
+    True
+    >>> other = context.box_accumulator()
+    >>> other.add_box(Box(-1, 0, 0, 3))
+    >>> accumulator.merge(other)
+    >>> accumulator.to_box() == Box(-1, 2, 0, 3)
+    True
+    """
+
+    @property
+    def box_cls(self, /) -> type[Box[ScalarT]]:
+        """Returns type of boxes."""
+        return self._box_cls
+
+    @property
+    def is_empty(self, /) -> bool:
+        """Checks if nothing has been added yet."""
+        return self._is_empty
+
+    def add_box(self, box: Box[ScalarT], /) -> None:
+        """Extends the extent with the box."""
+        self._add(box.min_x, box.max_x, box.min_y, box.max_y)
+
+    def add_point(self, point: Point[ScalarT], /) -> None:
+        """Extends the extent with the point."""
+        x, y = point.x, point.y
+        self._add(x, x, y, y)
+
+    def add_segment(self, segment: Segment[ScalarT], /) -> None:
+        """Extends the extent with the segment."""
+        self._add(*_from_segment(segment))
+
+    def merge(self, other: BoxAccumulator[ScalarT], /) -> None:
+        """Extends the extent with the one of the other accumulator."""
+        if not other._is_empty:
+            self._add(other._min_x, other._max_x, other._min_y, other._max_y)
+
+    def to_box(self, /) -> Box[ScalarT]:
+        """
+        Constructs box of the extent.
+
+        Raises ``ValueError`` if nothing has been added yet.
+        """
+        if self._is_empty:
+            raise ValueError('Box of an empty accumulator is undefined.')
+        return self._box_cls(
+            self._min_x, self._max_x, self._min_y, self._max_y
+        )
+
+    _box_cls: type[Box[ScalarT]]
+    _is_empty: bool
+    _max_x: ScalarT
+    _max_y: ScalarT
+    _min_x: ScalarT
+    _min_y: ScalarT
+
+    def _add(
+        self, min_x: ScalarT, max_x: ScalarT, min_y: ScalarT, max_y: ScalarT, /
+    ) -> None:
+        if self._is_empty:
+            self._min_x, self._max_x, self._min_y, self._max_y = (
+                min_x,
+                max_x,
+                min_y,
+                max_y,
+            )
+            self._is_empty = False
+            return
+        if min_x < self._min_x:
+            self._min_x = min_x
+        if self._max_x < max_x:
+            self._max_x = max_x
+        if min_y < self._min_y:
+            self._min_y = min_y
+        if self._max_y < max_y:
+            self._max_y = max_y
+
+    __module__: str = MODULE_NAME
+    __slots__ = (
+        '_box_cls',
+        '_is_empty',
+        '_max_x',
+        '_max_y',
+        '_min_x',
+        '_min_y',
+    )
+
+    def __new__(cls, /, *, box_cls: type[Box[ScalarT]]) -> Self:
+        self = super().__new__(cls)
+        self._box_cls, self._is_empty = box_cls, True
+        return self
+
 
 def from_contour(
     contour: Contour[ScalarT], box_cls: type[Box[ScalarT]], /
@@ -75,9 +203,33 @@ def from_segments(
     return box_cls(min_x, max_x, min_y, max_y)
 
 
+def _from_coordinates(
+    coordinates: memoryview[float], /
+) -> tuple[Any, Any, Any, Any]:
+    if not coordinates:
+        raise ValueError('Coordinates buffer should not be empty.')
+    if (
+        numpy is not None
+        and len(coordinates) >= MIN_VECTORIZED_COORDINATES_COUNT
+    ):
+        coordinates_array = numpy.frombuffer(coordinates, dtype=numpy.float64)
+        xs, ys = coordinates_array[::2], coordinates_array[1::2]
+        return (
+            float(xs.min()),
+            float(xs.max()),
+            float(ys.min()),
+            float(ys.max()),
+        )
+    xs, ys = coordinates[::2], coordinates[1::2]
+    return min(xs), max(xs), min(ys), max(ys)
+
+
 def _from_points(
     points: Iterable[Point[ScalarT]], /
 ) -> tuple[ScalarT, ScalarT, ScalarT, ScalarT]:
+    coordinates = to_coordinates(points)
+    if coordinates is not None:
+        return _from_coordinates(coordinates)
     iterator = iter(points)
     point = next(iterator)
     max_x = min_x = point.x
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Final, Generic, TYPE_CHECKING, TypeVar
+
+from typing_extensions import Self
+
+import ground
+
+from .hints import (
+    Box,
+    Contour,
+    Multipoint,
+    Multipolygon,
+    Multisegment,
+    Point,
+    Polygon,
+    ScalarT,
+)
+
+if TYPE_CHECKING:
+    from ground.context import Context
+
+MODULE_NAME: Final[str] = f'{ground.__name__}.caching'
+DEFAULT_MAX_SIZE: Final[int] = 1024
+
+_GeometryT = TypeVar('_GeometryT')
+_ResultT = TypeVar('_ResultT')
+
+
+class CachedContext(Generic[ScalarT]):
+    """
+    **CachedContext** wraps a context
+    memoizing results of linear-time methods
+    (like boxes, centroids, lengths & areas)
+    for the most recently used geometries.
+
+    Entries are keyed by identity of geometries
+    (not equality, which is linear-time itself),
+    so geometries are assumed to not be mutated while cached:
+    e.g. after mutating a list of contour's vertices
+    cached results for the contour become stale
+    until it gets evicted or ``clear`` is called.
+    The rest of methods & properties are delegated to the wrapped context.
+
+    >>> import math
+    >>> from fractions import Fraction
+    >>> from ground.caching import CachedContext
+    >>> from ground.context import Context
+    >>> context = CachedContext(
+    ...     Context(coordinate_factory=Fraction, sqrt=math.sqrt), max_size=2
+    ... )
+    >>> Contour, Point = context.contour_cls, context.point_cls
+    >>> contour = Contour([Point(0, 0), Point(2, 0), Point(2, 2)])
+    >>> context.region_signed_area(contour)
+    Fraction(2, 1)
+    >>> context.region_signed_area(contour)
+    Fraction(2, 1)
+    >>> context.hits, context.misses
+    (1, 1)
+    >>> context.size
+    1
+    >>> context.clear()
+    >>> context.hits, context.misses, context.size
+    (0, 0, 0)
+    """
+
+    @property
+    def context(self, /) -> Context[ScalarT]:
+        """Returns wrapped context."""
+        return self._context
+
+    @property
+    def hits(self, /) -> int:
+        """Returns number of lookups which found cached results."""
+        return self._hits
+
+    @property
+    def max_size(self, /) -> int:
+        """Returns maximum number of cached results."""
+        return self._max_size
+
+    @property
+    def misses(self, /) -> int:
+        """Returns number of lookups which computed results."""
+        return self._misses
+
+    @property
+    def size(self, /) -> int:
+        """Returns number of cached results."""
+        return len(self._cache)
+
+    def clear(self, /) -> None:
+        """Removes cached results and resets counters."""
+        self._cache.clear()
+        self._hits = self._misses = 0
+
+    def contour_box(self, contour: Contour[ScalarT], /) -> Box[ScalarT]:
+        """Cached version of ``Context.contour_box``."""
+        return self._lookup(self._context.contour_box, contour)
+
+    def contour_centroid(self, contour: Contour[ScalarT], /) -> Point[ScalarT]:
+        """Cached version of ``Context.contour_centroid``."""
+        return self._lookup(self._context.contour_centroid, contour)
+
+    def contour_length(self, contour: Contour[ScalarT], /) -> ScalarT:
+        """Cached version of ``Context.contour_length``."""
+        return self._lookup(self._context.contour_length, contour)
+
+    def is_region_convex(self, contour: Contour[ScalarT], /) -> bool:
+        """Cached version of ``Context.is_region_convex``."""
+        return self._lookup(self._context.is_region_convex, contour)
+
+    def multipoint_centroid(
+        self, multipoint: Multipoint[ScalarT], /
+    ) -> Point[ScalarT]:
+        """Cached version of ``Context.multipoint_centroid``."""
+        return self._lookup(self._context.multipoint_centroid, multipoint)
+
+    def multipolygon_centroid(
+        self, multipolygon: Multipolygon[ScalarT], /
+    ) -> Point[ScalarT]:
+        """Cached version of ``Context.multipolygon_centroid``."""
+        return self._lookup(self._context.multipolygon_centroid, multipolygon)
+
+    def multisegment_centroid(
+        self, multisegment: Multisegment[ScalarT], /
+    ) -> Point[ScalarT]:
+        """Cached version of ``Context.multisegment_centroid``."""
+        return self._lookup(self._context.multisegment_centroid, multisegment)
+
+    def multisegment_length(
+        self, multisegment: Multisegment[ScalarT], /
+    ) -> ScalarT:
+        """Cached version of ``Context.multisegment_length``."""
+        return self._lookup(self._context.multisegment_length, multisegment)
+
+    def polygon_box(self, polygon: Polygon[ScalarT], /) -> Box[ScalarT]:
+        """Cached version of ``Context.polygon_box``."""
+        return self._lookup(self._context.polygon_box, polygon)
+
+    def polygon_centroid(self, polygon: Polygon[ScalarT], /) -> Point[ScalarT]:
+        """Cached version of ``Context.polygon_centroid``."""
+        return self._lookup(self._context.polygon_centroid, polygon)
+
+    def region_centroid(self, contour: Contour[ScalarT], /) -> Point[ScalarT]:
+        """Cached version of ``Context.region_centroid``."""
+        return self._lookup(self._context.region_centroid, contour)
+
+    def region_signed_area(self, contour: Contour[ScalarT], /) -> ScalarT:
+        """Cached version of ``Context.region_signed_area``."""
+        return self._lookup(self._context.region_signed_area, contour)
+
+    # cached values are stored along with their geometries,
+    # so identifiers of cached geometries can not be reused
+    _cache: OrderedDict[tuple[str, int], tuple[Any, Any]]
+    _context: Context[ScalarT]
+    _hits: int
+    _max_size: int
+    _misses: int
+
+    def _lookup(
+        self, method: Callable[[_GeometryT], _ResultT], geometry: _GeometryT, /
+    ) -> _ResultT:
+        key = method.__name__, id(geometry)
+        cache = self._cache
+        result: _ResultT
+        try:
+            _, result = cache[key]
+        except KeyError:
+            self._misses += 1
+            result = method(geometry)
+            cache[key] = geometry, result
+            if len(cache) > self._max_size:
+                cache.popitem(last=False)
+        else:
+            self._hits += 1
+            cache.move_to_end(key)
+        return result
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_cache', '_context', '_hits', '_max_size', '_misses'
+
+    def __new__(
+        cls, context: Context[ScalarT], /, *, max_size: int = DEFAULT_MAX_SIZE
+    ) -> Self:
+        if max_size < 1:
+            raise ValueError(
+                f'Maximum size should be positive, but found {max_size}.'
+            )
+        self = super().__new__(cls)
+        self._cache, self._context, self._max_size = (
+            OrderedDict(),
+            context,
+            max_size,
+        )
+        self._hits = self._misses = 0
+        return self
+
+    def __getattr__(self, name: str, /) -> Any:
+        if name.startswith('_'):
+            # private attributes are not delegated,
+            # so lookups on instances without wrapped context
+            # (e.g. during copying or unpickling) do not recurse
+            raise AttributeError(
+                f'{type(self).__qualname__!r} object has no attribute {name!r}'
+            )
+        return getattr(self._context, name)
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, Generic, TypeAlias
 
 from reprit import serializers
@@ -59,6 +59,10 @@ PolygonCentroid: TypeAlias = Callable[
     [Polygon[ScalarT], ScalarFactory[ScalarT], type[Point[ScalarT]]],
     Point[ScalarT],
 ]
+PolygonsCentroids: TypeAlias = Callable[
+    [Sequence[Polygon[ScalarT]], ScalarFactory[ScalarT], type[Point[ScalarT]]],
+    Sequence[Point[ScalarT]],
+]
 RegionCentroid: TypeAlias = Callable[
     [Contour[ScalarT], ScalarFactory[ScalarT], type[Point[ScalarT]]],
     Point[ScalarT],
@@ -90,6 +94,10 @@ class Context(HasRepr, Generic[ScalarT]):
     def polygon_centroid(self, /) -> PolygonCentroid[ScalarT]:
         return self._polygon_centroid
 
+    @property
+    def polygons_centroids(self, /) -> PolygonsCentroids[ScalarT]:
+        return self._polygons_centroids
+
     @property
     def region_centroid(self, /) -> RegionCentroid[ScalarT]:
         return self._region_centroid
@@ -103,6 +111,7 @@ class Context(HasRepr, Generic[ScalarT]):
     _multipolygon_centroid: MultipolygonCentroid[ScalarT]
     _multisegment_centroid: MultisegmentCentroid[ScalarT]
     _polygon_centroid: PolygonCentroid[ScalarT]
+    _polygons_centroids: PolygonsCentroids[ScalarT]
     _region_centroid: RegionCentroid[ScalarT]
     _segment_centroid: SegmentCentroid[ScalarT]
 
@@ -112,6 +121,7 @@ class Context(HasRepr, Generic[ScalarT]):
         '_multipolygon_centroid',
         '_multisegment_centroid',
         '_polygon_centroid',
+        '_polygons_centroids',
         '_region_centroid',
         '_segment_centroid',
     )
@@ -125,6 +135,7 @@ class Context(HasRepr, Generic[ScalarT]):
         multipolygon_centroid: MultipolygonCentroid[ScalarT],
         multisegment_centroid: MultisegmentCentroid[ScalarT],
         polygon_centroid: PolygonCentroid[ScalarT],
+        polygons_centroids: PolygonsCentroids[ScalarT],
         region_centroid: RegionCentroid[ScalarT],
         segment_centroid: SegmentCentroid[ScalarT],
     ) -> Self:
@@ -134,10 +145,27 @@ class Context(HasRepr, Generic[ScalarT]):
         self._multipolygon_centroid = multipolygon_centroid
         self._multisegment_centroid = multisegment_centroid
         self._polygon_centroid = polygon_centroid
+        self._polygons_centroids = polygons_centroids
         self._region_centroid = region_centroid
         self._segment_centroid = segment_centroid
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            (
+                self._contour_centroid is other._contour_centroid
+                and self._multipoint_centroid is other._multipoint_centroid
+                and self._multipolygon_centroid is other._multipolygon_centroid
+                and self._multisegment_centroid is other._multisegment_centroid
+                and self._polygon_centroid is other._polygon_centroid
+                and self._polygons_centroids is other._polygons_centroids
+                and self._region_centroid is other._region_centroid
+                and self._segment_centroid is other._segment_centroid
+            )
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
@@ -151,6 +179,7 @@ plain_context: Context[Any] = Context(
     multipolygon_centroid=plain_multipolygon.centroid,
     multisegment_centroid=plain_multisegment.centroid,
     polygon_centroid=plain_polygon.centroid,
+    polygons_centroids=plain_polygon.centroids,
     region_centroid=plain_region.centroid,
     segment_centroid=plain_segment.centroid,
 )
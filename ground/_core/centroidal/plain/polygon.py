@@ -35,3 +35,20 @@ def centroid_components(
         y_numerator += hole_y_numerator
         double_area += hole_double_area
     return x_numerator, y_numerator, double_area
+
+
+def centroids(
+    polygons: Sequence[Polygon[ScalarT]],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> list[Point[ScalarT]]:
+    three = coordinate_factory(3)
+    result = []
+    for polygon in polygons:
+        x_numerator, y_numerator, double_area = centroid_components(
+            polygon.border, polygon.holes, coordinate_factory
+        )
+        divisor = three * double_area
+        result.append(point_cls(x_numerator / divisor, y_numerator / divisor))
+    return result
@@ -1,5 +1,6 @@
 from collections.abc import Sequence
 
+from ground._core.arrays import PointArray, to_vertices_coordinates
 from ground._core.hints import Contour, Point, ScalarFactory, ScalarT
 
 
@@ -21,6 +22,16 @@ def centroid_components(
     coordinate_factory: ScalarFactory[ScalarT],
 ) -> tuple[ScalarT, ScalarT, ScalarT]:
     double_area = x_numerator = y_numerator = coordinate_factory(0)
+    if isinstance(vertices, PointArray):
+        xs, ys = to_vertices_coordinates(vertices)
+        prev_x, prev_y = xs[-1], ys[-1]
+        for x, y in zip(xs, ys, strict=True):
+            area_component = prev_x * y - prev_y * x
+            double_area += area_component
+            x_numerator += (prev_x + x) * area_component
+            y_numerator += (prev_y + y) * area_component
+            prev_x, prev_y = x, y
+        return x_numerator, y_numerator, double_area
     prev_vertex = vertices[-1]
     prev_x, prev_y = prev_vertex.x, prev_vertex.y
     for vertex in vertices:
@@ -0,0 +1,21 @@
+from ground._core.hints import (
+    Contour,
+    Point,
+    ScalarFactory,
+    ScalarT,
+    SquareRooter,
+)
+from ground._core.vectorization import to_contours_edges_arrays
+
+from .segments import centroid as segments_centroid
+
+
+def centroid(
+    contour: Contour[ScalarT],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    sqrt: SquareRooter[ScalarT],
+    /,
+) -> Point[ScalarT]:
+    starts, ends = to_contours_edges_arrays([contour], coordinate_factory)
+    return segments_centroid(starts, ends, coordinate_factory, point_cls, sqrt)
@@ -0,0 +1,16 @@
+from ground._core.hints import Multipoint, Point, ScalarFactory, ScalarT
+from ground._core.vectorization import to_points_array, to_scalar
+
+
+def centroid(
+    multipoint: Multipoint[ScalarT],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> Point[ScalarT]:
+    points = to_points_array(multipoint.points, coordinate_factory)
+    divisor = coordinate_factory(len(points))
+    return point_cls(
+        to_scalar(points[:, 0].sum()) / divisor,
+        to_scalar(points[:, 1].sum()) / divisor,
+    )
@@ -0,0 +1,21 @@
+from ground._core.hints import Multipolygon, Point, ScalarFactory, ScalarT
+
+from .region import centroid_components
+
+
+def centroid(
+    multipolygon: Multipolygon[ScalarT],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> Point[ScalarT]:
+    x_numerator, y_numerator, double_area = centroid_components(
+        [
+            contour
+            for polygon in multipolygon.polygons
+            for contour in (polygon.border, *polygon.holes)
+        ],
+        coordinate_factory,
+    )
+    divisor = coordinate_factory(3) * double_area
+    return point_cls(x_numerator / divisor, y_numerator / divisor)
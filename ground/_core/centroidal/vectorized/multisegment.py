@@ -0,0 +1,31 @@
+from ground._core.hints import (
+    Multisegment,
+    Point,
+    ScalarFactory,
+    ScalarT,
+    SquareRooter,
+)
+from ground._core.vectorization import to_points_array
+
+from .segments import centroid as segments_centroid
+
+
+def centroid(
+    multisegment: Multisegment[ScalarT],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    sqrt: SquareRooter[ScalarT],
+    /,
+) -> Point[ScalarT]:
+    segments = multisegment.segments
+    return segments_centroid(
+        to_points_array(
+            [segment.start for segment in segments], coordinate_factory
+        ),
+        to_points_array(
+            [segment.end for segment in segments], coordinate_factory
+        ),
+        coordinate_factory,
+        point_cls,
+        sqrt,
+    )
@@ -0,0 +1,59 @@
+from collections.abc import Sequence
+
+import numpy
+
+from ground._core.hints import Point, Polygon, ScalarFactory, ScalarT
+from ground._core.vectorization import (
+    to_flat_contours_edges_arrays,
+    to_offsets,
+)
+
+from .region import centroid_components
+
+
+def centroid(
+    polygon: Polygon[ScalarT],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> Point[ScalarT]:
+    x_numerator, y_numerator, double_area = centroid_components(
+        [polygon.border, *polygon.holes], coordinate_factory
+    )
+    divisor = coordinate_factory(3) * double_area
+    return point_cls(x_numerator / divisor, y_numerator / divisor)
+
+
+def centroids(
+    polygons: Sequence[Polygon[ScalarT]],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> list[Point[ScalarT]]:
+    if not polygons:
+        return []
+    # components of all the polygons are evaluated at once
+    # by summing up components of their concatenated edges
+    # over segments of each polygon
+    starts, ends, contours_offsets = to_flat_contours_edges_arrays(
+        [
+            contour
+            for polygon in polygons
+            for contour in (polygon.border, *polygon.holes)
+        ],
+        coordinate_factory,
+    )
+    offsets = contours_offsets[
+        to_offsets([len(polygon.holes) + 1 for polygon in polygons])
+    ]
+    start_xs, start_ys = starts[:, 0], starts[:, 1]
+    end_xs, end_ys = ends[:, 0], ends[:, 1]
+    area_components = start_xs * end_ys - start_ys * end_xs
+    divisors = coordinate_factory(3) * numpy.add.reduceat(
+        area_components, offsets
+    )
+    xs = numpy.add.reduceat((start_xs + end_xs) * area_components, offsets)
+    ys = numpy.add.reduceat((start_ys + end_ys) * area_components, offsets)
+    return list(
+        map(point_cls, (xs / divisors).tolist(), (ys / divisors).tolist())
+    )
@@ -0,0 +1,35 @@
+from collections.abc import Sequence
+
+from ground._core.hints import Contour, Point, ScalarFactory, ScalarT
+from ground._core.vectorization import to_contours_edges_arrays, to_scalar
+
+
+def centroid(
+    contour: Contour[ScalarT],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> Point[ScalarT]:
+    x_numerator, y_numerator, double_area = centroid_components(
+        [contour], coordinate_factory
+    )
+    divisor = coordinate_factory(3) * double_area
+    return point_cls(x_numerator / divisor, y_numerator / divisor)
+
+
+def centroid_components(
+    contours: Sequence[Contour[ScalarT]],
+    coordinate_factory: ScalarFactory[ScalarT],
+    /,
+) -> tuple[ScalarT, ScalarT, ScalarT]:
+    # components of all the contours are accumulated at once
+    # over their concatenated edges
+    starts, ends = to_contours_edges_arrays(contours, coordinate_factory)
+    start_xs, start_ys = starts[:, 0], starts[:, 1]
+    end_xs, end_ys = ends[:, 0], ends[:, 1]
+    area_components = start_xs * end_ys - start_ys * end_xs
+    return (
+        to_scalar(((start_xs + end_xs) * area_components).sum()),
+        to_scalar(((start_ys + end_ys) * area_components).sum()),
+        to_scalar(area_components.sum()),
+    )
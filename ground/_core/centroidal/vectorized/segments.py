@@ -0,0 +1,23 @@
+from typing import Any
+
+from numpy.typing import NDArray
+
+from ground._core.hints import Point, ScalarFactory, ScalarT, SquareRooter
+from ground._core.vectorization import to_scalar, to_square_roots
+
+
+def centroid(
+    starts: NDArray[Any],
+    ends: NDArray[Any],
+    coordinate_factory: ScalarFactory[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    sqrt: SquareRooter[ScalarT],
+    /,
+) -> Point[ScalarT]:
+    lengths = to_square_roots(((ends - starts) ** 2).sum(axis=1), sqrt)
+    midpoints_sums = starts + ends
+    divisor = coordinate_factory(2) * to_scalar(lengths.sum())
+    return point_cls(
+        to_scalar((midpoints_sums[:, 0] * lengths).sum()) / divisor,
+        to_scalar((midpoints_sums[:, 1] * lengths).sum()) / divisor,
+    )
@@ -1,13 +1,14 @@
 from collections.abc import Callable
 from typing import Any, Generic, TypeAlias
 
-from reprit import serializers
+from reprit import seekers, serializers
 from reprit.base import generate_repr
 from typing_extensions import Self
 
 from ground._core.enums import Location
 from ground._core.hints import HasRepr, Point, ScalarT
 
+from .filtered import point_point_point as filtered_point_point_point
 from .plain import point_point_point as plain_point_point_point
 
 PointPointPointLocator: TypeAlias = Callable[
@@ -32,13 +33,24 @@ class Context(HasRepr, Generic[ScalarT]):
         self._point_point_point_test = point_point_point_test
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            self._point_point_point_test is other._point_point_point_test
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
+        field_seeker=seekers.complex_,
         with_module_name=True,
     )
 
 
+filtered_context: Context[Any] = Context(
+    point_point_point_test=filtered_point_point_point.test
+)
 plain_context: Context[Any] = Context(
     point_point_point_test=plain_point_point_point.test
 )
@@ -0,0 +1,124 @@
+from typing import Final
+
+from ground._core.enums import Location
+from ground._core.filtering import UNIT_ROUNDOFF, to_float, to_fraction
+from ground._core.hints import Point, ScalarT
+from ground._core.primitive import to_sign
+
+# rounding errors of the lifted determinant
+# evaluated in floating point arithmetic
+# (including conversions of coordinates) do not exceed
+# the permanent of its coordinates magnitudes scaled by the factor,
+# magnitudes are shifted by the offset
+# to cover conversions of tiny coordinates & underflows as well
+MAGNITUDE_OFFSET: Final[float] = 2.0**-250
+ERROR_BOUND_FACTOR: Final[float] = 16 * UNIT_ROUNDOFF
+
+
+def test(
+    point: Point[ScalarT],
+    first: Point[ScalarT],
+    second: Point[ScalarT],
+    third: Point[ScalarT],
+    _zero: ScalarT,
+    /,
+) -> Location:
+    try:
+        point_x, point_y = to_float(point.x), to_float(point.y)
+        first_x, first_y = to_float(first.x), to_float(first.y)
+        second_x, second_y = to_float(second.x), to_float(second.y)
+        third_x, third_y = to_float(third.x), to_float(third.y)
+    except OverflowError:
+        return exact_test(point, first, second, third)
+    first_dx, first_dy = first_x - point_x, first_y - point_y
+    second_dx, second_dy = second_x - point_x, second_y - point_y
+    third_dx, third_dy = third_x - point_x, third_y - point_y
+    determinant = (
+        (first_dx * first_dx + first_dy * first_dy)
+        * (second_dx * third_dy - second_dy * third_dx)
+        - (second_dx * second_dx + second_dy * second_dy)
+        * (first_dx * third_dy - first_dy * third_dx)
+        + (third_dx * third_dx + third_dy * third_dy)
+        * (first_dx * second_dy - first_dy * second_dx)
+    )
+    point_x_magnitude, point_y_magnitude = (
+        abs(point_x) + MAGNITUDE_OFFSET,
+        abs(point_y) + MAGNITUDE_OFFSET,
+    )
+    first_dx_magnitude, first_dy_magnitude = (
+        abs(first_x) + point_x_magnitude,
+        abs(first_y) + point_y_magnitude,
+    )
+    second_dx_magnitude, second_dy_magnitude = (
+        abs(second_x) + point_x_magnitude,
+        abs(second_y) + point_y_magnitude,
+    )
+    third_dx_magnitude, third_dy_magnitude = (
+        abs(third_x) + point_x_magnitude,
+        abs(third_y) + point_y_magnitude,
+    )
+    error_bound = ERROR_BOUND_FACTOR * (
+        (
+            first_dx_magnitude * first_dx_magnitude
+            + first_dy_magnitude * first_dy_magnitude
+        )
+        * (
+            second_dx_magnitude * third_dy_magnitude
+            + second_dy_magnitude * third_dx_magnitude
+        )
+        + (
+            second_dx_magnitude * second_dx_magnitude
+            + second_dy_magnitude * second_dy_magnitude
+        )
+        * (
+            first_dx_magnitude * third_dy_magnitude
+            + first_dy_magnitude * third_dx_magnitude
+        )
+        + (
+            third_dx_magnitude * third_dx_magnitude
+            + third_dy_magnitude * third_dy_magnitude
+        )
+        * (
+            first_dx_magnitude * second_dy_magnitude
+            + first_dy_magnitude * second_dx_magnitude
+        )
+    )
+    if determinant > error_bound:
+        return Location.INTERIOR
+    if -determinant > error_bound:
+        return Location.EXTERIOR
+    return exact_test(point, first, second, third)
+
+
+def exact_test(
+    point: Point[ScalarT],
+    first: Point[ScalarT],
+    second: Point[ScalarT],
+    third: Point[ScalarT],
+    /,
+) -> Location:
+    point_x, point_y = to_fraction(point.x), to_fraction(point.y)
+    first_dx, first_dy = (
+        to_fraction(first.x) - point_x,
+        to_fraction(first.y) - point_y,
+    )
+    second_dx, second_dy = (
+        to_fraction(second.x) - point_x,
+        to_fraction(second.y) - point_y,
+    )
+    third_dx, third_dy = (
+        to_fraction(third.x) - point_x,
+        to_fraction(third.y) - point_y,
+    )
+    return Location(
+        1
+        + to_sign(
+            (first_dx * first_dx + first_dy * first_dy)
+            * (second_dx * third_dy - second_dy * third_dx)
+            - (second_dx * second_dx + second_dy * second_dy)
+            * (first_dx * third_dy - first_dy * third_dx)
+            + (third_dx * third_dx + third_dy * third_dy)
+            * (first_dx * second_dy - first_dy * second_dx),
+            to_fraction(0),
+        )
+    )
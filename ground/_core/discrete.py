@@ -1,9 +1,148 @@
-from collections.abc import Iterable, Sequence
-from itertools import groupby
-from typing import TypeVar
+from __future__ import annotations
+
+import math
+import os
+import sys
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, Future
+from functools import partial
+from heapq import merge
+from itertools import groupby, islice, pairwise
+from typing import Any, Final, TypeAlias, TypeVar
 
 from .enums import Orientation
-from .hints import Point, ScalarT, TernaryPointFunction
+from .hints import (
+    Point,
+    QuaternaryPointFunction,
+    ScalarT,
+    TernaryPointFunction,
+)
+from .indexing import RTree
+from .metric.context import PointPointMetric
+from .primitive import square
+
+ConvexHullConstructor: TypeAlias = Callable[
+    [Sequence[Point[ScalarT]], TernaryPointFunction[ScalarT, Orientation]],
+    list[Point[ScalarT]],
+]
+OrientationEvaluator: TypeAlias = Callable[
+    [
+        Point[ScalarT],
+        Point[ScalarT],
+        Point[ScalarT],
+        QuaternaryPointFunction[ScalarT, ScalarT],
+        ScalarT,
+    ],
+    Orientation,
+]
+
+CONVEX_HULL_CHUNK_SIZE: Final[int] = 1 << 16
+# with a margin over rounding errors of the bound itself
+ORIENTATION_ERROR_FACTOR: Final[float] = 2 * sys.float_info.epsilon
+# wrapping hulls of many small groups costs more orientation tests
+# than sorting-based algorithm does for all the points,
+# so the first guess of hull size is large
+CONVEX_HULL_INITIAL_GROUPS_SIZE: Final[int] = 1 << 12
+
+
+def to_convex_hull_candidates(
+    points: Sequence[Point[ScalarT]],
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    /,
+) -> list[Point[ScalarT]]:
+    if not points:
+        return []
+    # Akl-Toussaint heuristic: points lying strictly inside
+    # of the quadrilateral formed by extreme points
+    # can not be vertices of the convex hull
+    leftmost, lowest, rightmost, highest = (
+        min(points),
+        min(points, key=_to_point_y_x_key),
+        max(points),
+        max(points, key=_to_point_y_x_key),
+    )
+    quadrilateral = _to_unique_just_seen(
+        [leftmost, lowest, rightmost, highest]
+    )
+    if quadrilateral[0] == quadrilateral[-1]:
+        del quadrilateral[-1]
+    if len(quadrilateral) < 3:
+        return list(points)
+    # each edge of the quadrilateral goes monotonically
+    # between consecutive extreme points,
+    # so corners of the box spanned by the edges middle points
+    # lie inside of the quadrilateral along with the box,
+    # middle points are kept doubled to avoid division
+    edges_middle_points = [
+        (start.x + end.x, start.y + end.y)
+        for start, end in pairwise(
+            [leftmost, lowest, rightmost, highest, leftmost]
+        )
+    ]
+    inner_min_x, inner_max_x = _to_inner_bounds(
+        max(edges_middle_points[0][0], edges_middle_points[3][0]),
+        min(edges_middle_points[1][0], edges_middle_points[2][0]),
+    )
+    inner_min_y, inner_max_y = _to_inner_bounds(
+        max(edges_middle_points[0][1], edges_middle_points[1][1]),
+        min(edges_middle_points[2][1], edges_middle_points[3][1]),
+    )
+    # orientations relative to the edges are evaluated
+    # by the same expression as the cross product
+    # with edges components computed once,
+    # but are trusted only beyond the rounding error bound
+    # for points of the quadrilateral's box,
+    # otherwise the orienteer is called
+    min_x, max_x, min_y, max_y = leftmost.x, rightmost.x, lowest.y, highest.y
+    edges = []
+    for start, end in pairwise([*quadrilateral, quadrilateral[0]]):
+        start_x, start_y = start.x, start.y
+        delta_x, delta_y = end.x - start.x, end.y - start.y
+        edges.append(
+            (
+                start,
+                end,
+                start_x,
+                start_y,
+                delta_x,
+                delta_y,
+                _to_orientation_error_bound(
+                    delta_x,
+                    delta_y,
+                    max(start_x - min_x, max_x - start_x),
+                    max(start_y - min_y, max_y - start_y),
+                ),
+            )
+        )
+    result = []
+    for point in points:
+        x, y = point.x, point.y
+        if (
+            inner_min_x < x + x < inner_max_x
+            and inner_min_y < y + y < inner_max_y
+        ):
+            continue
+        for (
+            start,
+            end,
+            start_x,
+            start_y,
+            delta_x,
+            delta_y,
+            error_bound,
+        ) in edges:
+            determinant = delta_x * (y - start_y) - delta_y * (x - start_x)
+            if determinant > error_bound:
+                continue
+            if -error_bound > determinant or (
+                orienteer(start, end, point)
+                is not Orientation.COUNTERCLOCKWISE
+            ):
+                result.append(point)
+                break
+    return result
 
 
 def to_convex_hull(
@@ -19,9 +158,305 @@ def to_convex_hull(
     return lower[:-1] + upper[:-1] or points
 
 
+def to_output_sensitive_convex_hull(
+    points: Sequence[Point[ScalarT]],
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    /,
+) -> list[Point[ScalarT]]:
+    if not points:
+        return []
+    # Chan's algorithm: guess hull size,
+    # split points into groups of the guessed size
+    # and wrap their hulls with the gift-wrapping algorithm,
+    # squaring the guess on failure
+    start = min(points)
+    groups_size = min(CONVEX_HULL_INITIAL_GROUPS_SIZE, len(points))
+    groups_hulls = [
+        to_convex_hull(
+            to_convex_hull_candidates(
+                points[offset : offset + groups_size], orienteer
+            ),
+            orienteer,
+        )
+        for offset in range(0, len(points), groups_size)
+    ]
+    while len(groups_hulls) > 1:
+        result = _wrap_groups_hulls(
+            start, groups_hulls, groups_size, orienteer
+        )
+        if result is not None:
+            return result
+        # vertices of the hull of a union are vertices of hulls of its parts,
+        # so hulls of the next groups are constructed
+        # from vertices of hulls of the current ones,
+        # which are cheap to sort since each hull consists
+        # of an ascending and a descending runs
+        merged_groups_count = groups_size
+        groups_size *= groups_size
+        groups_hulls = [
+            to_convex_hull(
+                [
+                    vertex
+                    for group_hull in groups_hulls[
+                        offset : offset + merged_groups_count
+                    ]
+                    for vertex in group_hull
+                ],
+                orienteer,
+            )
+            for offset in range(0, len(groups_hulls), merged_groups_count)
+        ]
+    return groups_hulls[0]
+
+
+def to_pruned_convex_hull(
+    constructor: ConvexHullConstructor[ScalarT],
+    callback: Callable[[int], Any] | None,
+    points: Sequence[Point[ScalarT]],
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    /,
+) -> list[Point[ScalarT]]:
+    candidates = to_convex_hull_candidates(points, orienteer)
+    if callback is not None:
+        callback(len(points) - len(candidates))
+    return constructor(candidates, orienteer)
+
+
+def to_iterable_convex_hull(
+    points: Iterable[Point[ScalarT]],
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    constructor: ConvexHullConstructor[ScalarT],
+    /,
+) -> list[Point[ScalarT]]:
+    # vertices of the hull of a union are vertices of hulls of its parts,
+    # so it is enough to keep the current hull along with a chunk of points
+    result: list[Point[ScalarT]] = []
+    iterator = iter(points)
+    while chunk := list(islice(iterator, CONVEX_HULL_CHUNK_SIZE)):
+        result = constructor(result + chunk, orienteer)
+    return result
+
+
+def to_parallel_convex_hull(
+    points: Iterable[Point[ScalarT]],
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    constructor: ConvexHullConstructor[ScalarT],
+    executor: Executor,
+    point_cls: type[Point[ScalarT]],
+    orientation_evaluator: OrientationEvaluator[ScalarT],
+    cross_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    zero: ScalarT,
+    /,
+) -> list[Point[ScalarT]]:
+    # chunks are sent to workers as flat coordinates
+    # and hulls are sent back as indices of vertices in their chunks,
+    # so the result consists of the original points
+    # in the same order as the serial algorithm gives
+    # each worker gets a chunk to process along with a spare one,
+    # so workers do not wait for merging of their results
+    max_pending_chunks_count = 2 * _to_workers_count(executor)
+    pending: deque[tuple[list[Point[ScalarT]], Future[array[int]]]] = deque()
+    result: list[Point[ScalarT]] = []
+    iterator = iter(points)
+    while True:
+        chunk = list(islice(iterator, CONVEX_HULL_CHUNK_SIZE))
+        if chunk:
+            pending.append(
+                (
+                    chunk,
+                    executor.submit(
+                        _to_serialized_convex_hull,
+                        _serialize_points(chunk),
+                        point_cls,
+                        constructor,
+                        orientation_evaluator,
+                        cross_producer,
+                        zero,
+                    ),
+                )
+            )
+        if not pending:
+            break
+        if not chunk or len(pending) > max_pending_chunks_count:
+            chunk, future = pending.popleft()
+            result = to_convex_hull(
+                result + [chunk[index] for index in future.result()], orienteer
+            )
+    return result
+
+
+def to_closest_pair(
+    points: Sequence[Point[ScalarT]],
+    squared_metric: PointPointMetric[ScalarT],
+    /,
+) -> tuple[int, int]:
+    if len(points) < 2:
+        raise ValueError(
+            'Closest pair is defined for at least 2 points, '
+            f'but found {len(points)}.'
+        )
+    _, first_index, second_index, _ = _to_closest_pair(
+        sorted(range(len(points)), key=points.__getitem__),
+        points,
+        squared_metric,
+    )
+    return (
+        (first_index, second_index)
+        if first_index < second_index
+        else (second_index, first_index)
+    )
+
+
+def to_nearest_neighbours(
+    points: Sequence[Point[ScalarT]], points_rtree: RTree[ScalarT], /
+) -> list[int]:
+    if len(points) < 2:
+        raise ValueError(
+            'Nearest neighbours are defined for at least 2 points, '
+            f'but found {len(points)}.'
+        )
+    # boxes of points are degenerate,
+    # so distances to them are exactly the distances to points
+    # and the first yielded box which is not of the point itself
+    # is of its nearest neighbour
+    return [
+        next(
+            candidate_index
+            for candidate_index in points_rtree.iter_nearest_to_point(point)
+            if candidate_index != index
+        )
+        for index, point in enumerate(points)
+    ]
+
+
 _T = TypeVar('_T')
 
 
+def _to_closest_pair(
+    sorted_indices: Sequence[int],
+    points: Sequence[Point[ScalarT]],
+    squared_metric: PointPointMetric[ScalarT],
+    /,
+) -> tuple[ScalarT, int, int, list[int]]:
+    """
+    Returns squared distance between the closest pair of points
+    (given their indices sorted by coordinates),
+    indices of the pair & indices sorted by ordinates.
+    """
+    size = len(sorted_indices)
+    if size <= 3:
+        first_index, second_index = sorted_indices[0], sorted_indices[1]
+        min_squared_distance = squared_metric(
+            points[first_index], points[second_index]
+        )
+        for offset, index in enumerate(sorted_indices[:-1]):
+            for other_index in sorted_indices[offset + 1 :]:
+                squared_distance = squared_metric(
+                    points[index], points[other_index]
+                )
+                if squared_distance < min_squared_distance:
+                    first_index, second_index, min_squared_distance = (
+                        index,
+                        other_index,
+                        squared_distance,
+                    )
+        return (
+            min_squared_distance,
+            first_index,
+            second_index,
+            sorted(sorted_indices, key=lambda index: points[index].y),
+        )
+    middle = size // 2
+    middle_x = points[sorted_indices[middle]].x
+    (min_squared_distance, first_index, second_index, left_indices_by_y) = (
+        _to_closest_pair(sorted_indices[:middle], points, squared_metric)
+    )
+    (
+        right_squared_distance,
+        right_first_index,
+        right_second_index,
+        right_indices_by_y,
+    ) = _to_closest_pair(sorted_indices[middle:], points, squared_metric)
+    if right_squared_distance < min_squared_distance:
+        min_squared_distance, first_index, second_index = (
+            right_squared_distance,
+            right_first_index,
+            right_second_index,
+        )
+    indices_by_y = list(
+        merge(
+            left_indices_by_y,
+            right_indices_by_y,
+            key=lambda index: points[index].y,
+        )
+    )
+    # only points closer to the dividing line than the closest pair so far
+    # can form a closer pair with points from the other half
+    strip = [
+        index
+        for index in indices_by_y
+        if square(points[index].x - middle_x) < min_squared_distance
+    ]
+    for offset, index in enumerate(strip):
+        point = points[index]
+        for other_offset in range(offset + 1, len(strip)):
+            other_index = strip[other_offset]
+            other_point = points[other_index]
+            if not square(other_point.y - point.y) < min_squared_distance:
+                break
+            squared_distance = squared_metric(point, other_point)
+            if squared_distance < min_squared_distance:
+                first_index, second_index, min_squared_distance = (
+                    index,
+                    other_index,
+                    squared_distance,
+                )
+    return min_squared_distance, first_index, second_index, indices_by_y
+
+
+def _to_inner_bounds(min_value: Any, max_value: Any, /) -> tuple[Any, Any]:
+    # floating point sums of coordinates err by at most half an ulp,
+    # so shrinking bounds by an ulp keeps the box
+    # inside of the exact one,
+    # exact sums do not err at all
+    if not isinstance(min_value, float):
+        return min_value, max_value
+    return (
+        math.nextafter(min_value, math.inf),
+        math.nextafter(max_value, -math.inf),
+    )
+
+
+def _to_orientation_error_bound(
+    delta_x: Any, delta_y: Any, max_delta_x: Any, max_delta_y: Any, /
+) -> Any:
+    # floating point evaluation of
+    # ``delta_x * (y - start_y) - delta_y * (x - start_x)``
+    # errs by less than ``3 * epsilon / 2`` times the sum
+    # of its terms magnitudes,
+    # exact evaluations do not err at all
+    if not isinstance(delta_x, float):
+        return delta_x - delta_x
+    return (
+        abs(delta_x) * max_delta_y + abs(delta_y) * max_delta_x
+    ) * ORIENTATION_ERROR_FACTOR
+
+
+def _to_workers_count(executor: Executor, /) -> int:
+    # standard pools store their size privately,
+    # other executors are assumed to use all processors
+    max_workers = getattr(executor, '_max_workers', None)
+    return (
+        max_workers
+        if isinstance(max_workers, int) and max_workers > 0
+        else os.cpu_count() or 1
+    )
+
+
+def _to_point_y_x_key(point: Point[ScalarT], /) -> Any:
+    return point.y, point.x
+
+
 def _to_unique_just_seen(iterable: Iterable[_T], /) -> list[_T]:
     return [key for key, _ in groupby(iterable)]
 
@@ -43,3 +478,187 @@ def _to_sub_hull(
                 break
         result.append(point)
     return result
+
+
+def _is_better_hull_candidate(
+    vertex: Point[ScalarT],
+    candidate: Point[ScalarT],
+    other: Point[ScalarT],
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    /,
+) -> bool:
+    # checks if all points on the left of ``vertex-candidate`` ray
+    # are on the left of ``vertex-other`` ray as well,
+    # collinear points are skipped in favor of the farthest one
+    if candidate == vertex:
+        return other != vertex
+    orientation = orienteer(vertex, candidate, other)
+    return orientation is Orientation.CLOCKWISE or (
+        orientation is Orientation.COLLINEAR
+        and (other > candidate if candidate > vertex else other < candidate)
+    )
+
+
+def _to_hull_tangent_index(
+    hull: Sequence[Point[ScalarT]],
+    point: Point[ScalarT],
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    /,
+) -> int:
+    # finds such hull vertex that all hull vertices are on the left
+    # of the ray from the given point to it
+    size = len(hull)
+    if size > 3:
+        low, high = 0, size
+        low_before_orientation = orienteer(point, hull[0], hull[-1])
+        low_after_orientation = orienteer(point, hull[0], hull[1])
+        while low < high:
+            middle = (low + high) // 2
+            middle_before_orientation = orienteer(
+                point, hull[middle], hull[middle - 1]
+            )
+            middle_after_orientation = orienteer(
+                point, hull[middle], hull[(middle + 1) % size]
+            )
+            if (
+                middle_before_orientation is not Orientation.CLOCKWISE
+                and middle_after_orientation is not Orientation.CLOCKWISE
+            ):
+                low = middle
+                break
+            middle_side = orienteer(point, hull[low], hull[middle])
+            if (
+                middle_side is Orientation.COUNTERCLOCKWISE
+                and (
+                    low_after_orientation is Orientation.CLOCKWISE
+                    or low_before_orientation is low_after_orientation
+                )
+            ) or (
+                middle_side is Orientation.CLOCKWISE
+                and middle_before_orientation is Orientation.CLOCKWISE
+            ):
+                high = middle
+            else:
+                low = middle + 1
+                if low == size:
+                    break
+                low_before_orientation = orienteer(
+                    point, hull[low], hull[low - 1]
+                )
+                low_after_orientation = orienteer(
+                    point, hull[low], hull[(low + 1) % size]
+                )
+        if low < size:
+            candidate = hull[low]
+            before, after = hull[low - 1], hull[(low + 1) % size]
+            if (
+                candidate != point
+                and not _is_better_hull_candidate(
+                    point, candidate, before, orienteer
+                )
+                and not _is_better_hull_candidate(
+                    point, candidate, after, orienteer
+                )
+            ):
+                return low
+    # binary search is not applicable to degenerate cases
+    # like the point being a hull vertex, so falling back to linear scan
+    result = 0
+    for index in range(1, size):
+        if _is_better_hull_candidate(
+            point, hull[result], hull[index], orienteer
+        ):
+            result = index
+    return result
+
+
+def _wrap_groups_hulls(
+    start: Point[ScalarT],
+    groups_hulls: Sequence[Sequence[Point[ScalarT]]],
+    max_vertices_count: int,
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    /,
+) -> list[Point[ScalarT]] | None:
+    result = [start]
+    vertex = start
+    vertex_group_index = vertex_index = -1
+    while len(result) <= max_vertices_count:
+        candidate = vertex
+        candidate_group_index = candidate_index = -1
+        for group_index, group_hull in enumerate(groups_hulls):
+            group_candidate_index = (
+                (vertex_index + 1) % len(group_hull)
+                if group_index == vertex_group_index
+                else _to_hull_tangent_index(group_hull, vertex, orienteer)
+            )
+            if _is_better_hull_candidate(
+                vertex, candidate, group_hull[group_candidate_index], orienteer
+            ):
+                candidate, candidate_group_index, candidate_index = (
+                    group_hull[group_candidate_index],
+                    group_index,
+                    group_candidate_index,
+                )
+        if candidate == start:
+            return result
+        result.append(candidate)
+        vertex, vertex_group_index, vertex_index = (
+            candidate,
+            candidate_group_index,
+            candidate_index,
+        )
+    return None
+
+
+def _orient(
+    orientation_evaluator: OrientationEvaluator[ScalarT],
+    cross_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    zero: ScalarT,
+    vertex: Point[ScalarT],
+    first_ray_point: Point[ScalarT],
+    second_ray_point: Point[ScalarT],
+    /,
+) -> Orientation:
+    return orientation_evaluator(
+        vertex, first_ray_point, second_ray_point, cross_producer, zero
+    )
+
+
+def _serialize_points(points: Sequence[Point[ScalarT]], /) -> Sequence[Any]:
+    coordinates: list[Any] = [
+        coordinate for point in points for coordinate in (point.x, point.y)
+    ]
+    coordinates_types = set(map(type, coordinates))
+    if coordinates_types == {float}:
+        return array('d', coordinates)
+    if coordinates_types == {int}:
+        try:
+            return array('q', coordinates)
+        except OverflowError:
+            pass
+    return coordinates
+
+
+def _to_serialized_convex_hull(
+    coordinates: Sequence[Any],
+    point_cls: type[Point[ScalarT]],
+    constructor: ConvexHullConstructor[ScalarT],
+    orientation_evaluator: OrientationEvaluator[ScalarT],
+    cross_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    zero: ScalarT,
+    /,
+) -> array[int]:
+    points = list(map(point_cls, coordinates[::2], coordinates[1::2]))
+    indices: dict[Point[ScalarT], int] = {}
+    for index, point in enumerate(points):
+        indices.setdefault(point, index)
+    return array(
+        'q',
+        [
+            indices[vertex]
+            for vertex in constructor(
+                points,
+                partial(_orient, orientation_evaluator, cross_producer, zero),
+            )
+        ],
+    )
@@ -0,0 +1,10 @@
+import sys
+from collections.abc import Callable
+from fractions import Fraction
+from typing import Any, Final
+
+#: upper bound of relative error of a single floating point operation
+UNIT_ROUNDOFF: Final[float] = sys.float_info.epsilon / 2
+
+to_float: Final[Callable[[Any], float]] = float
+to_fraction: Final[Callable[[Any], Fraction]] = Fraction
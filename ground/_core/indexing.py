@@ -0,0 +1,633 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Sequence
+from itertools import count, islice
+from math import ceil, sqrt
+from random import Random
+from typing import Any, Final, Generic, TypeVar
+
+from typing_extensions import Self
+
+import ground
+
+from .angular.filtered.orientation import orientation as filtered_orientation
+from .enums import Location, Orientation
+from .hints import Box, Contour, Point, ScalarT, Segment, TernaryPointFunction
+from .vector.plain import cross
+
+MODULE_NAME: Final[str] = f'{ground.__name__}.indexing'
+DEFAULT_MAX_CHILDREN: Final[int] = 16
+
+_TargetT = TypeVar('_TargetT')
+
+
+class RTree(Generic[ScalarT]):
+    """
+    **RTree** is a static spatial index over a sequence of boxes
+    bulk-loaded with *Sort-Tile-Recursive* packing.
+
+    Reference:
+        https://en.wikipedia.org/wiki/R-tree
+    """
+
+    @property
+    def boxes(self, /) -> Sequence[Box[ScalarT]]:
+        """Returns indexed boxes."""
+        return self._boxes
+
+    @property
+    def max_children(self, /) -> int:
+        """Returns maximum number of children of a node."""
+        return self._max_children
+
+    def find_intersecting(self, box: Box[ScalarT], /) -> list[int]:
+        """
+        Returns sorted indices of boxes which intersect the given one
+        (including ones which only touch it).
+
+        Time complexity:
+            ``O(log elements_count + hits_count)`` on average,
+            ``O(elements_count)`` in the worst case
+        Memory complexity:
+            ``O(log elements_count + hits_count)``
+        where ``elements_count = len(self.boxes)``,
+        ``hits_count`` is the number of found boxes.
+        """
+        root = self._root
+        if root is None:
+            return []
+        result: list[int] = []
+        min_x, max_x, min_y, max_y = box.min_x, box.max_x, box.min_y, box.max_y
+        queue = [root]
+        while queue:
+            node = queue.pop()
+            for child in node.children:
+                child_box = child.box
+                if (
+                    child_box.min_x <= max_x
+                    and min_x <= child_box.max_x
+                    and child_box.min_y <= max_y
+                    and min_y <= child_box.max_y
+                ):
+                    if child.index is None:
+                        queue.append(child)
+                    else:
+                        result.append(child.index)
+        result.sort()
+        return result
+
+    def find_n_nearest_to_point(
+        self, n: int, point: Point[ScalarT], /
+    ) -> list[int]:
+        """
+        Returns indices of at most ``n`` boxes nearest to the point
+        in the order of non-decreasing distance.
+
+        Time complexity:
+            ``O(n * log elements_count)`` on average
+        Memory complexity:
+            ``O(n * log elements_count)`` on average
+        where ``elements_count = len(self.boxes)``.
+        """
+        return self._find_n_nearest(n, point, self._box_point_squared_metric)
+
+    def find_n_nearest_to_segment(
+        self, n: int, segment: Segment[ScalarT], /
+    ) -> list[int]:
+        """
+        Returns indices of at most ``n`` boxes nearest to the segment
+        in the order of non-decreasing distance.
+
+        Time complexity:
+            ``O(n * log elements_count)`` on average
+        Memory complexity:
+            ``O(n * log elements_count)`` on average
+        where ``elements_count = len(self.boxes)``.
+        """
+        return self._find_n_nearest(
+            n, segment, self._box_segment_squared_metric
+        )
+
+    def iter_nearest_to_point(self, point: Point[ScalarT], /) -> Iterator[int]:
+        """
+        Lazily yields indices of boxes
+        in the order of non-decreasing distance to the point.
+
+        Time complexity:
+            ``O(log elements_count)`` on average per yielded index
+        Memory complexity:
+            ``O(elements_count)`` in the worst case
+        where ``elements_count = len(self.boxes)``.
+        """
+        return self._iter_nearest(point, self._box_point_squared_metric)
+
+    def iter_nearest_to_segment(
+        self, segment: Segment[ScalarT], /
+    ) -> Iterator[int]:
+        """
+        Lazily yields indices of boxes
+        in the order of non-decreasing distance to the segment.
+
+        Time complexity:
+            ``O(log elements_count)`` on average per yielded index
+        Memory complexity:
+            ``O(elements_count)`` in the worst case
+        where ``elements_count = len(self.boxes)``.
+        """
+        return self._iter_nearest(segment, self._box_segment_squared_metric)
+
+    _box_cls: type[Box[ScalarT]]
+    _box_point_squared_metric: Callable[
+        [Box[ScalarT], Point[ScalarT]], ScalarT
+    ]
+    _box_segment_squared_metric: Callable[
+        [Box[ScalarT], Segment[ScalarT]], ScalarT
+    ]
+    _boxes: Sequence[Box[ScalarT]]
+    _max_children: int
+    _root: _Node[ScalarT] | None
+
+    def _find_n_nearest(
+        self,
+        n: int,
+        target: _TargetT,
+        metric: Callable[[Box[ScalarT], _TargetT], ScalarT],
+        /,
+    ) -> list[int]:
+        if n <= 0:
+            return []
+        return list(islice(self._iter_nearest(target, metric), n))
+
+    def _iter_nearest(
+        self,
+        target: _TargetT,
+        metric: Callable[[Box[ScalarT], _TargetT], ScalarT],
+        /,
+    ) -> Iterator[int]:
+        root = self._root
+        if root is None:
+            return
+        # equidistant nodes are visited in the reversed order of pushing,
+        # so ties are resolved depth-first
+        # and reach leaves without expanding all of the equidistant nodes
+        tie_breaker = count(0, -1)
+        queue: list[tuple[ScalarT, int, _Node[ScalarT]]] = [
+            (metric(child.box, target), next(tie_breaker), child)
+            for child in root.children
+        ]
+        heapq.heapify(queue)
+        while queue:
+            _, _, node = heapq.heappop(queue)
+            if node.index is None:
+                for child in node.children:
+                    heapq.heappush(
+                        queue,
+                        (metric(child.box, target), next(tie_breaker), child),
+                    )
+            else:
+                yield node.index
+
+    __module__: str = MODULE_NAME
+    __slots__ = (
+        '_box_cls',
+        '_box_point_squared_metric',
+        '_box_segment_squared_metric',
+        '_boxes',
+        '_max_children',
+        '_root',
+    )
+
+    def __new__(
+        cls,
+        boxes: Sequence[Box[ScalarT]],
+        /,
+        *,
+        box_cls: type[Box[ScalarT]],
+        box_point_squared_metric: Callable[
+            [Box[ScalarT], Point[ScalarT]], ScalarT
+        ],
+        box_segment_squared_metric: Callable[
+            [Box[ScalarT], Segment[ScalarT]], ScalarT
+        ],
+        max_children: int = DEFAULT_MAX_CHILDREN,
+    ) -> Self:
+        if max_children < 2:
+            raise ValueError(
+                'Maximum number of children should be not less than 2, '
+                f'but found {max_children}.'
+            )
+        self = super().__new__(cls)
+        (
+            self._box_cls,
+            self._box_point_squared_metric,
+            self._box_segment_squared_metric,
+            self._boxes,
+            self._max_children,
+        ) = (
+            box_cls,
+            box_point_squared_metric,
+            box_segment_squared_metric,
+            boxes,
+            max_children,
+        )
+        self._root = (
+            _pack(
+                [_Node(box, (), index) for index, box in enumerate(boxes)],
+                max_children,
+                box_cls,
+            )
+            if boxes
+            else None
+        )
+        return self
+
+
+class SlabDecomposition(Generic[ScalarT]):
+    """
+    **SlabDecomposition** is a static point location index
+    over a region (or a polygon) bounded by simple non-crossing contours
+    which splits the plane by vertical lines through the vertices
+    into slabs with edges ordered from bottom to top inside each of them.
+
+    Consecutive slabs share search trees of their edges
+    by path copying, so only edges starting or ending
+    at the border of a slab take additional memory.
+
+    Reference:
+        https://en.wikipedia.org/wiki/Point_location#Slab_decomposition
+        https://en.wikipedia.org/wiki/Persistent_data_structure
+    """
+
+    @property
+    def contours(self, /) -> Sequence[Contour[ScalarT]]:
+        """Returns indexed contours."""
+        return self._contours
+
+    def locate(self, point: Point[ScalarT], /) -> Location:
+        """
+        Returns location of the point relative to the indexed region.
+
+        Time complexity:
+            ``O(log vertices_count)`` expected
+        Memory complexity:
+            ``O(1)``
+        where ``vertices_count = sum(len(contour.vertices)\
+ for contour in self.contours)``.
+        """
+        point_x, slabs_xs = point.x, self._slabs_xs
+        slab_index = bisect_left(slabs_xs, point_x)
+        if slab_index == len(slabs_xs):
+            return Location.EXTERIOR
+        if slabs_xs[slab_index] == point_x:
+            lows, highs = self._vertical_boundaries[slab_index]
+            point_y = point.y
+            interval_index = bisect_right(lows, point_y) - 1
+            if interval_index >= 0 and point_y <= highs[interval_index]:
+                return Location.BOUNDARY
+            if slab_index == len(slabs_xs) - 1:
+                return Location.EXTERIOR
+            # non-boundary point on the left border of the slab
+            # has the same location as points of the slab near it
+        elif slab_index == 0:
+            return Location.EXTERIOR
+        else:
+            slab_index -= 1
+        node, orienteer = self._slabs_roots[slab_index], self._orienteer
+        # edges below the point are counted
+        # while descending from the root
+        edges_below_count = 0
+        while node is not None:
+            orientation = orienteer(*node.edge, point)
+            if orientation is Orientation.COUNTERCLOCKWISE:
+                edges_below_count += 1 + _to_size(node.left)
+                node = node.right
+            elif orientation is Orientation.CLOCKWISE:
+                node = node.left
+            else:
+                return Location.BOUNDARY
+        return (
+            Location.INTERIOR if edges_below_count % 2 else Location.EXTERIOR
+        )
+
+    _contours: Sequence[Contour[ScalarT]]
+    _orienteer: TernaryPointFunction[ScalarT, Orientation]
+    _slabs_roots: Sequence[_SlabNode[ScalarT] | None]
+    _slabs_xs: Sequence[ScalarT]
+    _vertical_boundaries: Sequence[tuple[list[ScalarT], list[ScalarT]]]
+
+    __module__: str = MODULE_NAME
+    __slots__ = (
+        '_contours',
+        '_orienteer',
+        '_slabs_roots',
+        '_slabs_xs',
+        '_vertical_boundaries',
+    )
+
+    def __new__(
+        cls,
+        contours: Sequence[Contour[ScalarT]],
+        /,
+        *,
+        orienteer: TernaryPointFunction[ScalarT, Orientation],
+    ) -> Self:
+        vertices = [
+            vertex for contour in contours for vertex in contour.vertices
+        ]
+        slabs_xs = sorted({vertex.x for vertex in vertices})
+        vertical_intervals: list[list[tuple[ScalarT, ScalarT]]] = [
+            [] for _ in slabs_xs
+        ]
+        for vertex in vertices:
+            vertical_intervals[bisect_left(slabs_xs, vertex.x)].append(
+                (vertex.y, vertex.y)
+            )
+        # edges are inserted into the slab they start at
+        # and removed from the slab they end at
+        starting_edges: list[list[tuple[Point[ScalarT], Point[ScalarT]]]] = [
+            [] for _ in slabs_xs
+        ]
+        ending_edges: list[list[tuple[Point[ScalarT], Point[ScalarT]]]] = [
+            [] for _ in slabs_xs
+        ]
+        for contour in contours:
+            contour_vertices = contour.vertices
+            start = contour_vertices[-1]
+            for end in contour_vertices:
+                left, right = (
+                    (start, end)
+                    if (start.x, start.y) < (end.x, end.y)
+                    else (end, start)
+                )
+                start = end
+                left_index = bisect_left(slabs_xs, left.x)
+                if left.x == right.x:
+                    vertical_intervals[left_index].append((left.y, right.y))
+                    continue
+                edge = left, right
+                starting_edges[left_index].append(edge)
+                ending_edges[bisect_left(slabs_xs, right.x)].append(edge)
+        priorities = Random(0)
+        root: _SlabNode[ScalarT] | None = None
+        slabs_roots: list[_SlabNode[ScalarT] | None] = []
+        for slab_index in range(len(slabs_xs) - 1):
+            for edge in ending_edges[slab_index]:
+                root = _remove_slab_edge(root, edge)
+            for edge in starting_edges[slab_index]:
+                root = _insert_slab_edge(
+                    root, _SlabNode(edge, priorities.random())
+                )
+            slabs_roots.append(root)
+        self = super().__new__(cls)
+        (
+            self._contours,
+            self._orienteer,
+            self._slabs_roots,
+            self._slabs_xs,
+            self._vertical_boundaries,
+        ) = (
+            contours,
+            orienteer,
+            slabs_roots,
+            slabs_xs,
+            [_merge_intervals(intervals) for intervals in vertical_intervals],
+        )
+        return self
+
+
+class _Node(Generic[ScalarT]):
+    box: Box[ScalarT]
+    children: Sequence[_Node[ScalarT]]
+    index: int | None
+
+    __slots__ = 'box', 'children', 'index'
+
+    def __init__(
+        self,
+        box: Box[ScalarT],
+        children: Sequence[_Node[ScalarT]],
+        index: int | None,
+        /,
+    ) -> None:
+        self.box, self.children, self.index = box, children, index
+
+
+def _pack(
+    nodes: list[_Node[ScalarT]],
+    max_children: int,
+    box_cls: type[Box[ScalarT]],
+    /,
+) -> _Node[ScalarT]:
+    while len(nodes) > max_children:
+        nodes = _pack_level(nodes, max_children, box_cls)
+    return _to_parent(nodes, box_cls)
+
+
+def _pack_level(
+    nodes: list[_Node[ScalarT]],
+    max_children: int,
+    box_cls: type[Box[ScalarT]],
+    /,
+) -> list[_Node[ScalarT]]:
+    parents_count = ceil(len(nodes) / max_children)
+    slabs_count = ceil(sqrt(parents_count))
+    slab_size = ceil(parents_count / slabs_count) * max_children
+    # sums of coordinates limits order nodes the same way
+    # as their boxes centers do, but avoid division
+    nodes = sorted(nodes, key=_to_node_x_key)
+    result: list[_Node[ScalarT]] = []
+    for slab_start in range(0, len(nodes), slab_size):
+        slab = sorted(
+            nodes[slab_start : slab_start + slab_size], key=_to_node_y_key
+        )
+        result.extend(
+            _to_parent(slab[start : start + max_children], box_cls)
+            for start in range(0, len(slab), max_children)
+        )
+    return result
+
+
+def _to_node_x_key(node: _Node[ScalarT], /) -> Any:
+    return node.box.min_x + node.box.max_x
+
+
+def _to_node_y_key(node: _Node[ScalarT], /) -> Any:
+    return node.box.min_y + node.box.max_y
+
+
+def _to_parent(
+    children: list[_Node[ScalarT]], box_cls: type[Box[ScalarT]], /
+) -> _Node[ScalarT]:
+    return _Node(
+        box_cls(
+            min(child.box.min_x for child in children),
+            max(child.box.max_x for child in children),
+            min(child.box.min_y for child in children),
+            max(child.box.max_y for child in children),
+        ),
+        children,
+        None,
+    )
+
+
+def _merge_intervals(
+    intervals: list[tuple[ScalarT, ScalarT]], /
+) -> tuple[list[ScalarT], list[ScalarT]]:
+    intervals.sort()
+    lows: list[ScalarT] = []
+    highs: list[ScalarT] = []
+    for low, high in intervals:
+        if highs and low <= highs[-1]:
+            if highs[-1] < high:
+                highs[-1] = high
+        else:
+            lows.append(low)
+            highs.append(high)
+    return lows, highs
+
+
+class _SlabNode(Generic[ScalarT]):
+    edge: tuple[Point[ScalarT], Point[ScalarT]]
+    left: _SlabNode[ScalarT] | None
+    priority: float
+    right: _SlabNode[ScalarT] | None
+    size: int
+
+    __slots__ = 'edge', 'left', 'priority', 'right', 'size'
+
+    def __init__(
+        self,
+        edge: tuple[Point[ScalarT], Point[ScalarT]],
+        priority: float,
+        left: _SlabNode[ScalarT] | None = None,
+        right: _SlabNode[ScalarT] | None = None,
+        /,
+    ) -> None:
+        self.edge, self.left, self.priority, self.right, self.size = (
+            edge,
+            left,
+            priority,
+            right,
+            1 + _to_size(left) + _to_size(right),
+        )
+
+    def with_children(
+        self,
+        left: _SlabNode[ScalarT] | None,
+        right: _SlabNode[ScalarT] | None,
+        /,
+    ) -> _SlabNode[ScalarT]:
+        return _SlabNode(self.edge, self.priority, left, right)
+
+
+def _insert_slab_edge(
+    node: _SlabNode[ScalarT] | None, new_node: _SlabNode[ScalarT], /
+) -> _SlabNode[ScalarT]:
+    # nodes are never mutated after construction,
+    # so nodes on the path to the inserted one are copied
+    # and the rest are shared with the previous tree
+    if node is None:
+        return new_node
+    if node.priority < new_node.priority:
+        return new_node.with_children(*_split_slab_edges(node, new_node.edge))
+    if _compare_slab_edges(new_node.edge, node.edge) < 0:
+        return node.with_children(
+            _insert_slab_edge(node.left, new_node), node.right
+        )
+    return node.with_children(
+        node.left, _insert_slab_edge(node.right, new_node)
+    )
+
+
+def _merge_slab_edges(
+    left: _SlabNode[ScalarT] | None, right: _SlabNode[ScalarT] | None, /
+) -> _SlabNode[ScalarT] | None:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if right.priority < left.priority:
+        return left.with_children(
+            left.left, _merge_slab_edges(left.right, right)
+        )
+    return right.with_children(
+        _merge_slab_edges(left, right.left), right.right
+    )
+
+
+def _remove_slab_edge(
+    node: _SlabNode[ScalarT] | None,
+    edge: tuple[Point[ScalarT], Point[ScalarT]],
+    /,
+) -> _SlabNode[ScalarT] | None:
+    if node is None:
+        left, right = edge
+        raise ValueError(
+            'Edges of contours should not cross, '
+            f'but found edge from {left!r} to {right!r} crossing others.'
+        )
+    if node.edge is edge:
+        return _merge_slab_edges(node.left, node.right)
+    if _compare_slab_edges(edge, node.edge) < 0:
+        return node.with_children(
+            _remove_slab_edge(node.left, edge), node.right
+        )
+    return node.with_children(node.left, _remove_slab_edge(node.right, edge))
+
+
+def _split_slab_edges(
+    node: _SlabNode[ScalarT] | None,
+    edge: tuple[Point[ScalarT], Point[ScalarT]],
+    /,
+) -> tuple[_SlabNode[ScalarT] | None, _SlabNode[ScalarT] | None]:
+    # splits into edges below the given one and the rest
+    if node is None:
+        return None, None
+    if _compare_slab_edges(node.edge, edge) < 0:
+        left, right = _split_slab_edges(node.right, edge)
+        return node.with_children(node.left, left), right
+    left, right = _split_slab_edges(node.left, edge)
+    return left, node.with_children(right, node.right)
+
+
+def _to_size(node: _SlabNode[Any] | None, /) -> int:
+    return 0 if node is None else node.size
+
+
+def _to_exact_orientation(
+    vertex: Point[Any],
+    first_ray_point: Point[Any],
+    second_ray_point: Point[Any],
+    /,
+) -> Orientation:
+    return filtered_orientation(
+        vertex, first_ray_point, second_ray_point, cross.multiply, 0
+    )
+
+
+def _compare_slab_edges(
+    first: tuple[Point[ScalarT], Point[ScalarT]],
+    second: tuple[Point[ScalarT], Point[ScalarT]],
+    /,
+) -> int:
+    # edges of a slab do not cross,
+    # so they are ordered by the orientation of the edge starting later
+    # relative to the other one,
+    # which is evaluated exactly to keep the order consistent
+    # for floating point coordinates as well
+    first_left, first_right = first
+    second_left, second_right = second
+    if first_left.x < second_left.x:
+        return -_compare_slab_edges(second, first)
+    orientation = _to_exact_orientation(second_left, second_right, first_left)
+    if orientation is Orientation.COLLINEAR:
+        orientation = _to_exact_orientation(
+            second_left, second_right, first_right
+        )
+    return (
+        1
+        if orientation is Orientation.COUNTERCLOCKWISE
+        else (-1 if orientation is Orientation.CLOCKWISE else 0)
+    )
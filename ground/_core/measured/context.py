@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, Generic
 
 from reprit import serializers
@@ -12,6 +12,9 @@ from .plain import region as plain_region
 RegionSignedMeasure = Callable[
     [Contour[ScalarT], ScalarFactory[ScalarT]], ScalarT
 ]
+RegionsSignedMeasures = Callable[
+    [Sequence[Contour[ScalarT]], ScalarFactory[ScalarT]], Sequence[ScalarT]
+]
 
 
 class Context(HasRepr, Generic[ScalarT]):
@@ -19,16 +22,36 @@ class Context(HasRepr, Generic[ScalarT]):
     def region_signed_area(self, /) -> RegionSignedMeasure[ScalarT]:
         return self._region_signed_area
 
+    @property
+    def regions_signed_areas(self, /) -> RegionsSignedMeasures[ScalarT]:
+        return self._regions_signed_areas
+
     _region_signed_area: RegionSignedMeasure[ScalarT]
-    __slots__ = ('_region_signed_area',)
+    _regions_signed_areas: RegionsSignedMeasures[ScalarT]
+    __slots__ = '_region_signed_area', '_regions_signed_areas'
 
     def __new__(
-        cls, /, *, region_signed_area: RegionSignedMeasure[ScalarT]
+        cls,
+        /,
+        *,
+        region_signed_area: RegionSignedMeasure[ScalarT],
+        regions_signed_areas: RegionsSignedMeasures[ScalarT],
     ) -> Self:
         self = super().__new__(cls)
         self._region_signed_area = region_signed_area
+        self._regions_signed_areas = regions_signed_areas
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            (
+                self._region_signed_area is other._region_signed_area
+                and self._regions_signed_areas is other._regions_signed_areas
+            )
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
@@ -37,5 +60,6 @@ class Context(HasRepr, Generic[ScalarT]):
 
 
 plain_context: Context[Any] = Context(
-    region_signed_area=plain_region.signed_area
+    region_signed_area=plain_region.signed_area,
+    regions_signed_areas=plain_region.signed_areas,
 )
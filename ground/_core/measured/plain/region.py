@@ -1,12 +1,41 @@
-from ground._core.hints import Contour, ScalarFactory, ScalarT
+from collections.abc import Sequence
+
+from ground._core.arrays import PointArray, to_vertices_coordinates
+from ground._core.hints import Contour, Point, ScalarFactory, ScalarT
 
 
 def signed_area(
     contour: Contour[ScalarT], coordinate_factory: ScalarFactory[ScalarT], /
 ) -> ScalarT:
-    vertices = contour.vertices
-    result, vertex = coordinate_factory(0), vertices[-1]
+    return to_double_area(
+        contour.vertices, coordinate_factory(0)
+    ) / coordinate_factory(2)
+
+
+def signed_areas(
+    contours: Sequence[Contour[ScalarT]],
+    coordinate_factory: ScalarFactory[ScalarT],
+    /,
+) -> list[ScalarT]:
+    zero, two = coordinate_factory(0), coordinate_factory(2)
+    return [
+        to_double_area(contour.vertices, zero) / two for contour in contours
+    ]
+
+
+def to_double_area(
+    vertices: Sequence[Point[ScalarT]], zero: ScalarT, /
+) -> ScalarT:
+    if isinstance(vertices, PointArray):
+        xs, ys = to_vertices_coordinates(vertices)
+        result: ScalarT = zero
+        prev_x, prev_y = xs[-1], ys[-1]
+        for x, y in zip(xs, ys, strict=True):
+            result += prev_x * y - x * prev_y
+            prev_x, prev_y = x, y
+        return result
+    result, vertex = zero, vertices[-1]
     for next_vertex in vertices:
         result += vertex.x * next_vertex.y - next_vertex.x * vertex.y
         vertex = next_vertex
-    return result / coordinate_factory(2)
+    return result
@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+
+import numpy
+
+from ground._core.hints import Contour, ScalarFactory, ScalarT
+from ground._core.vectorization import (
+    to_contours_edges_arrays,
+    to_flat_contours_edges_arrays,
+    to_scalar,
+)
+
+
+def signed_area(
+    contour: Contour[ScalarT], coordinate_factory: ScalarFactory[ScalarT], /
+) -> ScalarT:
+    starts, ends = to_contours_edges_arrays([contour], coordinate_factory)
+    result: ScalarT = to_scalar(
+        (starts[:, 0] * ends[:, 1] - ends[:, 0] * starts[:, 1]).sum()
+    )
+    return result / coordinate_factory(2)
+
+
+def signed_areas(
+    contours: Sequence[Contour[ScalarT]],
+    coordinate_factory: ScalarFactory[ScalarT],
+    /,
+) -> list[ScalarT]:
+    if not contours:
+        return []
+    # double areas of all the contours are evaluated at once
+    # by summing up components of their concatenated edges
+    # over segments of each contour
+    starts, ends, offsets = to_flat_contours_edges_arrays(
+        contours, coordinate_factory
+    )
+    double_areas = numpy.add.reduceat(
+        starts[:, 0] * ends[:, 1] - ends[:, 0] * starts[:, 1], offsets
+    )
+    result: list[ScalarT] = (double_areas / coordinate_factory(2)).tolist()
+    return result
@@ -1,9 +1,10 @@
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, Sequence
 from typing import Any, Generic, TypeAlias
 
 from reprit import serializers
 from reprit.base import generate_repr
-from typing_extensions import Self
+from typing_extensions import Buffer, Self
 
 from ground._core.hints import (
     Box,
@@ -19,6 +20,7 @@ from .plain import (
     box as plain_box,
     point as plain_point,
     segment as plain_segment,
+    segments as plain_segments,
 )
 
 BoxPointMetric: TypeAlias = Callable[
@@ -48,6 +50,26 @@ SegmentPointMetric: TypeAlias = Callable[
     ],
     ScalarT,
 ]
+SegmentPointsMetric: TypeAlias = Callable[
+    [
+        Point[ScalarT],
+        Point[ScalarT],
+        Sequence[Point[ScalarT]] | Buffer,
+        QuaternaryPointFunction[ScalarT, ScalarT],
+        ScalarFactory[ScalarT],
+    ],
+    'Sequence[ScalarT] | array[float]',
+]
+SegmentsPointsMetric: TypeAlias = Callable[
+    [
+        Sequence[Point[ScalarT]] | Buffer,
+        Sequence[Point[ScalarT]] | Buffer,
+        Sequence[Point[ScalarT]] | Buffer,
+        QuaternaryPointFunction[ScalarT, ScalarT],
+        ScalarFactory[ScalarT],
+    ],
+    'Sequence[ScalarT] | array[float]',
+]
 SegmentSegmentMetric: TypeAlias = Callable[
     [
         Point[ScalarT],
@@ -79,24 +101,38 @@ class Context(HasRepr, Generic[ScalarT]):
     def segment_point_squared_metric(self, /) -> SegmentPointMetric[ScalarT]:
         return self._segment_point_squared_metric
 
+    @property
+    def segment_points_squared_metric(self, /) -> SegmentPointsMetric[ScalarT]:
+        return self._segment_points_squared_metric
+
     @property
     def segment_segment_squared_metric(
         self, /
     ) -> SegmentSegmentMetric[ScalarT]:
         return self._segment_segment_squared_metric
 
+    @property
+    def segments_points_squared_metric(
+        self, /
+    ) -> SegmentsPointsMetric[ScalarT]:
+        return self._segments_points_squared_metric
+
     _box_point_squared_metric: BoxPointMetric[ScalarT]
     _box_segment_squared_metric: BoxSegmentMetric[ScalarT]
     _point_point_squared_metric: PointPointMetric[ScalarT]
     _segment_point_squared_metric: SegmentPointMetric[ScalarT]
+    _segment_points_squared_metric: SegmentPointsMetric[ScalarT]
     _segment_segment_squared_metric: SegmentSegmentMetric[ScalarT]
+    _segments_points_squared_metric: SegmentsPointsMetric[ScalarT]
 
     __slots__ = (
         '_box_point_squared_metric',
         '_box_segment_squared_metric',
         '_point_point_squared_metric',
         '_segment_point_squared_metric',
+        '_segment_points_squared_metric',
         '_segment_segment_squared_metric',
+        '_segments_points_squared_metric',
     )
 
     def __new__(
@@ -107,16 +143,42 @@ class Context(HasRepr, Generic[ScalarT]):
         box_segment_squared_metric: BoxSegmentMetric[ScalarT],
         point_point_squared_metric: PointPointMetric[ScalarT],
         segment_point_squared_metric: SegmentPointMetric[ScalarT],
+        segment_points_squared_metric: SegmentPointsMetric[ScalarT],
         segment_segment_squared_metric: SegmentSegmentMetric[ScalarT],
+        segments_points_squared_metric: SegmentsPointsMetric[ScalarT],
     ) -> Self:
         self = super().__new__(cls)
         self._box_point_squared_metric = box_point_squared_metric
         self._box_segment_squared_metric = box_segment_squared_metric
         self._point_point_squared_metric = point_point_squared_metric
         self._segment_point_squared_metric = segment_point_squared_metric
+        self._segment_points_squared_metric = segment_points_squared_metric
         self._segment_segment_squared_metric = segment_segment_squared_metric
+        self._segments_points_squared_metric = segments_points_squared_metric
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            (
+                self._box_point_squared_metric
+                is other._box_point_squared_metric
+                and self._box_segment_squared_metric
+                is other._box_segment_squared_metric
+                and self._point_point_squared_metric
+                is other._point_point_squared_metric
+                and self._segment_point_squared_metric
+                is other._segment_point_squared_metric
+                and self._segment_points_squared_metric
+                is other._segment_points_squared_metric
+                and self._segment_segment_squared_metric
+                is other._segment_segment_squared_metric
+                and self._segments_points_squared_metric
+                is other._segments_points_squared_metric
+            )
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
@@ -129,5 +191,7 @@ plain_context: Context[Any] = Context(
     box_segment_squared_metric=plain_box.segment_squared_distance,
     point_point_squared_metric=plain_point.point_squared_distance,
     segment_point_squared_metric=plain_segment.point_squared_distance,
+    segment_points_squared_metric=plain_segment.points_squared_distances,
     segment_segment_squared_metric=plain_segment.segment_squared_distance,
+    segments_points_squared_metric=plain_segments.point_squared_distances,
 )
@@ -1,3 +1,12 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+from typing_extensions import Buffer
+
+from ground._core.arrays import numpy, to_coordinates
 from ground._core.hints import (
     Point,
     QuaternaryPointFunction,
@@ -79,3 +88,99 @@ def segment_squared_distance(
             ),
         )
     )
+
+
+def points_squared_distances(
+    start: Point[ScalarT],
+    end: Point[ScalarT],
+    points: Sequence[Point[ScalarT]] | Buffer,
+    dot_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    coordinate_factory: ScalarFactory[ScalarT],
+    /,
+) -> Sequence[ScalarT] | array[float]:
+    points_coordinates = to_coordinates(points)
+    if points_coordinates is not None:
+        return coordinates_squared_distances(
+            start.x, start.y, end.x, end.y, points_coordinates
+        )
+    assert isinstance(points, Sequence), points
+    zero, one = coordinate_factory(0), coordinate_factory(1)
+    start_x, start_y, end_x, end_y = start.x, start.y, end.x, end.y
+    squared_length = point_point_squared_distance(start, end)
+    result: list[ScalarT] = []
+    for point in points:
+        end_factor = max(
+            zero,
+            min(one, dot_producer(start, point, start, end) / squared_length),
+        )
+        start_factor = one - end_factor
+        result.append(
+            square(start_factor * start_x + end_factor * end_x - point.x)
+            + square(start_factor * start_y + end_factor * end_y - point.y)
+        )
+    return result
+
+
+def coordinates_squared_distances(
+    start_x: Any,
+    start_y: Any,
+    end_x: Any,
+    end_y: Any,
+    points_coordinates: memoryview[float],
+    /,
+) -> array[float]:
+    # coordinates of points are ``float``s,
+    # so the segment is evaluated in ``float``s as well
+    start_x, start_y, end_x, end_y = (
+        float(start_x),
+        float(start_y),
+        float(end_x),
+        float(end_y),
+    )
+    delta_x, delta_y = end_x - start_x, end_y - start_y
+    squared_length = delta_x * delta_x + delta_y * delta_y
+    if numpy is not None:
+        if not squared_length and points_coordinates:
+            # NumPy gives NaNs instead of raising
+            # like evaluation for sequences of points does
+            raise ZeroDivisionError('float division by zero')
+        points_array = numpy.frombuffer(
+            points_coordinates, dtype=numpy.float64
+        )
+        xs, ys = points_array[::2], points_array[1::2]
+        end_factors = numpy.clip(
+            ((xs - start_x) * delta_x + (ys - start_y) * delta_y)
+            / squared_length,
+            0.0,
+            1.0,
+        )
+        start_factors = 1.0 - end_factors
+        return array(
+            'd',
+            (
+                numpy.square(
+                    start_factors * start_x + end_factors * end_x - xs
+                )
+                + numpy.square(
+                    start_factors * start_y + end_factors * end_y - ys
+                )
+            ).tobytes(),
+        )
+    result = array('d')
+    for x, y in zip(
+        points_coordinates[::2], points_coordinates[1::2], strict=True
+    ):
+        end_factor = max(
+            0.0,
+            min(
+                1.0,
+                ((x - start_x) * delta_x + (y - start_y) * delta_y)
+                / squared_length,
+            ),
+        )
+        start_factor = 1.0 - end_factor
+        result.append(
+            square(start_factor * start_x + end_factor * end_x - x)
+            + square(start_factor * start_y + end_factor * end_y - y)
+        )
+    return result
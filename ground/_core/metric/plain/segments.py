@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+from typing_extensions import Buffer
+
+from ground._core.arrays import is_points_sequence, numpy, to_coordinates
+from ground._core.hints import (
+    Point,
+    QuaternaryPointFunction,
+    ScalarFactory,
+    ScalarT,
+)
+from ground._core.primitive import square
+
+from .point import point_squared_distance as point_point_squared_distance
+
+
+def point_squared_distances(
+    starts: Sequence[Point[ScalarT]] | Buffer,
+    ends: Sequence[Point[ScalarT]] | Buffer,
+    points: Sequence[Point[ScalarT]] | Buffer,
+    dot_producer: QuaternaryPointFunction[ScalarT, ScalarT],
+    coordinate_factory: ScalarFactory[ScalarT],
+    /,
+) -> Sequence[ScalarT] | array[float]:
+    starts_coordinates, ends_coordinates = (
+        to_coordinates(starts),
+        to_coordinates(ends),
+    )
+    points_coordinates = to_coordinates(points)
+    if (
+        starts_coordinates is not None
+        and ends_coordinates is not None
+        and points_coordinates is not None
+    ):
+        return coordinates_point_squared_distances(
+            starts_coordinates, ends_coordinates, points_coordinates
+        )
+    if not (
+        isinstance(starts, Sequence)
+        and is_points_sequence(starts, starts_coordinates)
+        and isinstance(ends, Sequence)
+        and is_points_sequence(ends, ends_coordinates)
+        and isinstance(points, Sequence)
+        and is_points_sequence(points, points_coordinates)
+    ):
+        raise TypeError(
+            'Segments endpoints & points should be '
+            'either all buffers or all sequences of points, but found '
+            f'{type(starts)!r}, {type(ends)!r} and {type(points)!r}.'
+        )
+    zero, one = coordinate_factory(0), coordinate_factory(1)
+    result: list[ScalarT] = []
+    for start, end, point in zip(starts, ends, points, strict=True):
+        end_factor = max(
+            zero,
+            min(
+                one,
+                dot_producer(start, point, start, end)
+                / point_point_squared_distance(start, end),
+            ),
+        )
+        start_factor = one - end_factor
+        result.append(
+            square(start_factor * start.x + end_factor * end.x - point.x)
+            + square(start_factor * start.y + end_factor * end.y - point.y)
+        )
+    return result
+
+
+def coordinates_point_squared_distances(
+    starts_coordinates: memoryview[float],
+    ends_coordinates: memoryview[float],
+    points_coordinates: memoryview[float],
+    /,
+) -> array[float]:
+    if not (
+        len(starts_coordinates)
+        == len(ends_coordinates)
+        == len(points_coordinates)
+    ):
+        raise ValueError(
+            'Coordinates buffers should have the same size, but found '
+            f'{len(starts_coordinates)}, '
+            f'{len(ends_coordinates)} '
+            f'and {len(points_coordinates)}.'
+        )
+    if numpy is not None:
+        starts_array = numpy.frombuffer(
+            starts_coordinates, dtype=numpy.float64
+        )
+        ends_array = numpy.frombuffer(ends_coordinates, dtype=numpy.float64)
+        points_array = numpy.frombuffer(
+            points_coordinates, dtype=numpy.float64
+        )
+        starts_xs, starts_ys = starts_array[::2], starts_array[1::2]
+        ends_xs, ends_ys = ends_array[::2], ends_array[1::2]
+        xs, ys = points_array[::2], points_array[1::2]
+        deltas_xs, deltas_ys = ends_xs - starts_xs, ends_ys - starts_ys
+        squared_lengths = deltas_xs * deltas_xs + deltas_ys * deltas_ys
+        if not squared_lengths.all():
+            # NumPy gives NaNs instead of raising
+            # like evaluation for sequences of points does
+            raise ZeroDivisionError('float division by zero')
+        end_factors = numpy.clip(
+            ((xs - starts_xs) * deltas_xs + (ys - starts_ys) * deltas_ys)
+            / squared_lengths,
+            0.0,
+            1.0,
+        )
+        start_factors = 1.0 - end_factors
+        return array(
+            'd',
+            (
+                numpy.square(
+                    start_factors * starts_xs + end_factors * ends_xs - xs
+                )
+                + numpy.square(
+                    start_factors * starts_ys + end_factors * ends_ys - ys
+                )
+            ).tobytes(),
+        )
+    result = array('d')
+    for start_x, start_y, end_x, end_y, x, y in zip(
+        starts_coordinates[::2],
+        starts_coordinates[1::2],
+        ends_coordinates[::2],
+        ends_coordinates[1::2],
+        points_coordinates[::2],
+        points_coordinates[1::2],
+        strict=True,
+    ):
+        delta_x, delta_y = end_x - start_x, end_y - start_y
+        end_factor = max(
+            0.0,
+            min(
+                1.0,
+                ((x - start_x) * delta_x + (y - start_y) * delta_y)
+                / (delta_x * delta_x + delta_y * delta_y),
+            ),
+        )
+        start_factor = 1.0 - end_factor
+        result.append(
+            square(start_factor * start_x + end_factor * end_x - x)
+            + square(start_factor * start_y + end_factor * end_y - y)
+        )
+    return result
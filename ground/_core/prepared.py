@@ -0,0 +1,734 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Sequence
+from typing import Final, Generic, TYPE_CHECKING
+
+from typing_extensions import Self
+
+import ground
+
+from .enums import Location, Orientation
+from .hints import (
+    Box,
+    Contour,
+    Multisegment,
+    Point,
+    Polygon,
+    ScalarT,
+    Segment,
+    TernaryPointFunction,
+)
+from .indexing import RTree
+
+if TYPE_CHECKING:
+    from ground.context import Context
+
+MODULE_NAME: Final[str] = f'{ground.__name__}.prepared'
+
+
+class PreparedMultisegment(Generic[ScalarT]):
+    """
+    **PreparedMultisegment** is a multisegment
+    with its box & index of segments evaluated once on construction,
+    so repeated nearest segments & distance queries against it
+    skip the per-geometry preprocessing.
+
+    Multisegment is assumed to not be mutated after preparation.
+
+    >>> import math
+    >>> from fractions import Fraction
+    >>> from ground.context import Context
+    >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+    >>> Multisegment = context.multisegment_cls
+    >>> Point = context.point_cls
+    >>> Segment = context.segment_cls
+    >>> prepared = context.prepare_multisegment(
+    ...     Multisegment(
+    ...         [
+    ...             Segment(Point(0, 0), Point(1, 0)),
+    ...             Segment(Point(0, 2), Point(1, 2)),
+    ...             Segment(Point(3, 0), Point(3, 2)),
+    ...         ]
+    ...     )
+    ... )
+    >>> prepared.find_n_nearest_to_point(2, Point(1, 1))
+    [0, 1]
+    >>> prepared.find_n_nearest_to_point(
+    ...     3, Point(3, 3), max_squared_distance=Fraction(5)
+    ... )
+    [2, 1]
+    >>> prepared.point_squared_distance(Point(2, 1)) == 1
+    True
+    """
+
+    @property
+    def box(self, /) -> Box[ScalarT]:
+        """Returns box of the multisegment."""
+        return self._box
+
+    @property
+    def multisegment(self, /) -> Multisegment[ScalarT]:
+        """Returns prepared multisegment."""
+        return self._multisegment
+
+    @property
+    def segments_rtree(self, /) -> RTree[ScalarT]:
+        """Returns R-tree over boxes of the segments."""
+        return self._segments_rtree
+
+    def find_n_nearest_to_point(
+        self,
+        n: int,
+        point: Point[ScalarT],
+        /,
+        *,
+        max_squared_distance: ScalarT | None = None,
+    ) -> list[int]:
+        """
+        Returns indices of at most ``n`` segments nearest to the point
+        (not farther than ``max_squared_distance`` if it is specified)
+        in the order of non-decreasing distance
+        with ties broken by indices.
+
+        Time complexity:
+            ``O((n + candidates_count) * log segments_count)`` on average
+        Memory complexity:
+            ``O(segments_count)`` in the worst case
+        where ``segments_count = len(self.multisegment.segments)``,
+        ``candidates_count`` is the number of visited segments.
+        """
+        if n <= 0:
+            return []
+        context, rtree = self._context, self._segments_rtree
+        boxes, segments = rtree.boxes, self._multisegment.segments
+        box_point_squared_metric = context.box_point_squared_distance
+        segment_point_squared_metric, dot_product, coordinate_factory = (
+            context.metric_context.segment_point_squared_metric,
+            context.dot_product,
+            context.coordinate_factory,
+        )
+        # max-heap of the nearest found candidates by negated keys
+        # (squared distance & index)
+        candidates: list[tuple[ScalarT, int]] = []
+        for index in rtree.iter_nearest_to_point(point):
+            box_squared_distance = box_point_squared_metric(
+                boxes[index], point
+            )
+            if (
+                max_squared_distance is not None
+                and max_squared_distance < box_squared_distance
+            ) or (
+                len(candidates) == n
+                and -candidates[0][0] < box_squared_distance
+            ):
+                # boxes are visited in the order of non-decreasing distance,
+                # so none of the rest segments can be closer
+                break
+            segment = segments[index]
+            squared_distance = segment_point_squared_metric(
+                segment.start,
+                segment.end,
+                point,
+                dot_product,
+                coordinate_factory,
+            )
+            if (
+                max_squared_distance is not None
+                and max_squared_distance < squared_distance
+            ):
+                continue
+            candidate = -squared_distance, -index
+            if len(candidates) < n:
+                heapq.heappush(candidates, candidate)
+            elif candidates[0] < candidate:
+                heapq.heapreplace(candidates, candidate)
+        return [-index for _, index in sorted(candidates, reverse=True)]
+
+    def point_squared_distance(self, point: Point[ScalarT], /) -> ScalarT:
+        """
+        Returns squared Euclidean distance
+        between the multisegment and the point.
+
+        Time complexity:
+            ``O(log segments_count + candidates_count)`` on average
+        Memory complexity:
+            ``O(segments_count)`` in the worst case
+        where ``segments_count = len(self.multisegment.segments)``,
+        ``candidates_count`` is the number of visited segments.
+        """
+        return _to_segments_point_squared_distance(
+            point,
+            self._multisegment.segments,
+            self._segments_rtree,
+            self._context,
+        )
+
+    def segment_squared_distance(
+        self, segment: Segment[ScalarT], /
+    ) -> ScalarT:
+        """
+        Returns squared Euclidean distance
+        between the multisegment and the segment.
+
+        Time complexity:
+            ``O(log segments_count + candidates_count)`` on average
+        Memory complexity:
+            ``O(segments_count)`` in the worst case
+        where ``segments_count = len(self.multisegment.segments)``,
+        ``candidates_count`` is the number of visited segments.
+        """
+        return _to_segments_segment_squared_distance(
+            segment,
+            self._multisegment.segments,
+            self._segments_rtree,
+            self._context,
+        )
+
+    _box: Box[ScalarT]
+    _context: Context[ScalarT]
+    _multisegment: Multisegment[ScalarT]
+    _segments_rtree: RTree[ScalarT]
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_box', '_context', '_multisegment', '_segments_rtree'
+
+    def __new__(
+        cls,
+        multisegment: Multisegment[ScalarT],
+        /,
+        *,
+        context: Context[ScalarT],
+    ) -> Self:
+        segments = multisegment.segments
+        if not segments:
+            raise ValueError(
+                'Prepared multisegment should have at least 1 segment, '
+                'but found 0.'
+            )
+        self = super().__new__(cls)
+        self._box, self._context, self._multisegment, self._segments_rtree = (
+            context.segments_box(segments),
+            context,
+            multisegment,
+            context.boxes_rtree(
+                [context.segment_box(segment) for segment in segments]
+            ),
+        )
+        return self
+
+
+class PreparedPolygon(Generic[ScalarT]):
+    """
+    **PreparedPolygon** is a polygon
+    with its box, edges, area, convexity & index of edges
+    evaluated once on construction,
+    so repeated containment & distance queries against it
+    skip the per-geometry preprocessing.
+
+    Polygon is assumed to not be mutated after preparation.
+
+    >>> import math
+    >>> from fractions import Fraction
+    >>> from ground.context import Context
+    >>> from ground.enums import Location
+    >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> prepared = context.prepare_polygon(
+    ...     Polygon(
+    ...         Contour([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)]),
+    ...         [
+    ...             Contour(
+    ...                 [Point(1, 1), Point(1, 3), Point(3, 3), Point(3, 1)]
+    ...             )
+    ...         ],
+    ...     )
+    ... )
+    >>> prepared.area == 12
+    True
+    >>> prepared.is_convex
+    False
+    >>> prepared.locate_point(Point(2, 2)) is Location.EXTERIOR
+    True
+    >>> prepared.point_squared_distance(Point(2, 2)) == 1
+    True
+    """
+
+    @property
+    def area(self, /) -> ScalarT:
+        """Returns area of the polygon."""
+        return self._area
+
+    @property
+    def box(self, /) -> Box[ScalarT]:
+        """Returns box of the polygon."""
+        return self._box
+
+    @property
+    def edges(self, /) -> Sequence[Segment[ScalarT]]:
+        """Returns edges of the border followed by edges of the holes."""
+        return self._edges
+
+    @property
+    def edges_rtree(self, /) -> RTree[ScalarT]:
+        """Returns R-tree over boxes of the edges."""
+        return self._edges_rtree
+
+    @property
+    def is_convex(self, /) -> bool:
+        """Checks if the polygon is convex."""
+        return self._is_convex
+
+    @property
+    def polygon(self, /) -> Polygon[ScalarT]:
+        """Returns prepared polygon."""
+        return self._polygon
+
+    def locate_point(self, point: Point[ScalarT], /) -> Location:
+        """
+        Returns location of the point in the polygon.
+
+        Time complexity:
+            ``O(log edges_count + candidates_count)`` on average
+        Memory complexity:
+            ``O(log edges_count + candidates_count)``
+        where ``edges_count = len(self.edges)``,
+        ``candidates_count`` is the number of edges
+        which boxes intersect the horizontal ray from the point.
+        """
+        return _locate_point(
+            point, self._box, self._edges, self._edges_rtree, self._context
+        )
+
+    def point_squared_distance(self, point: Point[ScalarT], /) -> ScalarT:
+        """
+        Returns squared Euclidean distance between the polygon and the point
+        (zero for points in the interior or on the boundary).
+
+        Time complexity:
+            ``O(log edges_count + candidates_count)`` on average
+        Memory complexity:
+            ``O(edges_count)`` in the worst case
+        where ``edges_count = len(self.edges)``,
+        ``candidates_count`` is the number of visited edges.
+        """
+        context = self._context
+        if (
+            _locate_point(
+                point, self._box, self._edges, self._edges_rtree, context
+            )
+            is not Location.EXTERIOR
+        ):
+            return context.zero
+        return _to_segments_point_squared_distance(
+            point, self._edges, self._edges_rtree, context
+        )
+
+    def segment_squared_distance(
+        self, segment: Segment[ScalarT], /
+    ) -> ScalarT:
+        """
+        Returns squared Euclidean distance between the polygon
+        and the segment (zero if they have common points).
+
+        Time complexity:
+            ``O(log edges_count + candidates_count)`` on average
+        Memory complexity:
+            ``O(edges_count)`` in the worst case
+        where ``edges_count = len(self.edges)``,
+        ``candidates_count`` is the number of visited edges.
+        """
+        context = self._context
+        if (
+            _locate_point(
+                segment.start,
+                self._box,
+                self._edges,
+                self._edges_rtree,
+                context,
+            )
+            is not Location.EXTERIOR
+        ):
+            return context.zero
+        return _to_segments_segment_squared_distance(
+            segment, self._edges, self._edges_rtree, context
+        )
+
+    _area: ScalarT
+    _box: Box[ScalarT]
+    _context: Context[ScalarT]
+    _edges: Sequence[Segment[ScalarT]]
+    _edges_rtree: RTree[ScalarT]
+    _is_convex: bool
+    _polygon: Polygon[ScalarT]
+
+    __module__: str = MODULE_NAME
+    __slots__ = (
+        '_area',
+        '_box',
+        '_context',
+        '_edges',
+        '_edges_rtree',
+        '_is_convex',
+        '_polygon',
+    )
+
+    def __new__(
+        cls, polygon: Polygon[ScalarT], /, *, context: Context[ScalarT]
+    ) -> Self:
+        border, holes = polygon.border, polygon.holes
+        edges = [
+            edge
+            for contour in (border, *holes)
+            for edge in context.contour_segments(contour)
+        ]
+        zero = context.zero
+        area = _to_area(context.region_signed_area(border), zero)
+        for hole in holes:
+            area -= _to_area(context.region_signed_area(hole), zero)
+        self = super().__new__(cls)
+        (
+            self._area,
+            self._box,
+            self._context,
+            self._edges,
+            self._edges_rtree,
+            self._is_convex,
+            self._polygon,
+        ) = (
+            area,
+            context.contour_box(border),
+            context,
+            edges,
+            context.boxes_rtree([context.segment_box(edge) for edge in edges]),
+            not holes and context.is_region_convex(border),
+            polygon,
+        )
+        return self
+
+
+class PreparedRegion(Generic[ScalarT]):
+    """
+    **PreparedRegion** is a region (given its contour)
+    with its box, edges, signed area, convexity & index of edges
+    evaluated once on construction,
+    so repeated containment & distance queries against it
+    skip the per-geometry preprocessing.
+
+    Contour is assumed to not be mutated after preparation.
+
+    >>> import math
+    >>> from fractions import Fraction
+    >>> from ground.context import Context
+    >>> from ground.enums import Location
+    >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Segment = context.segment_cls
+    >>> prepared = context.prepare_region(
+    ...     Contour([Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)])
+    ... )
+    >>> prepared.signed_area == 4
+    True
+    >>> prepared.is_convex
+    True
+    >>> prepared.locate_point(Point(1, 1)) is Location.INTERIOR
+    True
+    >>> prepared.point_squared_distance(Point(5, 2)) == 9
+    True
+    >>> prepared.segment_squared_distance(
+    ...     Segment(Point(3, 3), Point(4, 3))
+    ... ) == 2
+    True
+    """
+
+    @property
+    def box(self, /) -> Box[ScalarT]:
+        """Returns box of the region."""
+        return self._box
+
+    @property
+    def contour(self, /) -> Contour[ScalarT]:
+        """Returns contour of the prepared region."""
+        return self._contour
+
+    @property
+    def edges(self, /) -> Sequence[Segment[ScalarT]]:
+        """Returns edges of the contour."""
+        return self._edges
+
+    @property
+    def edges_rtree(self, /) -> RTree[ScalarT]:
+        """Returns R-tree over boxes of the edges."""
+        return self._edges_rtree
+
+    @property
+    def is_convex(self, /) -> bool:
+        """Checks if the region is convex."""
+        return self._is_convex
+
+    @property
+    def signed_area(self, /) -> ScalarT:
+        """Returns signed area of the region."""
+        return self._signed_area
+
+    def locate_point(self, point: Point[ScalarT], /) -> Location:
+        """
+        Returns location of the point in the region.
+
+        Time complexity:
+            ``O(log edges_count + candidates_count)`` on average
+        Memory complexity:
+            ``O(log edges_count + candidates_count)``
+        where ``edges_count = len(self.edges)``,
+        ``candidates_count`` is the number of edges
+        which boxes intersect the horizontal ray from the point.
+        """
+        return _locate_point(
+            point, self._box, self._edges, self._edges_rtree, self._context
+        )
+
+    def point_squared_distance(self, point: Point[ScalarT], /) -> ScalarT:
+        """
+        Returns squared Euclidean distance between the region and the point
+        (zero for points in the interior or on the boundary).
+
+        Time complexity:
+            ``O(log edges_count + candidates_count)`` on average
+        Memory complexity:
+            ``O(edges_count)`` in the worst case
+        where ``edges_count = len(self.edges)``,
+        ``candidates_count`` is the number of visited edges.
+        """
+        context = self._context
+        if (
+            _locate_point(
+                point, self._box, self._edges, self._edges_rtree, context
+            )
+            is not Location.EXTERIOR
+        ):
+            return context.zero
+        return _to_segments_point_squared_distance(
+            point, self._edges, self._edges_rtree, context
+        )
+
+    def segment_squared_distance(
+        self, segment: Segment[ScalarT], /
+    ) -> ScalarT:
+        """
+        Returns squared Euclidean distance between the region
+        and the segment (zero if they have common points).
+
+        Time complexity:
+            ``O(log edges_count + candidates_count)`` on average
+        Memory complexity:
+            ``O(edges_count)`` in the worst case
+        where ``edges_count = len(self.edges)``,
+        ``candidates_count`` is the number of visited edges.
+        """
+        context = self._context
+        if (
+            _locate_point(
+                segment.start,
+                self._box,
+                self._edges,
+                self._edges_rtree,
+                context,
+            )
+            is not Location.EXTERIOR
+        ):
+            return context.zero
+        return _to_segments_segment_squared_distance(
+            segment, self._edges, self._edges_rtree, context
+        )
+
+    _box: Box[ScalarT]
+    _context: Context[ScalarT]
+    _contour: Contour[ScalarT]
+    _edges: Sequence[Segment[ScalarT]]
+    _edges_rtree: RTree[ScalarT]
+    _is_convex: bool
+    _signed_area: ScalarT
+
+    __module__: str = MODULE_NAME
+    __slots__ = (
+        '_box',
+        '_context',
+        '_contour',
+        '_edges',
+        '_edges_rtree',
+        '_is_convex',
+        '_signed_area',
+    )
+
+    def __new__(
+        cls, contour: Contour[ScalarT], /, *, context: Context[ScalarT]
+    ) -> Self:
+        edges = context.contour_segments(contour)
+        self = super().__new__(cls)
+        (
+            self._box,
+            self._context,
+            self._contour,
+            self._edges,
+            self._edges_rtree,
+            self._is_convex,
+            self._signed_area,
+        ) = (
+            context.contour_box(contour),
+            context,
+            contour,
+            edges,
+            context.boxes_rtree([context.segment_box(edge) for edge in edges]),
+            context.is_region_convex(contour),
+            context.region_signed_area(contour),
+        )
+        return self
+
+
+def edge_crosses_ray(
+    start: Point[ScalarT],
+    end: Point[ScalarT],
+    point: Point[ScalarT],
+    orienteer: TernaryPointFunction[ScalarT, Orientation],
+    /,
+) -> bool:
+    # edge not containing the point crosses the horizontal ray
+    # from the point to the right iff its endpoints are separated
+    # by the ray's line (with upper endpoints counted strictly above it)
+    # and the point lies to the left of the edge directed upwards
+    point_y = point.y
+    return (start.y > point_y) is not (end.y > point_y) and (
+        (end.y > start.y)
+        is (orienteer(start, end, point) is Orientation.COUNTERCLOCKWISE)
+    )
+
+
+def find_n_nearest_segments_to_point(
+    n: int,
+    segments: Iterable[Segment[ScalarT]],
+    point: Point[ScalarT],
+    max_squared_distance: ScalarT | None,
+    context: Context[ScalarT],
+    /,
+) -> list[int]:
+    segment_point_squared_metric, dot_product, coordinate_factory = (
+        context.metric_context.segment_point_squared_metric,
+        context.dot_product,
+        context.coordinate_factory,
+    )
+    candidates = (
+        (
+            segment_point_squared_metric(
+                segment.start,
+                segment.end,
+                point,
+                dot_product,
+                coordinate_factory,
+            ),
+            index,
+        )
+        for index, segment in enumerate(segments)
+    )
+    return [
+        index
+        for _, index in heapq.nsmallest(
+            n,
+            (
+                candidates
+                if max_squared_distance is None
+                else (
+                    candidate
+                    for candidate in candidates
+                    if not max_squared_distance < candidate[0]
+                )
+            ),
+        )
+    ]
+
+
+def _locate_point(
+    point: Point[ScalarT],
+    box: Box[ScalarT],
+    edges: Sequence[Segment[ScalarT]],
+    edges_rtree: RTree[ScalarT],
+    context: Context[ScalarT],
+    /,
+) -> Location:
+    point_x, point_y = point.x, point.y
+    if not (
+        box.min_x <= point_x <= box.max_x and box.min_y <= point_y <= box.max_y
+    ):
+        return Location.EXTERIOR
+    # only edges which boxes intersect the horizontal ray
+    # from the point to the right can contain the point or cross the ray,
+    # parity of crossings over all the contours is the same
+    # as for each of them separately for non-overlapping holes
+    result = False
+    for index in edges_rtree.find_intersecting(
+        context.box_cls(point_x, box.max_x, point_y, point_y)
+    ):
+        edge = edges[index]
+        if context.segment_contains_point(edge, point):
+            return Location.BOUNDARY
+        if edge_crosses_ray(
+            edge.start, edge.end, point, context.angle_orientation
+        ):
+            result = not result
+    return Location.INTERIOR if result else Location.EXTERIOR
+
+
+def _to_area(signed_area: ScalarT, zero: ScalarT, /) -> ScalarT:
+    return -signed_area if signed_area < zero else signed_area
+
+
+def _to_segments_point_squared_distance(
+    point: Point[ScalarT],
+    edges: Sequence[Segment[ScalarT]],
+    edges_rtree: RTree[ScalarT],
+    context: Context[ScalarT],
+    /,
+) -> ScalarT:
+    edges_boxes = edges_rtree.boxes
+    candidates = edges_rtree.iter_nearest_to_point(point)
+    index = next(candidates)
+    result = context.segment_point_squared_distance(edges[index], point)
+    for index in candidates:
+        # boxes are visited in the order of non-decreasing distance,
+        # so none of the rest edges can be closer
+        if not (
+            context.box_point_squared_distance(edges_boxes[index], point)
+            < result
+        ):
+            break
+        distance = context.segment_point_squared_distance(edges[index], point)
+        if distance < result:
+            result = distance
+    return result
+
+
+def _to_segments_segment_squared_distance(
+    segment: Segment[ScalarT],
+    edges: Sequence[Segment[ScalarT]],
+    edges_rtree: RTree[ScalarT],
+    context: Context[ScalarT],
+    /,
+) -> ScalarT:
+    edges_boxes = edges_rtree.boxes
+    candidates = edges_rtree.iter_nearest_to_segment(segment)
+    index = next(candidates)
+    result = context.segments_squared_distance(edges[index], segment)
+    for index in candidates:
+        # boxes are visited in the order of non-decreasing distance,
+        # so none of the rest edges can be closer
+        if not (
+            context.box_segment_squared_distance(edges_boxes[index], segment)
+            < result
+        ):
+            break
+        distance = context.segments_squared_distance(edges[index], segment)
+        if distance < result:
+            result = distance
+    return result
@@ -327,6 +327,19 @@ class Context(HasRepr, Generic[ScalarT]):
         self._rotate_translate_point = rotate_translate_point
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            (
+                self._point_to_step is other._point_to_step
+                and self._rotate_point_around_origin
+                is other._rotate_point_around_origin
+                and self._rotate_translate_point
+                is other._rotate_translate_point
+            )
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
@@ -417,6 +417,13 @@ class Context(HasRepr, Generic[ScalarT]):
         self._scale_point = scale_point
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            self._scale_point is other._scale_point
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
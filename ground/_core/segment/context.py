@@ -214,6 +214,13 @@ class Context(HasRepr, Generic[ScalarT]):
         self._intersector = intersector
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            self._intersector is other._intersector
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
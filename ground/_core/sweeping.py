@@ -0,0 +1,678 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Container, Iterator, Sequence
+from fractions import Fraction
+from itertools import combinations
+from random import Random
+from typing import Any, Final, Generic
+
+from .angular.filtered.orientation import orientation as filtered_orientation
+from .enums import Orientation, Relation
+from .hints import Point, ScalarT, Segment
+from .segment.context import Context as SegmentContext
+from .vector.plain import cross
+
+STATUS_MAX_HEIGHT: Final[int] = 32
+
+
+def segments_cross_or_overlap(
+    segments: Sequence[Segment[ScalarT]],
+    orienteer: Callable[
+        [Point[ScalarT], Point[ScalarT], Point[ScalarT]], Orientation
+    ],
+    relater: Callable[[Segment[ScalarT], Segment[ScalarT]], Relation],
+    /,
+) -> bool:
+    lefts: list[Point[ScalarT]] = []
+    rights: list[Point[ScalarT]] = []
+    events: list[tuple[Point[ScalarT], bool, int]] = []
+    for index, segment in enumerate(segments):
+        start, end = segment.start, segment.end
+        if start == end:
+            raise ValueError(
+                'Segments should be non-degenerate, '
+                f'but found {segment!r} at index {index}.'
+            )
+        left, right = (start, end) if start < end else (end, start)
+        lefts.append(left)
+        rights.append(right)
+        # at the same point segments are removed before inserting new ones,
+        # so only touching segments do not get into the status together
+        events.extend(((left, True, index), (right, False, index)))
+    events.sort()
+    # status holds indices of segments which intersect the sweep line
+    # ordered from the bottom to the top,
+    # sweep line moves along lexicographically sorted endpoints
+    status = _Status()
+    nodes: list[_StatusNode | None] = [None] * len(segments)
+    is_below = _BelowChecker(segments, lefts, rights, orienteer, relater)
+    for point, is_left_event, index in events:
+        if is_left_event:
+            is_below.set_target(point, index)
+            node = status.insert(index, is_below)
+            if is_below.overlaps:
+                return True
+            nodes[index] = node
+            below, above = node.below, node.above
+            if (
+                below is not None
+                and _cross_or_overlap(
+                    segments[below.index], segments[index], relater
+                )
+            ) or (
+                above is not None
+                and _cross_or_overlap(
+                    segments[index], segments[above.index], relater
+                )
+            ):
+                return True
+        else:
+            removed_node = nodes[index]
+            assert removed_node is not None, index
+            below, above = removed_node.below, removed_node.above
+            status.remove(removed_node)
+            nodes[index] = None
+            if (
+                below is not None
+                and above is not None
+                and _cross_or_overlap(
+                    segments[below.index], segments[above.index], relater
+                )
+            ):
+                return True
+    return False
+
+
+def to_segments_intersections(
+    segments: Sequence[Segment[ScalarT]],
+    orienteer: Callable[
+        [Point[ScalarT], Point[ScalarT], Point[ScalarT]], Orientation
+    ],
+    relater: Callable[[Segment[ScalarT], Segment[ScalarT]], Relation],
+    intersector: Callable[
+        [Segment[ScalarT], Segment[ScalarT]], Point[ScalarT]
+    ],
+    /,
+) -> Iterator[tuple[int, int, Relation, Point[ScalarT]]]:
+    if not _has_float_coordinates(segments):
+        return _IntersectionsSweep(
+            segments, orienteer, relater, intersector
+        ).run()
+    # crossing points of segments with floating point coordinates
+    # are rounded, so the sweep line status can get out of order at them,
+    # to avoid this the sweep evaluates predicates exactly
+    # & crossing points as fractions
+    return _to_inexact_intersections(
+        segments,
+        _IntersectionsSweep(
+            segments,
+            _to_exact_orientation,
+            _to_exact_relation,
+            _to_exact_intersection,
+        ).run(),
+        relater,
+        intersector,
+    )
+
+
+class _BelowChecker(Generic[ScalarT]):
+    """
+    Checks if segment lies below the target one,
+    which is going to be inserted at the given point of it,
+    recording whether collinear segments overlap along the way.
+    """
+
+    overlaps: bool
+
+    __slots__ = (
+        '_index',
+        '_lefts',
+        '_orienteer',
+        '_passing',
+        '_point',
+        '_relater',
+        '_rights',
+        '_segments',
+        'overlaps',
+    )
+
+    def __init__(
+        self,
+        segments: Sequence[Segment[ScalarT]],
+        lefts: Sequence[Point[ScalarT]],
+        rights: Sequence[Point[ScalarT]],
+        orienteer: Callable[
+            [Point[ScalarT], Point[ScalarT], Point[ScalarT]], Orientation
+        ],
+        relater: Callable[[Segment[ScalarT], Segment[ScalarT]], Relation],
+        /,
+    ) -> None:
+        (
+            self._lefts,
+            self._orienteer,
+            self._relater,
+            self._rights,
+            self._segments,
+        ) = lefts, orienteer, relater, rights, segments
+
+    def is_strictly_below(self, other_index: int, /) -> bool:
+        """Checks if segment passes strictly below the point."""
+        return (
+            self._orienteer(
+                self._lefts[other_index],
+                self._rights[other_index],
+                self._point,
+            )
+            is Orientation.COUNTERCLOCKWISE
+        )
+
+    def set_point(self, point: Point[ScalarT], /) -> None:
+        self._point = point
+
+    def set_target(
+        self,
+        point: Point[ScalarT],
+        index: int,
+        passing: Container[int] = frozenset(),
+        /,
+    ) -> None:
+        """
+        Sets the target segment along with indices of segments
+        known to pass through the point
+        (it can be inexact, e.g. for floating point coordinates).
+        """
+        self._index, self._passing, self._point, self.overlaps = (
+            index,
+            passing,
+            point,
+            False,
+        )
+
+    def __call__(self, other_index: int, /) -> bool:
+        other_left, other_right = (
+            self._lefts[other_index],
+            self._rights[other_index],
+        )
+        orientation = (
+            Orientation.COLLINEAR
+            if other_index in self._passing
+            else self._orienteer(other_left, other_right, self._point)
+        )
+        if orientation is Orientation.COLLINEAR:
+            # the point lies on the other segment,
+            # so the order is determined by the right endpoint
+            orientation = self._orienteer(
+                other_left, other_right, self._rights[self._index]
+            )
+            if orientation is Orientation.COLLINEAR and _cross_or_overlap(
+                self._segments[other_index],
+                self._segments[self._index],
+                self._relater,
+            ):
+                self.overlaps = True
+        return orientation is Orientation.COUNTERCLOCKWISE
+
+
+class _IntersectionsSweep(Generic[ScalarT]):
+    """
+    Bentley-Ottmann sweep over segments.
+
+    Status holds indices of segments which intersect the sweep line
+    ordered from the bottom to the top,
+    sweep line moves along lexicographically sorted event points,
+    so only segments which become neighbours in it are checked
+    for crossings & segments passing through an event point
+    form a contiguous block of it.
+    """
+
+    __slots__ = (
+        '_checked',
+        '_crossings',
+        '_ends',
+        '_events',
+        '_intersector',
+        '_is_below',
+        '_lefts',
+        '_nodes',
+        '_orienteer',
+        '_queue',
+        '_relater',
+        '_reported',
+        '_rights',
+        '_segments',
+        '_status',
+    )
+
+    def __init__(
+        self,
+        segments: Sequence[Segment[ScalarT]],
+        orienteer: Callable[
+            [Point[ScalarT], Point[ScalarT], Point[ScalarT]], Orientation
+        ],
+        relater: Callable[[Segment[ScalarT], Segment[ScalarT]], Relation],
+        intersector: Callable[
+            [Segment[ScalarT], Segment[ScalarT]], Point[ScalarT]
+        ],
+        /,
+    ) -> None:
+        lefts: list[Point[ScalarT]] = []
+        rights: list[Point[ScalarT]] = []
+        # event points with indices of segments starting at them,
+        # crossings of segments are added as events during the sweep
+        events: dict[Point[ScalarT], list[int]] = {}
+        ends: dict[Point[ScalarT], list[int]] = {}
+        for index, segment in enumerate(segments):
+            start, end = segment.start, segment.end
+            if start == end:
+                raise ValueError(
+                    'Segments should be non-degenerate, '
+                    f'but found {segment!r} at index {index}.'
+                )
+            left, right = (start, end) if start < end else (end, start)
+            lefts.append(left)
+            rights.append(right)
+            events.setdefault(left, []).append(index)
+            events.setdefault(right, [])
+            ends.setdefault(right, []).append(index)
+        queue = list(events)
+        heapq.heapify(queue)
+        (
+            self._ends,
+            self._events,
+            self._intersector,
+            self._lefts,
+            self._orienteer,
+            self._queue,
+            self._relater,
+            self._rights,
+            self._segments,
+        ) = (
+            ends,
+            events,
+            intersector,
+            lefts,
+            orienteer,
+            queue,
+            relater,
+            rights,
+            segments,
+        )
+        self._checked: set[tuple[int, int]] = set()
+        # indices of segments found to cross at event points,
+        # computed crossing points can be inexact,
+        # so the segments are not required to pass through them exactly
+        self._crossings: dict[Point[ScalarT], list[int]] = {}
+        self._is_below = _BelowChecker(
+            segments, lefts, rights, orienteer, relater
+        )
+        self._nodes: list[_StatusNode | None] = [None] * len(segments)
+        self._reported: set[tuple[int, int]] = set()
+        self._status = _Status()
+
+    def run(self, /) -> Iterator[tuple[int, int, Relation, Point[ScalarT]]]:
+        queue = self._queue
+        while queue:
+            point = heapq.heappop(queue)
+            starting = self._events.pop(point)
+            ending = self._ends.pop(point, [])
+            crossing = self._crossings.pop(point, [])
+            if (
+                not (starting or ending)
+                and len(crossing) == 2
+                and self._swap_crossing(point, *crossing)
+            ):
+                # neighbours cross only at the point, so it is their first
+                # & the only common point
+                first_index, second_index = sorted(crossing)
+                pair = first_index, second_index
+                if pair not in self._reported:
+                    self._reported.add(pair)
+                    yield first_index, second_index, Relation.CROSS, point
+                continue
+            yield from self._process(point, starting, ending, crossing)
+
+    def _is_passing(
+        self, node: _StatusNode | None, point: Point[ScalarT], /
+    ) -> bool:
+        return (
+            node is not None
+            and self._orienteer(
+                self._lefts[node.index], self._rights[node.index], point
+            )
+            is Orientation.COLLINEAR
+        )
+
+    def _process(
+        self,
+        point: Point[ScalarT],
+        starting: list[int],
+        ending: list[int],
+        crossing: list[int],
+        /,
+    ) -> Iterator[tuple[int, int, Relation, Point[ScalarT]]]:
+        for index in ending:
+            self._remove(index)
+        passing = [index for index in crossing if self._remove(index)]
+        is_below = self._is_below
+        is_below.set_point(point)
+        lower = self._status.find(is_below.is_strictly_below)
+        node = lower.above
+        while node is not None and self._is_passing(node, point):
+            passing.append(node.index)
+            node = node.above
+            self._remove(passing[-1])
+        yield from self._to_new_intersections([*starting, *ending, *passing])
+        inserting = [*starting, *passing]
+        if not inserting:
+            above = lower.above
+            if lower.index >= 0 and above is not None:
+                self._push_crossing(lower.index, above.index, point)
+            return
+        nodes, status = self._nodes, self._status
+        passing_set = frozenset(passing)
+        for index in inserting:
+            is_below.set_target(point, index, passing_set)
+            nodes[index] = status.insert(index, is_below)
+        inserted = frozenset(inserting)
+        for index in inserting:
+            inserted_node = nodes[index]
+            assert inserted_node is not None, index
+            below, above = inserted_node.below, inserted_node.above
+            if below is not None and below.index not in inserted:
+                self._push_crossing(below.index, index, point)
+            if above is not None and above.index not in inserted:
+                self._push_crossing(index, above.index, point)
+
+    def _push_crossing(
+        self, below_index: int, above_index: int, point: Point[ScalarT], /
+    ) -> None:
+        # neighbours can be separated & become neighbours again
+        # before their crossing
+        pair = below_index, above_index
+        if pair in self._checked:
+            return
+        self._checked.add(pair)
+        below, above = (
+            self._segments[below_index],
+            self._segments[above_index],
+        )
+        # endpoints are events already,
+        # so only crossings in interiors of both segments add new ones
+        if self._relater(below, above) is not Relation.CROSS:
+            return
+        crossing = self._intersector(below, above)
+        if not crossing > point:
+            return
+        self._crossings.setdefault(crossing, []).extend(pair)
+        if crossing not in self._events:
+            self._events[crossing] = []
+            heapq.heappush(self._queue, crossing)
+
+    def _remove(self, index: int, /) -> bool:
+        node = self._nodes[index]
+        if node is None:
+            return False
+        self._status.remove(node)
+        self._nodes[index] = None
+        return True
+
+    def _swap_crossing(
+        self, point: Point[ScalarT], below_index: int, above_index: int, /
+    ) -> bool:
+        # the most common event is a crossing of neighbours only,
+        # which swaps them in place
+        nodes = self._nodes
+        below_node, above_node = nodes[below_index], nodes[above_index]
+        if (
+            below_node is None
+            or above_node is None
+            or below_node.above is not above_node
+            or self._is_passing(below_node.below, point)
+            or self._is_passing(above_node.above, point)
+        ):
+            return False
+        below_node.index, above_node.index = above_index, below_index
+        nodes[below_index], nodes[above_index] = above_node, below_node
+        lowest, highest = below_node.below, above_node.above
+        if lowest is not None:
+            self._push_crossing(lowest.index, above_index, point)
+        if highest is not None:
+            self._push_crossing(below_index, highest.index, point)
+        return True
+
+    def _to_new_intersections(
+        self, participants: Sequence[int], /
+    ) -> Iterator[tuple[int, int, Relation, Point[ScalarT]]]:
+        # segments overlapping each other pass through several points,
+        # so pairs are reported only at the first one
+        reported, segments = self._reported, self._segments
+        for first_index, second_index in combinations(participants, 2):
+            pair = (
+                (first_index, second_index)
+                if first_index < second_index
+                else (second_index, first_index)
+            )
+            if pair in reported:
+                continue
+            first, second = segments[pair[0]], segments[pair[1]]
+            relation = self._relater(first, second)
+            if relation is Relation.DISJOINT:
+                continue
+            reported.add(pair)
+            yield (*pair, relation, self._intersector(first, second))
+
+
+def _has_float_coordinates(segments: Sequence[Segment[Any]], /) -> bool:
+    return any(
+        isinstance(coordinate, float)
+        for segment in segments
+        for coordinate in (
+            segment.start.x,
+            segment.start.y,
+            segment.end.x,
+            segment.end.y,
+        )
+    )
+
+
+def _to_exact_intersection(
+    first: Segment[Any], second: Segment[Any], /
+) -> Point[Any]:
+    first_start, first_end, second_start, second_end = (
+        first.start,
+        first.end,
+        second.start,
+        second.end,
+    )
+    if _exact_contains(first_start, first_end, second_start):
+        return second_start
+    if _exact_contains(first_start, first_end, second_end):
+        return second_end
+    if _exact_contains(second_start, second_end, first_start):
+        return first_start
+    if _exact_contains(second_start, second_end, first_end):
+        return first_end
+    # endpoints are exact already,
+    # so only crossing points of interiors are evaluated in fractions
+    first_start, first_end, second_start, second_end = (
+        _to_exact_point(first_start),
+        _to_exact_point(first_end),
+        _to_exact_point(second_start),
+        _to_exact_point(second_end),
+    )
+    scale = cross.multiply(
+        first_start, second_start, second_start, second_end
+    ) / cross.multiply(first_start, first_end, second_start, second_end)
+    return type(first_start)(
+        first_start.x + (first_end.x - first_start.x) * scale,
+        first_start.y + (first_end.y - first_start.y) * scale,
+    )
+
+
+def _exact_contains(
+    start: Point[Any], end: Point[Any], point: Point[Any], /
+) -> bool:
+    return SegmentContext.containment_checker(
+        start, end, point, _to_exact_orientation
+    )
+
+
+def _to_exact_orientation(
+    vertex: Point[Any],
+    first_ray_point: Point[Any],
+    second_ray_point: Point[Any],
+    /,
+) -> Orientation:
+    return filtered_orientation(
+        vertex, first_ray_point, second_ray_point, cross.multiply, 0
+    )
+
+
+def _to_exact_point(point: Point[Any], /) -> Point[Any]:
+    return type(point)(Fraction(point.x), Fraction(point.y))
+
+
+def _to_exact_relation(
+    first: Segment[Any], second: Segment[Any], /
+) -> Relation:
+    return SegmentContext.relater(
+        first.start, first.end, second.start, second.end, _to_exact_orientation
+    )
+
+
+def _to_inexact_intersections(
+    segments: Sequence[Segment[ScalarT]],
+    exact_intersections: Iterator[tuple[int, int, Relation, Point[Any]]],
+    relater: Callable[[Segment[ScalarT], Segment[ScalarT]], Relation],
+    intersector: Callable[
+        [Segment[ScalarT], Segment[ScalarT]], Point[ScalarT]
+    ],
+    /,
+) -> Iterator[tuple[int, int, Relation, Point[ScalarT]]]:
+    # relations & intersection points are evaluated
+    # for the original segments like the rest of the context does
+    for first_index, second_index, _, _ in exact_intersections:
+        first, second = segments[first_index], segments[second_index]
+        relation = relater(first, second)
+        if relation is not Relation.DISJOINT:
+            yield (
+                first_index,
+                second_index,
+                relation,
+                intersector(first, second),
+            )
+
+
+def _cross_or_overlap(
+    first: Segment[ScalarT],
+    second: Segment[ScalarT],
+    relater: Callable[[Segment[ScalarT], Segment[ScalarT]], Relation],
+    /,
+) -> bool:
+    relation = relater(first, second)
+    return relation is not Relation.DISJOINT and relation is not Relation.TOUCH
+
+
+class _StatusNode:
+    """Node of a skip list which holds index of a segment."""
+
+    @property
+    def above(self, /) -> _StatusNode | None:
+        return self.nexts[0]
+
+    @property
+    def below(self, /) -> _StatusNode | None:
+        result = self.previouses[0]
+        return None if result is None or result.index < 0 else result
+
+    index: int
+    nexts: list[_StatusNode | None]
+    previouses: list[_StatusNode | None]
+
+    __slots__ = 'index', 'nexts', 'previouses'
+
+    def __init__(self, index: int, height: int, /) -> None:
+        self.index, self.nexts, self.previouses = (
+            index,
+            [None] * height,
+            [None] * height,
+        )
+
+
+class _Status:
+    """
+    Sweep line status as a skip list of indices of segments
+    with expected logarithmic insertion & constant removal by node.
+    """
+
+    __slots__ = '_head', '_height', '_random'
+
+    def __init__(self, /) -> None:
+        # head is a sentinel with negative index
+        self._head = _StatusNode(-1, STATUS_MAX_HEIGHT)
+        self._height = 1
+        # fixed seed keeps runs reproducible
+        self._random = Random(0)
+
+    def find(self, is_below: Callable[[int], bool], /) -> _StatusNode:
+        """
+        Returns the topmost node which index of a segment
+        satisfies the predicate (it should hold for a prefix of the status)
+        or the head if there is no such.
+        """
+        node = self._head
+        for level in reversed(range(self._height)):
+            while (candidate := node.nexts[level]) is not None and is_below(
+                candidate.index
+            ):
+                node = candidate
+        return node
+
+    def insert(
+        self, index: int, is_below: Callable[[int], bool], /
+    ) -> _StatusNode:
+        """
+        Inserts index of a segment above all the segments
+        which indices satisfy the predicate
+        (it should hold for a prefix of the status).
+        """
+        head = self._head
+        updates: list[_StatusNode] = [head] * STATUS_MAX_HEIGHT
+        node = head
+        for level in reversed(range(self._height)):
+            while (candidate := node.nexts[level]) is not None and is_below(
+                candidate.index
+            ):
+                node = candidate
+            updates[level] = node
+        height = self._to_height()
+        if height > self._height:
+            self._height = height
+        result = _StatusNode(index, height)
+        for level in range(height):
+            previous = updates[level]
+            next_ = previous.nexts[level]
+            result.nexts[level], result.previouses[level] = next_, previous
+            previous.nexts[level] = result
+            if next_ is not None:
+                next_.previouses[level] = result
+        return result
+
+    def remove(self, node: _StatusNode, /) -> None:
+        for level, (previous, next_) in enumerate(
+            zip(node.previouses, node.nexts, strict=True)
+        ):
+            assert previous is not None, node
+            previous.nexts[level] = next_
+            if next_ is not None:
+                next_.previouses[level] = previous
+
+    def _to_height(self, /) -> int:
+        # geometric distribution with ratio 1/2
+        bits = self._random.getrandbits(STATUS_MAX_HEIGHT - 1)
+        result = 1
+        while bits & 1:
+            bits >>= 1
+            result += 1
+        return result
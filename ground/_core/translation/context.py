@@ -150,6 +150,13 @@ class Context(HasRepr, Generic[ScalarT]):
         self._translate_point = translate_point
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            self._translate_point is other._translate_point
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
@@ -34,6 +34,16 @@ class Context(HasRepr, Generic[ScalarT]):
         self._cross_product, self._dot_product = cross_product, dot_product
         return self
 
+    def __eq__(self, other: Any, /) -> Any:
+        return (
+            (
+                self._cross_product is other._cross_product
+                and self._dot_product is other._dot_product
+            )
+            if isinstance(other, Context)
+            else NotImplemented
+        )
+
     __repr__ = generate_repr(
         __new__,
         argument_serializer=serializers.complex_,
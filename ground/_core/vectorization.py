@@ -0,0 +1,86 @@
+import math
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from operator import attrgetter
+from typing import Any
+
+import numpy
+from numpy.typing import NDArray
+
+from .arrays import to_contours_coordinates, to_coordinates
+from .hints import Contour, Point, ScalarFactory, ScalarT, SquareRooter
+
+
+def to_contours_edges_arrays(
+    contours: Iterable[Contour[ScalarT]],
+    coordinate_factory: ScalarFactory[ScalarT],
+    /,
+) -> tuple[NDArray[Any], NDArray[Any]]:
+    starts, ends = [], []
+    for contour in contours:
+        vertices = to_points_array(contour.vertices, coordinate_factory)
+        starts.append(numpy.roll(vertices, 1, axis=0))
+        ends.append(vertices)
+    return numpy.concatenate(starts), numpy.concatenate(ends)
+
+
+def to_flat_contours_edges_arrays(
+    contours: Sequence[Contour[ScalarT]],
+    coordinate_factory: ScalarFactory[ScalarT],
+    /,
+) -> tuple[NDArray[Any], NDArray[Any], NDArray[numpy.intp]]:
+    # edges of the contours are built from their flattened vertices,
+    # so their arrays are constructed at once
+    # instead of being concatenated from per-contour arrays,
+    # offsets of the first edge of each contour are returned as well
+    xs, ys, offsets = to_contours_coordinates(contours)
+    ends = numpy.empty(
+        (len(xs), 2),
+        dtype=numpy.float64 if coordinate_factory is float else object,
+    )
+    ends[:, 0], ends[:, 1] = xs, ys
+    offsets_array = numpy.asarray(offsets, dtype=numpy.intp)
+    starts_indices = numpy.arange(-1, len(xs) - 1, dtype=numpy.intp)
+    starts_indices[offsets_array[:-1]] = offsets_array[1:] - 1
+    return ends[starts_indices], ends, offsets_array[:-1]
+
+
+def to_offsets(sizes: Sequence[int], /) -> NDArray[numpy.intp]:
+    # offsets of consecutive segments with given sizes
+    # in their concatenation
+    result = numpy.zeros(len(sizes), dtype=numpy.intp)
+    numpy.cumsum(sizes[:-1], out=result[1:])
+    return result
+
+
+def to_points_array(
+    points: Sequence[Point[ScalarT]],
+    coordinate_factory: ScalarFactory[ScalarT],
+    /,
+) -> NDArray[Any]:
+    coordinates = to_coordinates(points)
+    if coordinates is not None:
+        return numpy.asarray(coordinates, dtype=numpy.float64).reshape(-1, 2)
+    # coordinates of types other than ``float`` are kept as Python objects,
+    # so the arithmetic stays exact while loops are run by NumPy
+    return numpy.fromiter(
+        chain.from_iterable(map(attrgetter('x', 'y'), points)),
+        dtype=numpy.float64 if coordinate_factory is float else object,
+        count=2 * len(points),
+    ).reshape(-1, 2)
+
+
+def to_scalar(value: Any, /) -> Any:
+    return value.item() if isinstance(value, numpy.generic) else value
+
+
+def to_square_roots(
+    values: NDArray[Any], sqrt: SquareRooter[ScalarT], /
+) -> NDArray[Any]:
+    if values.dtype == numpy.float64:
+        return (
+            numpy.sqrt(values)
+            if sqrt is math.sqrt
+            else numpy.fromiter(map(sqrt, values), dtype=numpy.float64)
+        )
+    return numpy.fromiter(map(sqrt, values), dtype=object)
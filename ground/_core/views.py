@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Final, Generic, overload
+
+from reprit.base import generate_repr
+from typing_extensions import Self
+
+import ground
+
+from .affine import AffineTransform, transform_point
+from .hints import (
+    Box,
+    Contour,
+    Multipoint,
+    Multipolygon,
+    Point,
+    Polygon,
+    ScalarT,
+)
+
+MODULE_NAME: Final[str] = f'{ground.__name__}.views'
+
+
+class PointsView(Sequence[Point[ScalarT]]):
+    """
+    **PointsView** is a sequence of points of the source sequence
+    mapped by an affine transform, each point is transformed on access.
+
+    >>> import math
+    >>> from fractions import Fraction
+    >>> from ground.affine import AffineTransform
+    >>> from ground.context import Context
+    >>> from ground.views import PointsView
+    >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+    >>> Point = context.point_cls
+    >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+    >>> points = PointsView(
+    ...     [Point(0, 0), Point(1, 0)],
+    ...     identity.translated(1, 1),
+    ...     point_cls=Point,
+    ... )
+    >>> len(points)
+    2
+    >>> points[1] == Point(2, 1)
+    True
+    >>> list(points) == [Point(1, 1), Point(2, 1)]
+    True
+    """
+
+    @property
+    def point_cls(self, /) -> type[Point[ScalarT]]:
+        """Returns type of points."""
+        return self._point_cls
+
+    @property
+    def source(self, /) -> Sequence[Point[ScalarT]]:
+        """Returns points to transform."""
+        return self._source
+
+    @property
+    def transform(self, /) -> AffineTransform[ScalarT]:
+        """Returns transform of points."""
+        return self._transform
+
+    _point_cls: type[Point[ScalarT]]
+    _source: Sequence[Point[ScalarT]]
+    _transform: AffineTransform[ScalarT]
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_point_cls', '_source', '_transform'
+
+    def __new__(
+        cls,
+        source: Sequence[Point[ScalarT]],
+        transform: AffineTransform[ScalarT],
+        /,
+        *,
+        point_cls: type[Point[ScalarT]],
+    ) -> Self:
+        self = super().__new__(cls)
+        self._point_cls, self._source, self._transform = (
+            point_cls,
+            source,
+            transform,
+        )
+        return self
+
+    @overload
+    def __getitem__(self, index: int, /) -> Point[ScalarT]: ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> Self: ...
+
+    def __getitem__(self, index: int | slice, /) -> Point[ScalarT] | Self:
+        return (
+            type(self)(
+                self._source[index], self._transform, point_cls=self._point_cls
+            )
+            if isinstance(index, slice)
+            else transform_point(
+                self._source[index], self._transform, self._point_cls
+            )
+        )
+
+    def __iter__(self, /) -> Iterator[Point[ScalarT]]:
+        transform, point_cls = self._transform, self._point_cls
+        for point in self._source:
+            yield transform_point(point, transform, point_cls)
+
+    def __len__(self, /) -> int:
+        return len(self._source)
+
+    __repr__ = generate_repr(__new__, with_module_name=True)
+
+
+class ContourView(Generic[ScalarT]):
+    """
+    **ContourView** is a contour mapped by a non-degenerate affine transform
+    which vertices are transformed on access.
+
+    Boxes, signed areas & centroids of views
+    are evaluated by ``ground.context.Context`` from the source contour
+    without transforming its vertices where possible.
+    """
+
+    @property
+    def source(self, /) -> Contour[ScalarT]:
+        """Returns contour to transform."""
+        return self._source
+
+    @property
+    def transform(self, /) -> AffineTransform[ScalarT]:
+        """Returns transform of the contour."""
+        return self._transform
+
+    @property
+    def vertices(self, /) -> PointsView[ScalarT]:
+        """Returns transformed vertices of the contour."""
+        return PointsView(
+            self._source.vertices, self._transform, point_cls=self._point_cls
+        )
+
+    _point_cls: type[Point[ScalarT]]
+    _source: Contour[ScalarT]
+    _transform: AffineTransform[ScalarT]
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_point_cls', '_source', '_transform'
+
+    def __new__(
+        cls,
+        source: Contour[ScalarT],
+        transform: AffineTransform[ScalarT],
+        /,
+        *,
+        point_cls: type[Point[ScalarT]],
+    ) -> Self:
+        if transform.is_degenerate:
+            raise ValueError(
+                'Transform of a contour view should be non-degenerate, '
+                f'but found {transform!r}.'
+            )
+        self = super().__new__(cls)
+        self._point_cls, self._source, self._transform = (
+            point_cls,
+            source,
+            transform,
+        )
+        return self
+
+    __repr__ = generate_repr(__new__, with_module_name=True)
+
+
+class MultipointView(Generic[ScalarT]):
+    """
+    **MultipointView** is a multipoint mapped by a non-degenerate
+    affine transform which points are transformed on access.
+    """
+
+    @property
+    def points(self, /) -> PointsView[ScalarT]:
+        """Returns transformed points of the multipoint."""
+        return PointsView(
+            self._source.points, self._transform, point_cls=self._point_cls
+        )
+
+    @property
+    def source(self, /) -> Multipoint[ScalarT]:
+        """Returns multipoint to transform."""
+        return self._source
+
+    @property
+    def transform(self, /) -> AffineTransform[ScalarT]:
+        """Returns transform of the multipoint."""
+        return self._transform
+
+    _point_cls: type[Point[ScalarT]]
+    _source: Multipoint[ScalarT]
+    _transform: AffineTransform[ScalarT]
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_point_cls', '_source', '_transform'
+
+    def __new__(
+        cls,
+        source: Multipoint[ScalarT],
+        transform: AffineTransform[ScalarT],
+        /,
+        *,
+        point_cls: type[Point[ScalarT]],
+    ) -> Self:
+        if transform.is_degenerate:
+            raise ValueError(
+                'Transform of a multipoint view should be non-degenerate, '
+                f'but found {transform!r}.'
+            )
+        self = super().__new__(cls)
+        self._point_cls, self._source, self._transform = (
+            point_cls,
+            source,
+            transform,
+        )
+        return self
+
+    __repr__ = generate_repr(__new__, with_module_name=True)
+
+
+class MultipolygonView(Generic[ScalarT]):
+    """
+    **MultipolygonView** is a multipolygon mapped
+    by a non-degenerate affine transform
+    which polygons are views of the source ones.
+    """
+
+    @property
+    def polygons(self, /) -> Sequence[PolygonView[ScalarT]]:
+        """Returns views of the polygons of the multipolygon."""
+        return [
+            PolygonView(polygon, self._transform, point_cls=self._point_cls)
+            for polygon in self._source.polygons
+        ]
+
+    @property
+    def source(self, /) -> Multipolygon[ScalarT]:
+        """Returns multipolygon to transform."""
+        return self._source
+
+    @property
+    def transform(self, /) -> AffineTransform[ScalarT]:
+        """Returns transform of the multipolygon."""
+        return self._transform
+
+    _point_cls: type[Point[ScalarT]]
+    _source: Multipolygon[ScalarT]
+    _transform: AffineTransform[ScalarT]
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_point_cls', '_source', '_transform'
+
+    def __new__(
+        cls,
+        source: Multipolygon[ScalarT],
+        transform: AffineTransform[ScalarT],
+        /,
+        *,
+        point_cls: type[Point[ScalarT]],
+    ) -> Self:
+        if transform.is_degenerate:
+            raise ValueError(
+                'Transform of a multipolygon view should be non-degenerate, '
+                f'but found {transform!r}.'
+            )
+        self = super().__new__(cls)
+        self._point_cls, self._source, self._transform = (
+            point_cls,
+            source,
+            transform,
+        )
+        return self
+
+    __repr__ = generate_repr(__new__, with_module_name=True)
+
+
+class PolygonView(Generic[ScalarT]):
+    """
+    **PolygonView** is a polygon mapped by a non-degenerate affine transform
+    which border & holes are views of the source ones.
+    """
+
+    @property
+    def border(self, /) -> ContourView[ScalarT]:
+        """Returns view of the border of the polygon."""
+        return ContourView(
+            self._source.border, self._transform, point_cls=self._point_cls
+        )
+
+    @property
+    def holes(self, /) -> Sequence[ContourView[ScalarT]]:
+        """Returns views of the holes of the polygon."""
+        return to_contours_views(
+            self._source.holes, self._transform, self._point_cls
+        )
+
+    @property
+    def source(self, /) -> Polygon[ScalarT]:
+        """Returns polygon to transform."""
+        return self._source
+
+    @property
+    def transform(self, /) -> AffineTransform[ScalarT]:
+        """Returns transform of the polygon."""
+        return self._transform
+
+    _point_cls: type[Point[ScalarT]]
+    _source: Polygon[ScalarT]
+    _transform: AffineTransform[ScalarT]
+
+    __module__: str = MODULE_NAME
+    __slots__ = '_point_cls', '_source', '_transform'
+
+    def __new__(
+        cls,
+        source: Polygon[ScalarT],
+        transform: AffineTransform[ScalarT],
+        /,
+        *,
+        point_cls: type[Point[ScalarT]],
+    ) -> Self:
+        if transform.is_degenerate:
+            raise ValueError(
+                'Transform of a polygon view should be non-degenerate, '
+                f'but found {transform!r}.'
+            )
+        self = super().__new__(cls)
+        self._point_cls, self._source, self._transform = (
+            point_cls,
+            source,
+            transform,
+        )
+        return self
+
+    __repr__ = generate_repr(__new__, with_module_name=True)
+
+
+def to_contours_views(
+    contours: Iterable[Contour[ScalarT]],
+    transform: AffineTransform[ScalarT],
+    point_cls: type[Point[ScalarT]],
+    /,
+) -> list[ContourView[ScalarT]]:
+    return [
+        ContourView(contour, transform, point_cls=point_cls)
+        for contour in contours
+    ]
+
+
+def to_points_box(
+    points: Iterable[Point[ScalarT]],
+    transform: AffineTransform[ScalarT],
+    box_cls: type[Box[ScalarT]],
+    /,
+) -> Box[ScalarT]:
+    xx, xy, yx, yy = transform.xx, transform.xy, transform.yx, transform.yy
+    iterator = iter(points)
+    point = next(iterator)
+    min_x = max_x = xx * point.x + xy * point.y
+    min_y = max_y = yx * point.x + yy * point.y
+    for point in iterator:
+        x, y = xx * point.x + xy * point.y, yx * point.x + yy * point.y
+        if x < min_x:
+            min_x = x
+        elif max_x < x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif max_y < y:
+            max_y = y
+    step_x, step_y = transform.step_x, transform.step_y
+    return box_cls(
+        min_x + step_x, max_x + step_x, min_y + step_y, max_y + step_y
+    )
+
+
+def is_box_preserving(transform: AffineTransform[Any], /) -> bool:
+    # each of the image coordinates depends on a single source coordinate,
+    # so extents of the image are images of the source extents
+    return (not transform.xx or not transform.xy) and (
+        not transform.yx or not transform.yy
+    )
+
+
+def transform_box(
+    box: Box[ScalarT],
+    transform: AffineTransform[ScalarT],
+    box_cls: type[Box[ScalarT]],
+    /,
+) -> Box[ScalarT]:
+    first_x, second_x = (
+        transform.xx * box.min_x + transform.xy * box.min_y,
+        transform.xx * box.max_x + transform.xy * box.max_y,
+    )
+    first_y, second_y = (
+        transform.yx * box.min_x + transform.yy * box.min_y,
+        transform.yx * box.max_x + transform.yy * box.max_y,
+    )
+    min_x, max_x = (
+        (first_x, second_x) if first_x < second_x else (second_x, first_x)
+    )
+    min_y, max_y = (
+        (first_y, second_y) if first_y < second_y else (second_y, first_y)
+    )
+    step_x, step_y = transform.step_x, transform.step_y
+    return box_cls(
+        min_x + step_x, max_x + step_x, min_y + step_y, max_y + step_y
+    )
@@ -0,0 +1,5 @@
+from ._core import affine as _affine
+
+AffineTransform = _affine.AffineTransform
+
+assert AffineTransform.__module__ == __name__
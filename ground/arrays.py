@@ -0,0 +1,5 @@
+from ._core import arrays as _arrays
+
+PointArray = _arrays.PointArray
+
+assert PointArray.__module__ == __name__
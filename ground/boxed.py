@@ -0,0 +1,5 @@
+from ._core import boxed as _boxed
+
+BoxAccumulator = _boxed.BoxAccumulator
+
+assert BoxAccumulator.__module__ == __name__
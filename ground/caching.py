@@ -0,0 +1,5 @@
+from ._core import caching as _caching
+
+CachedContext = _caching.CachedContext
+
+assert CachedContext.__module__ == __name__
@@ -1,27 +1,41 @@
 from __future__ import annotations
 
-from collections.abc import Callable as _Callable, Sequence as _Sequence
+from array import array as _array
+from collections.abc import (
+    Callable as _Callable,
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    Sequence as _Sequence,
+)
+from concurrent.futures import Executor as _Executor
+from functools import partial as _partial
 from typing import Any as _Any, Generic as _Generic, final as _final
 
 from reprit import serializers as _serializers
 from reprit.base import generate_repr as _generate_repr
-from typing_extensions import Self as _Self
+from typing_extensions import Buffer as _Buffer, Self as _Self
 
 from ._core import (
+    affine as _affine,
     angular as _angular,
     boxed as _boxed,
     centroidal as _centroidal,
     circular as _circular,
     discrete as _discrete,
     geometries as _geometries,
+    indexing as _indexing,
     measured as _measured,
     metric as _metric,
+    prepared as _prepared,
     rotation as _rotation,
     scaling as _scaling,
     segment as _segment,
+    sweeping as _sweeping,
     translation as _translation,
     vector as _vector,
+    views as _views,
 )
+from ._core.affine import AffineTransform as _AffineTransform
 from ._core.enums import (
     Kind as _Kind,
     Location as _Location,
@@ -55,11 +69,26 @@ from .hints import (
 class Context(_HasRepr, _Generic[_ScalarT]):
     """Represents common language for computational geometry."""
 
+    @property
+    def angular_context(self, /) -> _angular.Context[_ScalarT]:
+        """Returns context of angles-related predicates."""
+        return self._angular_context
+
     @property
     def box_cls(self, /) -> type[_Box[_ScalarT]]:
         """Returns type of boxes."""
         return self._box_cls
 
+    @property
+    def centroidal_context(self, /) -> _centroidal.Context[_ScalarT]:
+        """Returns context of centroids evaluation."""
+        return self._centroidal_context
+
+    @property
+    def circular_context(self, /) -> _circular.Context[_ScalarT]:
+        """Returns context of circles-related predicates."""
+        return self._circular_context
+
     @property
     def contour_cls(self, /) -> type[_Contour[_ScalarT]]:
         """Returns type of contours."""
@@ -140,6 +169,16 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         """Returns type of empty geometries."""
         return self._empty_cls
 
+    @property
+    def measured_context(self, /) -> _measured.Context[_ScalarT]:
+        """Returns context of measures evaluation."""
+        return self._measured_context
+
+    @property
+    def metric_context(self, /) -> _metric.Context[_ScalarT]:
+        """Returns context of distances evaluation."""
+        return self._metric_context
+
     @property
     def mix_cls(self, /) -> type[_Mix[_ScalarT]]:
         """Returns type of mixes."""
@@ -199,16 +238,41 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         """Returns type of polygons."""
         return self._polygon_cls
 
+    @property
+    def rotation_context(self, /) -> _rotation.Context[_ScalarT]:
+        """Returns context of rotations of geometries."""
+        return self._rotation_context
+
+    @property
+    def scaling_context(self, /) -> _scaling.Context[_ScalarT]:
+        """Returns context of scaling of geometries."""
+        return self._scaling_context
+
     @property
     def segment_cls(self, /) -> type[_Segment[_ScalarT]]:
         """Returns type of segments."""
         return self._segment_cls
 
+    @property
+    def segment_context(self, /) -> _segment.Context[_ScalarT]:
+        """Returns context of segments-related predicates."""
+        return self._segment_context
+
     @property
     def sqrt(self, /) -> _SquareRooter[_ScalarT]:
         """Returns function for computing square root."""
         return self._sqrt
 
+    @property
+    def translation_context(self, /) -> _translation.Context[_ScalarT]:
+        """Returns context of translations of geometries."""
+        return self._translation_context
+
+    @property
+    def vector_context(self, /) -> _vector.Context[_ScalarT]:
+        """Returns context of vectors products."""
+        return self._vector_context
+
     @property
     def zero(self, /) -> _ScalarT:
         """Returns zero."""
@@ -310,6 +374,92 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             self._zero,
         )
 
+    def angle_orientations(
+        self,
+        vertices: _Sequence[_Point[_ScalarT]] | _Buffer,
+        first_ray_points: _Sequence[_Point[_ScalarT]] | _Buffer,
+        second_ray_points: _Sequence[_Point[_ScalarT]] | _Buffer,
+        /,
+    ) -> _array[int]:
+        """
+        Returns orientations of angles
+        given their vertices and ray points in parallel sequences.
+
+        Sequences should be either all of points or all buffers
+        with interleaved ``float`` coordinates,
+        orientations are returned as signed bytes
+        equal to the corresponding ``Orientation`` values.
+
+        Time complexity:
+            ``O(len(vertices))``
+        Memory complexity:
+            ``O(len(vertices))``
+
+        >>> from array import array
+        >>> from ground.enums import Orientation
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Point = context.point_cls
+        >>> context.angle_orientations(
+        ...     [Point(0, 0), Point(0, 0), Point(0, 0)],
+        ...     [Point(0, 1), Point(1, 0), Point(1, 0)],
+        ...     [Point(1, 0), Point(1, 0), Point(0, 1)],
+        ... ) == array(
+        ...     'b',
+        ...     [
+        ...         Orientation.CLOCKWISE,
+        ...         Orientation.COLLINEAR,
+        ...         Orientation.COUNTERCLOCKWISE,
+        ...     ],
+        ... )
+        True
+        >>> context.angle_orientations(
+        ...     array('d', [0, 0, 0, 0, 0, 0]),
+        ...     array('d', [0, 1, 1, 0, 1, 0]),
+        ...     array('d', [1, 0, 1, 0, 0, 1]),
+        ... ) == array(
+        ...     'b',
+        ...     [
+        ...         Orientation.CLOCKWISE,
+        ...         Orientation.COLLINEAR,
+        ...         Orientation.COUNTERCLOCKWISE,
+        ...     ],
+        ... )
+        True
+        """
+        return self._angular_context.orientations(
+            vertices,
+            first_ray_points,
+            second_ray_points,
+            self._vector_context.cross_product,
+            self._zero,
+        )
+
+    def box_accumulator(self, /) -> _boxed.BoxAccumulator[_ScalarT]:
+        """
+        Constructs empty accumulator of boxes of geometries
+        added one at a time.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box, Point = context.box_cls, context.point_cls
+        >>> accumulator = context.box_accumulator()
+        >>> for point in [Point(0, 1), Point(2, 0), Point(1, 3)]:
+        ...     accumulator.add_point(point)
+        >>> accumulator.to_box() == Box(0, 2, 0, 3)
+        True
+        """
+        return _boxed.BoxAccumulator(box_cls=self._box_cls)
+
     def box_point_squared_distance(
         self, box: _Box[_ScalarT], point: _Point[_ScalarT], /
     ) -> _ScalarT:
@@ -383,6 +533,42 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             self._point_cls,
         )
 
+    def boxes_rtree(
+        self, boxes: _Sequence[_Box[_ScalarT]], /
+    ) -> _indexing.RTree[_ScalarT]:
+        """
+        Constructs static R-tree spatial index over boxes.
+
+        Time complexity:
+            ``O(len(boxes) * log len(boxes))``
+        Memory complexity:
+            ``O(len(boxes))``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box, Point = context.box_cls, context.point_cls
+        >>> Segment = context.segment_cls
+        >>> tree = context.boxes_rtree(
+        ...     [Box(0, 1, 0, 1), Box(1, 2, 1, 2), Box(3, 4, 3, 4)]
+        ... )
+        >>> tree.find_intersecting(Box(1, 3, 0, 1))
+        [0, 1]
+        >>> tree.find_n_nearest_to_point(2, Point(5, 5))
+        [2, 1]
+        >>> tree.find_n_nearest_to_segment(
+        ...     1, Segment(Point(0, 2), Point(1, 3))
+        ... )
+        [1]
+        """
+        return _indexing.RTree(
+            boxes,
+            box_cls=self._box_cls,
+            box_point_squared_metric=self.box_point_squared_distance,
+            box_segment_squared_metric=self.box_segment_squared_distance,
+        )
+
     def contour_box(self, contour: _Contour[_ScalarT], /) -> _Box[_ScalarT]:
         """
         Constructs box from contour.
@@ -413,6 +599,17 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         ... )
         True
         """
+        if isinstance(contour, _views.ContourView):
+            transform = contour.transform
+            return (
+                _views.transform_box(
+                    self.contour_box(contour.source), transform, self._box_cls
+                )
+                if _views.is_box_preserving(transform)
+                else _views.to_points_box(
+                    contour.source.vertices, transform, self._box_cls
+                )
+            )
         return _boxed.from_contour(contour, self._box_cls)
 
     def contour_centroid(
@@ -526,6 +723,49 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             for index in range(len(vertices) - 1)
         ] + [segment_cls(vertices[-1], vertices[0])]
 
+    def contour_view(
+        self,
+        contour: _Contour[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> _views.ContourView[_ScalarT]:
+        """
+        Returns view of contour transformed by given affine transform
+        which vertices are transformed on access.
+
+        Raises ``ValueError`` if the transform is degenerate.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box, Contour, Point = (
+        ...     context.box_cls,
+        ...     context.contour_cls,
+        ...     context.point_cls,
+        ... )
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> view = context.contour_view(
+        ...     Contour([Point(0, 0), Point(1, 0), Point(0, 1)]),
+        ...     identity.scaled(2, 3).translated(1, 1),
+        ... )
+        >>> list(view.vertices) == [Point(1, 1), Point(3, 1), Point(1, 4)]
+        True
+        >>> context.contour_box(view) == Box(1, 3, 1, 4)
+        True
+        >>> context.region_signed_area(view) == 3
+        True
+        """
+        return _views.ContourView(
+            contour, transform, point_cls=self._point_cls
+        )
+
     def contours_box(
         self, contours: _Sequence[_Contour[_ScalarT]], /
     ) -> _Box[_ScalarT]:
@@ -643,6 +883,130 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             point, first, second, third, self._zero
         )
 
+    def locate_point_in_polygon(
+        self, point: _Point[_ScalarT], polygon: _Polygon[_ScalarT], /
+    ) -> _Location:
+        """
+        Returns location of point in polygon.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(1)``
+
+        where ``vertices_count = len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)``.
+
+        >>> from ground.enums import Location
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> polygon = Polygon(
+        ...     Contour([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)]),
+        ...     [Contour([Point(1, 1), Point(1, 3), Point(3, 3),
+        ...               Point(3, 1)])],
+        ... )
+        >>> (
+        ...     context.locate_point_in_polygon(Point(0, 2), polygon)
+        ...     is Location.BOUNDARY
+        ... )
+        True
+        >>> (
+        ...     context.locate_point_in_polygon(Point(2, 2), polygon)
+        ...     is Location.EXTERIOR
+        ... )
+        True
+        >>> (
+        ...     context.locate_point_in_polygon(Point(3, 2), polygon)
+        ...     is Location.BOUNDARY
+        ... )
+        True
+        >>> (
+        ...     context.locate_point_in_polygon(Point(4, 2), polygon)
+        ...     is Location.BOUNDARY
+        ... )
+        True
+        >>> (
+        ...     context.locate_point_in_polygon(Point(5, 2), polygon)
+        ...     is Location.EXTERIOR
+        ... )
+        True
+        >>> (
+        ...     context.locate_point_in_polygon(
+        ...         Point(Fraction(1, 2), 2), polygon
+        ...     )
+        ...     is Location.INTERIOR
+        ... )
+        True
+        """
+        location_in_border = self.locate_point_in_region(point, polygon.border)
+        if location_in_border is not _Location.INTERIOR:
+            return location_in_border
+        for hole in polygon.holes:
+            location_in_hole = self.locate_point_in_region(point, hole)
+            if location_in_hole is _Location.INTERIOR:
+                return _Location.EXTERIOR
+            if location_in_hole is _Location.BOUNDARY:
+                return _Location.BOUNDARY
+        return _Location.INTERIOR
+
+    def locate_point_in_region(
+        self, point: _Point[_ScalarT], contour: _Contour[_ScalarT], /
+    ) -> _Location:
+        """
+        Returns location of point in region given its contour.
+
+        Time complexity:
+            ``O(len(contour.vertices))``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from ground.enums import Location
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> contour = Contour(
+        ...     [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)]
+        ... )
+        >>> (
+        ...     context.locate_point_in_region(Point(1, 1), contour)
+        ...     is Location.INTERIOR
+        ... )
+        True
+        >>> (
+        ...     context.locate_point_in_region(Point(2, 1), contour)
+        ...     is Location.BOUNDARY
+        ... )
+        True
+        >>> (
+        ...     context.locate_point_in_region(Point(3, 1), contour)
+        ...     is Location.EXTERIOR
+        ... )
+        True
+        """
+        containment_checker, orienteer = (
+            self._segment_context.containment_checker,
+            self.angle_orientation,
+        )
+        vertices = contour.vertices
+        # parity of edges crossed by the horizontal ray from the point
+        # to the right determines whether the point is inside
+        result, start = False, vertices[-1]
+        for end in vertices:
+            if containment_checker(start, end, point, orienteer):
+                return _Location.BOUNDARY
+            if _prepared.edge_crosses_ray(start, end, point, orienteer):
+                result = not result
+            start = end
+        return _Location.INTERIOR if result else _Location.EXTERIOR
+
     def merged_box(
         self, first_box: _Box[_ScalarT], second_box: _Box[_ScalarT], /
     ) -> _Box[_ScalarT]:
@@ -672,6 +1036,41 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             max(first_box.max_y, second_box.max_y),
         )
 
+    def merged_convex_hull(
+        self,
+        first_hull: _Sequence[_Point[_ScalarT]],
+        second_hull: _Sequence[_Point[_ScalarT]],
+        /,
+    ) -> _Sequence[_Point[_ScalarT]]:
+        """
+        Merges two convex hulls (e.g. ones of different chunks of points)
+        into the convex hull of their union.
+
+        Time complexity:
+            ``O(vertices_count * log(vertices_count))``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = len(first_hull) + len(second_hull)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Point = context.point_cls
+        >>> (
+        ...     context.merged_convex_hull(
+        ...         [Point(0, 0), Point(1, 0), Point(0, 1)],
+        ...         [Point(2, 0), Point(2, 2), Point(1, 1)],
+        ...     )
+        ...     == [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 1)]
+        ... )
+        True
+        """
+        return _discrete.to_convex_hull(
+            [*first_hull, *second_hull], self.angle_orientation
+        )
+
     def multipoint_centroid(
         self, multipoint: _Multipoint[_ScalarT], /
     ) -> _Point[_ScalarT]:
@@ -696,72 +1095,238 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         ... ) == Point(1, 1)
         True
         """
+        if isinstance(multipoint, _views.MultipointView):
+            # affine transforms preserve centroids
+            return self.transform_point(
+                self.multipoint_centroid(multipoint.source),
+                multipoint.transform,
+            )
         return self._centroidal_context.multipoint_centroid(
             multipoint, self._coordinate_factory, self._point_cls
         )
 
-    def multipolygon_centroid(
-        self, multipolygon: _Multipolygon[_ScalarT], /
-    ) -> _Point[_ScalarT]:
+    def multipoint_closest_pair(
+        self, multipoint: _Multipoint[_ScalarT], /
+    ) -> tuple[int, int]:
         """
-        Constructs centroid of a multipolygon.
+        Returns indices ``i < j`` of a closest pair of points of a multipoint.
 
         Time complexity:
-            ``O(len(vertices_count))``
+            ``O(points_count * log points_count)``
         Memory complexity:
-            ``O(1)``
+            ``O(points_count)``
 
-        where ``vertices_count = sum(len(polygon.border.vertices)\
- + sum(len(hole.vertices) for hole in polygon.holes)\
- for polygon in multipolygon.polygons)``.
+        where ``points_count = len(multipoint.points)``.
 
         >>> import math
         >>> from fractions import Fraction
         >>> from ground.context import Context
         >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
-        >>> Contour = context.contour_cls
+        >>> Multipoint = context.multipoint_cls
         >>> Point = context.point_cls
-        >>> Polygon = context.polygon_cls
-        >>> Multipolygon = context.multipolygon_cls
-        >>> (context.multipolygon_centroid(
-        ...      Multipolygon([Polygon(Contour([Point(0, 0), Point(1, 0),
-        ...                                     Point(1, 1), Point(0, 1)]),
-        ...                            []),
-        ...                    Polygon(Contour([Point(1, 1), Point(2, 1),
-        ...                                     Point(2, 2), Point(1, 2)]),
-        ...                            [])]))
-        ...  == Point(1, 1))
-        True
+        >>> context.multipoint_closest_pair(
+        ...     Multipoint(
+        ...         [Point(0, 0), Point(3, 0), Point(1, 3), Point(3, 1)]
+        ...     )
+        ... )
+        (1, 3)
         """
-        return self._centroidal_context.multipolygon_centroid(
-            multipolygon, self._coordinate_factory, self._point_cls
+        return _discrete.to_closest_pair(
+            multipoint.points, self.points_squared_distance
         )
 
-    def multisegment_centroid(
-        self, multisegment: _Multisegment[_ScalarT], /
-    ) -> _Point[_ScalarT]:
+    def multipoint_nearest_neighbours(
+        self, multipoint: _Multipoint[_ScalarT], /
+    ) -> list[int]:
         """
-        Constructs centroid of a multisegment.
+        Returns indices of nearest other points
+        for each of the points of a multipoint.
 
         Time complexity:
-            ``O(len(multisegment.segments))``
+            ``O(points_count * log points_count)`` on average
         Memory complexity:
-            ``O(1)``
+            ``O(points_count)``
+
+        where ``points_count = len(multipoint.points)``.
 
         >>> import math
         >>> from fractions import Fraction
         >>> from ground.context import Context
         >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
-        >>> Contour = context.contour_cls
+        >>> Multipoint = context.multipoint_cls
         >>> Point = context.point_cls
-        >>> Segment = context.segment_cls
-        >>> Multisegment = context.multisegment_cls
-        >>> (
-        ...     context.multisegment_centroid(
-        ...         Multisegment(
-        ...             [
-        ...                 Segment(Point(0, 0), Point(2, 0)),
-        ...                 Segment(Point(2, 0), Point(2, 2)),
+        >>> context.multipoint_nearest_neighbours(
+        ...     Multipoint(
+        ...         [Point(0, 0), Point(3, 0), Point(1, 3), Point(3, 1)]
+        ...     )
+        ... )
+        [1, 3, 3, 1]
+        """
+        points, box_cls = multipoint.points, self._box_cls
+        return _discrete.to_nearest_neighbours(
+            points,
+            self.boxes_rtree(
+                [
+                    box_cls(point.x, point.x, point.y, point.y)
+                    for point in points
+                ]
+            ),
+        )
+
+    def multipoint_view(
+        self,
+        multipoint: _Multipoint[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> _views.MultipointView[_ScalarT]:
+        """
+        Returns view of multipoint transformed by given affine transform
+        which points are transformed on access.
+
+        Raises ``ValueError`` if the transform is degenerate.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Multipoint, Point = context.multipoint_cls, context.point_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> view = context.multipoint_view(
+        ...     Multipoint([Point(0, 0), Point(2, 0)]),
+        ...     identity.translated(0, 1),
+        ... )
+        >>> list(view.points) == [Point(0, 1), Point(2, 1)]
+        True
+        >>> context.multipoint_centroid(view) == Point(1, 1)
+        True
+        """
+        return _views.MultipointView(
+            multipoint, transform, point_cls=self._point_cls
+        )
+
+    def multipolygon_centroid(
+        self, multipolygon: _Multipolygon[_ScalarT], /
+    ) -> _Point[_ScalarT]:
+        """
+        Constructs centroid of a multipolygon.
+
+        Time complexity:
+            ``O(len(vertices_count))``
+        Memory complexity:
+            ``O(1)``
+
+        where ``vertices_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in multipolygon.polygons)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> Multipolygon = context.multipolygon_cls
+        >>> (context.multipolygon_centroid(
+        ...      Multipolygon([Polygon(Contour([Point(0, 0), Point(1, 0),
+        ...                                     Point(1, 1), Point(0, 1)]),
+        ...                            []),
+        ...                    Polygon(Contour([Point(1, 1), Point(2, 1),
+        ...                                     Point(2, 2), Point(1, 2)]),
+        ...                            [])]))
+        ...  == Point(1, 1))
+        True
+        """
+        if isinstance(multipolygon, _views.MultipolygonView):
+            # affine transforms preserve centroids
+            return self.transform_point(
+                self.multipolygon_centroid(multipolygon.source),
+                multipolygon.transform,
+            )
+        return self._centroidal_context.multipolygon_centroid(
+            multipolygon, self._coordinate_factory, self._point_cls
+        )
+
+    def multipolygon_view(
+        self,
+        multipolygon: _Multipolygon[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> _views.MultipolygonView[_ScalarT]:
+        """
+        Returns view of multipolygon transformed by given affine transform
+        which vertices are transformed on access.
+
+        Raises ``ValueError`` if the transform is degenerate.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Multipolygon = context.multipolygon_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> view = context.multipolygon_view(
+        ...     Multipolygon(
+        ...         [
+        ...             Polygon(
+        ...                 Contour([Point(0, 0), Point(2, 0), Point(0, 2)]),
+        ...                 [],
+        ...             ),
+        ...             Polygon(
+        ...                 Contour([Point(2, 2), Point(4, 2), Point(2, 4)]),
+        ...                 [],
+        ...             ),
+        ...         ]
+        ...     ),
+        ...     identity.scaled(3, 3),
+        ... )
+        >>> context.multipolygon_centroid(view) == Point(5, 5)
+        True
+        """
+        return _views.MultipolygonView(
+            multipolygon, transform, point_cls=self._point_cls
+        )
+
+    def multisegment_centroid(
+        self, multisegment: _Multisegment[_ScalarT], /
+    ) -> _Point[_ScalarT]:
+        """
+        Constructs centroid of a multisegment.
+
+        Time complexity:
+            ``O(len(multisegment.segments))``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> Multisegment = context.multisegment_cls
+        >>> (
+        ...     context.multisegment_centroid(
+        ...         Multisegment(
+        ...             [
+        ...                 Segment(Point(0, 0), Point(2, 0)),
+        ...                 Segment(Point(2, 0), Point(2, 2)),
         ...                 Segment(Point(0, 2), Point(2, 2)),
         ...                 Segment(Point(0, 0), Point(0, 2)),
         ...             ]
@@ -824,20 +1389,173 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             self._origin.x,
         )
 
+    def nearest_segment(
+        self,
+        multisegment: (
+            _Multisegment[_ScalarT] | _prepared.PreparedMultisegment[_ScalarT]
+        ),
+        point: _Point[_ScalarT],
+        /,
+    ) -> int:
+        """
+        Returns index of a segment of a multisegment nearest to a point
+        (the smallest one among equidistant segments).
+
+        Time complexity:
+            ``O(segments_count)`` for a multisegment,
+            ``O(log segments_count + candidates_count)`` on average
+            for a prepared multisegment
+        Memory complexity:
+            ``O(1)`` for a multisegment,
+            ``O(segments_count)`` for a prepared multisegment
+
+        where ``segments_count = len(multisegment.segments)``,
+        ``candidates_count`` is the number of visited segments.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Multisegment = context.multisegment_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> multisegment = Multisegment(
+        ...     [
+        ...         Segment(Point(0, 0), Point(1, 0)),
+        ...         Segment(Point(0, 2), Point(1, 2)),
+        ...     ]
+        ... )
+        >>> context.nearest_segment(multisegment, Point(0, 3))
+        1
+        >>> context.nearest_segment(
+        ...     context.prepare_multisegment(multisegment), Point(0, 1)
+        ... )
+        0
+        """
+        result = self.nearest_segments(multisegment, point, 1)
+        if not result:
+            raise ValueError(
+                'Nearest segment is defined for at least 1 segment, '
+                'but found 0.'
+            )
+        return result[0]
+
+    def nearest_segments(
+        self,
+        multisegment: (
+            _Multisegment[_ScalarT] | _prepared.PreparedMultisegment[_ScalarT]
+        ),
+        point: _Point[_ScalarT],
+        count: int,
+        /,
+        *,
+        max_squared_distance: _ScalarT | None = None,
+    ) -> list[int]:
+        """
+        Returns indices of at most ``count`` segments of a multisegment
+        nearest to a point (not farther than ``max_squared_distance``
+        if it is specified) in the order of non-decreasing distance
+        with ties broken by indices.
+
+        Time complexity:
+            ``O(segments_count * log count)`` for a multisegment,
+            ``O((count + candidates_count) * log segments_count)``
+            on average for a prepared multisegment
+        Memory complexity:
+            ``O(count)`` for a multisegment,
+            ``O(segments_count)`` for a prepared multisegment
+
+        where ``segments_count = len(multisegment.segments)``,
+        ``candidates_count`` is the number of visited segments.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Multisegment = context.multisegment_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> multisegment = Multisegment(
+        ...     [
+        ...         Segment(Point(0, 0), Point(1, 0)),
+        ...         Segment(Point(0, 2), Point(1, 2)),
+        ...         Segment(Point(3, 0), Point(3, 2)),
+        ...     ]
+        ... )
+        >>> context.nearest_segments(multisegment, Point(1, 1), 2)
+        [0, 1]
+        >>> context.nearest_segments(
+        ...     context.prepare_multisegment(multisegment),
+        ...     Point(3, 3),
+        ...     3,
+        ...     max_squared_distance=Fraction(5),
+        ... )
+        [2, 1]
+        """
+        return (
+            multisegment.find_n_nearest_to_point(
+                count, point, max_squared_distance=max_squared_distance
+            )
+            if isinstance(multisegment, _prepared.PreparedMultisegment)
+            else _prepared.find_n_nearest_segments_to_point(
+                count, multisegment.segments, point, max_squared_distance, self
+            )
+        )
+
     def points_convex_hull(
-        self, points: _Sequence[_Point[_ScalarT]], /
+        self,
+        points: _Iterable[_Point[_ScalarT]],
+        /,
+        *,
+        executor: _Executor | None = None,
+        output_sensitive: bool = False,
+        prune: bool = False,
+        prune_callback: _Callable[[int], _Any] | None = None,
     ) -> _Sequence[_Point[_ScalarT]]:
         """
         Constructs convex hull of points.
 
+        Points which are not given as a sequence are consumed in chunks,
+        so only the current hull with a chunk of points is kept in memory.
+
+        If ``executor`` is specified (e.g. process pool),
+        hulls of chunks are constructed by its workers and merged,
+        which gives the same result.
+        Context evaluators, coordinates & points types should be picklable
+        for it to work with process pools.
+
+        If ``output_sensitive`` flag is set, *Chan's algorithm* is used
+        with points of its groups filtered like ``prune`` flag does,
+        which gives the same result and is faster for large inputs
+        with small hulls (2-8 times for a million of points
+        with tens of hull vertices),
+        but several times slower when most of the points are hull vertices.
+
+        If ``prune`` flag is set, points are filtered
+        with ``Context.points_convex_hull_candidates`` beforehand.
+
+        If ``prune_callback`` is specified, points are filtered as well
+        and it is called with the number of filtered out points
+        once for sequences and once per chunk for other iterables.
+        Raises ``ValueError`` if it is specified along with ``executor``,
+        since filtering happens in its workers then.
+
         Time complexity:
-            ``O(points_count * log(points_count))``
+            ``O(points_count * log(points_count))``,
+            ``O(points_count * log(hull_size))`` if output sensitive
         Memory complexity:
-            ``O(points_count)``
+            ``O(points_count)`` for sequences,
+            ``O(hull_size + chunk_size)`` for other iterables
 
-        where ``points_count = len(points)``.
+        where ``points_count`` is the number of points,
+        ``hull_size`` is the number of vertices of the resulting hull,
+        ``chunk_size`` is a fixed number of points consumed at once.
+
+        Reference:
+            https://en.wikipedia.org/wiki/Chan%27s_algorithm
 
         >>> import math
+        >>> from concurrent.futures import ProcessPoolExecutor
         >>> from fractions import Fraction
         >>> from ground.context import Context
         >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
@@ -849,8 +1567,124 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         ...     == [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)]
         ... )
         True
+        >>> (
+        ...     context.points_convex_hull(
+        ...         Point(x, y) for x in range(3) for y in range(3)
+        ...     )
+        ...     == [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)]
+        ... )
+        True
+        >>> (
+        ...     context.points_convex_hull(
+        ...         [Point(x, y) for x in range(3) for y in range(3)],
+        ...         output_sensitive=True,
+        ...         prune=True,
+        ...     )
+        ...     == [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)]
+        ... )
+        True
+        >>> pruned_counts = []
+        >>> (
+        ...     context.points_convex_hull(
+        ...         [
+        ...             Point(1, 0),
+        ...             Point(1, 1),
+        ...             Point(2, 1),
+        ...             Point(1, 2),
+        ...             Point(0, 1),
+        ...         ],
+        ...         prune_callback=pruned_counts.append,
+        ...     )
+        ...     == [Point(0, 1), Point(1, 0), Point(2, 1), Point(1, 2)]
+        ... )
+        True
+        >>> pruned_counts
+        [1]
+        >>> with ProcessPoolExecutor(2) as executor:
+        ...     (
+        ...         context.points_convex_hull(
+        ...             [Point(x, y) for x in range(3) for y in range(3)],
+        ...             executor=executor,
+        ...         )
+        ...         == [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)]
+        ...     )
+        True
+        """
+        constructor: _discrete.ConvexHullConstructor[_ScalarT] = (
+            _discrete.to_output_sensitive_convex_hull
+            if output_sensitive
+            else _discrete.to_convex_hull
+        )
+        if prune or prune_callback is not None:
+            constructor = _partial(
+                _discrete.to_pruned_convex_hull, constructor, prune_callback
+            )
+        if executor is not None:
+            if prune_callback is not None:
+                raise ValueError(
+                    'Prune callback should not be specified '
+                    'along with executor.'
+                )
+            return _discrete.to_parallel_convex_hull(
+                points,
+                self.angle_orientation,
+                constructor,
+                executor,
+                self._point_cls,
+                self._angular_context.orientation,
+                self._vector_context.cross_product,
+                self._zero,
+            )
+        return (
+            constructor(points, self.angle_orientation)
+            if isinstance(points, _Sequence)
+            else _discrete.to_iterable_convex_hull(
+                points, self.angle_orientation, constructor
+            )
+        )
+
+    def points_convex_hull_candidates(
+        self, points: _Sequence[_Point[_ScalarT]], /
+    ) -> _Sequence[_Point[_ScalarT]]:
+        """
+        Returns points which can be vertices of convex hull
+        in their original order,
+        i.e. ones which do not lie strictly inside of the quadrilateral
+        formed by extreme points (*Akl-Toussaint heuristic*).
+
+        Number of points pruned this way is equal to
+        ``len(points) - len(context.points_convex_hull_candidates(points))``.
+
+        Time complexity:
+            ``O(len(points))``
+        Memory complexity:
+            ``O(len(points))``
+
+        Reference:
+            https://en.wikipedia.org/wiki/Convex_hull_algorithms#Akl%E2%80%93Toussaint_heuristic
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Point = context.point_cls
+        >>> (
+        ...     context.points_convex_hull_candidates(
+        ...         [
+        ...             Point(1, 0),
+        ...             Point(1, 1),
+        ...             Point(2, 1),
+        ...             Point(1, 2),
+        ...             Point(0, 1),
+        ...         ]
+        ...     )
+        ...     == [Point(1, 0), Point(2, 1), Point(1, 2), Point(0, 1)]
+        ... )
+        True
         """
-        return _discrete.to_convex_hull(points, self.angle_orientation)
+        return _discrete.to_convex_hull_candidates(
+            points, self.angle_orientation
+        )
 
     def points_box(
         self, points: _Sequence[_Point[_ScalarT]], /
@@ -909,6 +1743,8 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         ... ) == Box(0, 1, 0, 1)
         True
         """
+        if isinstance(polygon, _views.PolygonView):
+            return self.contour_box(polygon.border)
         return _boxed.from_polygon(polygon, self._box_cls)
 
     def polygon_centroid(
@@ -939,41 +1775,283 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         ...                       Point(3, 1)])])) == Point(2, 2)
         True
         """
+        if isinstance(polygon, _views.PolygonView):
+            # affine transforms preserve centroids
+            return self.transform_point(
+                self.polygon_centroid(polygon.source), polygon.transform
+            )
         return self._centroidal_context.polygon_centroid(
             polygon, self._coordinate_factory, self._point_cls
         )
 
-    def polygons_box(
-        self, polygons: _Sequence[_Polygon[_ScalarT]], /
-    ) -> _Box[_ScalarT]:
+    def polygon_slab_decomposition(
+        self, polygon: _Polygon[_ScalarT], /
+    ) -> _indexing.SlabDecomposition[_ScalarT]:
         """
-        Constructs box from polygons.
+        Constructs slab decomposition of polygon
+        for repeated point location queries
+        with ``O(log vertices_count)`` expected time complexity each.
 
         Time complexity:
-            ``O(vertices_count)``
+            ``O(vertices_count * log vertices_count)`` expected
         Memory complexity:
-            ``O(1)``
+            ``O(vertices_count * log vertices_count)`` expected
 
-        where ``vertices_count = sum(len(polygon.border.vertices)\
- for polygon in polygons)``.
+        where ``vertices_count = len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)``.
 
+        >>> from ground.enums import Location
         >>> import math
         >>> from fractions import Fraction
         >>> from ground.context import Context
         >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
-        >>> Box, Contour, Point, Polygon = (context.box_cls,
-        ...                                 context.contour_cls,
-        ...                                 context.point_cls,
-        ...                                 context.polygon_cls)
-        >>> context.polygons_box(
-        ...     [Polygon(Contour([Point(0, 0), Point(1, 0), Point(1, 1),
-        ...                       Point(0, 1)]), []),
-        ...      Polygon(Contour([Point(1, 1), Point(2, 1), Point(2, 2),
-        ...                       Point(1, 2)]), [])]) == Box(0, 2, 0, 2)
-        True
-        """
-        return _boxed.from_polygons(polygons, self._box_cls)
-
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> decomposition = context.polygon_slab_decomposition(
+        ...     Polygon(
+        ...         Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                  Point(0, 4)]),
+        ...         [Contour([Point(1, 1), Point(1, 3), Point(3, 3),
+        ...                   Point(3, 1)])],
+        ...     )
+        ... )
+        >>> decomposition.locate(Point(2, 2)) is Location.EXTERIOR
+        True
+        >>> decomposition.locate(Point(3, 2)) is Location.BOUNDARY
+        True
+        >>> (
+        ...     decomposition.locate(Point(Fraction(1, 2), 2))
+        ...     is Location.INTERIOR
+        ... )
+        True
+        """
+        return _indexing.SlabDecomposition(
+            [polygon.border, *polygon.holes], orienteer=self.angle_orientation
+        )
+
+    def polygon_view(
+        self,
+        polygon: _Polygon[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> _views.PolygonView[_ScalarT]:
+        """
+        Returns view of polygon transformed by given affine transform
+        which vertices are transformed on access.
+
+        Raises ``ValueError`` if the transform is degenerate.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box = context.box_cls
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> view = context.polygon_view(
+        ...     Polygon(Contour([Point(0, 0), Point(3, 0), Point(0, 3)]), []),
+        ...     identity.rotated_around_origin(0, 1),
+        ... )
+        >>> context.polygon_box(view) == Box(-3, 0, 0, 3)
+        True
+        >>> context.polygon_centroid(view) == Point(-1, 1)
+        True
+        """
+        return _views.PolygonView(
+            polygon, transform, point_cls=self._point_cls
+        )
+
+    def polygons_box(
+        self, polygons: _Sequence[_Polygon[_ScalarT]], /
+    ) -> _Box[_ScalarT]:
+        """
+        Constructs box from polygons.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(1)``
+
+        where ``vertices_count = sum(len(polygon.border.vertices)\
+ for polygon in polygons)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box, Contour, Point, Polygon = (context.box_cls,
+        ...                                 context.contour_cls,
+        ...                                 context.point_cls,
+        ...                                 context.polygon_cls)
+        >>> context.polygons_box(
+        ...     [Polygon(Contour([Point(0, 0), Point(1, 0), Point(1, 1),
+        ...                       Point(0, 1)]), []),
+        ...      Polygon(Contour([Point(1, 1), Point(2, 1), Point(2, 2),
+        ...                       Point(1, 2)]), [])]) == Box(0, 2, 0, 2)
+        True
+        """
+        return _boxed.from_polygons(polygons, self._box_cls)
+
+    def polygons_centroids(
+        self, polygons: _Sequence[_Polygon[_ScalarT]], /
+    ) -> _Sequence[_Point[_ScalarT]]:
+        """
+        Constructs centroids of polygons.
+
+        Plain centroidal context sums up components contour by contour,
+        so it only saves on per-polygon calls,
+        while NumPy one sums them up for all the polygons at once,
+        which makes it several times faster
+        than calling ``polygon_centroid`` for each polygon.
+        Coordinates of point arrays are read without constructing points.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in polygons)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> context.polygons_centroids(
+        ...     [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                       Point(0, 4)]),
+        ...              [Contour([Point(1, 1), Point(1, 3), Point(3, 3),
+        ...                        Point(3, 1)])]),
+        ...      Polygon(Contour([Point(0, 0), Point(3, 0), Point(0, 3)]),
+        ...              [])]
+        ... ) == [Point(2, 2), Point(1, 1)]
+        True
+        """
+        return self._centroidal_context.polygons_centroids(
+            polygons, self._coordinate_factory, self._point_cls
+        )
+
+    def prepare_multisegment(
+        self, multisegment: _Multisegment[_ScalarT], /
+    ) -> _prepared.PreparedMultisegment[_ScalarT]:
+        """
+        Prepares multisegment for repeated queries
+        by evaluating its box & index of segments once.
+
+        Time complexity:
+            ``O(segments_count * log segments_count)``
+        Memory complexity:
+            ``O(segments_count)``
+
+        where ``segments_count = len(multisegment.segments)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box = context.box_cls
+        >>> Multisegment = context.multisegment_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> prepared = context.prepare_multisegment(
+        ...     Multisegment(
+        ...         [
+        ...             Segment(Point(0, 0), Point(1, 0)),
+        ...             Segment(Point(0, 2), Point(1, 2)),
+        ...         ]
+        ...     )
+        ... )
+        >>> prepared.box == Box(0, 1, 0, 2)
+        True
+        >>> prepared.point_squared_distance(Point(2, 1)) == 2
+        True
+        """
+        return _prepared.PreparedMultisegment(multisegment, context=self)
+
+    def prepare_polygon(
+        self, polygon: _Polygon[_ScalarT], /
+    ) -> _prepared.PreparedPolygon[_ScalarT]:
+        """
+        Prepares polygon for repeated queries
+        by evaluating its box, edges, area, convexity & index of edges once.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> from ground.enums import Location
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box = context.box_cls
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> prepared = context.prepare_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(2, 0), Point(0, 2)]), [])
+        ... )
+        >>> prepared.box == Box(0, 2, 0, 2)
+        True
+        >>> prepared.area == 2
+        True
+        >>> prepared.locate_point(Point(1, 1)) is Location.BOUNDARY
+        True
+        """
+        return _prepared.PreparedPolygon(polygon, context=self)
+
+    def prepare_region(
+        self, contour: _Contour[_ScalarT], /
+    ) -> _prepared.PreparedRegion[_ScalarT]:
+        """
+        Prepares region (given its contour) for repeated queries
+        by evaluating its box, edges, signed area, convexity
+        & index of edges once.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = len(contour.vertices)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> from ground.enums import Location
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box = context.box_cls
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> prepared = context.prepare_region(
+        ...     Contour([Point(0, 0), Point(2, 0), Point(0, 2)])
+        ... )
+        >>> prepared.box == Box(0, 2, 0, 2)
+        True
+        >>> prepared.signed_area == 2
+        True
+        >>> prepared.locate_point(Point(2, 2)) is Location.EXTERIOR
+        True
+        """
+        return _prepared.PreparedRegion(contour, context=self)
+
     def region_centroid(
         self, contour: _Contour[_ScalarT], /
     ) -> _Point[_ScalarT]:
@@ -1001,6 +2079,11 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         ... )
         True
         """
+        if isinstance(contour, _views.ContourView):
+            # affine transforms preserve centroids
+            return self.transform_point(
+                self.region_centroid(contour.source), contour.transform
+            )
         return self._centroidal_context.region_centroid(
             contour, self._coordinate_factory, self._point_cls
         )
@@ -1039,26 +2122,116 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         ... )
         True
         """
+        if isinstance(contour, _views.ContourView):
+            result: _ScalarT = (
+                contour.transform.determinant
+                * self.region_signed_area(contour.source)
+            )
+            return result
         return self._measured_context.region_signed_area(
             contour, self._coordinate_factory
         )
 
+    def region_slab_decomposition(
+        self, contour: _Contour[_ScalarT], /
+    ) -> _indexing.SlabDecomposition[_ScalarT]:
+        """
+        Constructs slab decomposition of region given its contour
+        for repeated point location queries
+        with ``O(log len(contour.vertices))`` expected time complexity each.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)`` expected
+        Memory complexity:
+            ``O(vertices_count * log vertices_count)`` expected
+
+        where ``vertices_count = len(contour.vertices)``.
+
+        >>> from ground.enums import Location
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> decomposition = context.region_slab_decomposition(
+        ...     Contour([Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)])
+        ... )
+        >>> decomposition.locate(Point(1, 1)) is Location.INTERIOR
+        True
+        >>> decomposition.locate(Point(2, 1)) is Location.BOUNDARY
+        True
+        >>> decomposition.locate(Point(3, 1)) is Location.EXTERIOR
+        True
+        """
+        return _indexing.SlabDecomposition(
+            [contour], orienteer=self.angle_orientation
+        )
+
+    def regions_signed_areas(
+        self, contours: _Sequence[_Contour[_ScalarT]], /
+    ) -> _Sequence[_ScalarT]:
+        """
+        Returns signed areas of regions given their contours.
+
+        Plain measured context sums up components contour by contour,
+        so it only saves on per-contour calls,
+        while NumPy one sums them up for all the contours at once,
+        which makes it several times faster
+        than calling ``region_signed_area`` for each contour.
+        Coordinates of point arrays are read without constructing points.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = sum(len(contour.vertices)\
+ for contour in contours)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> context.regions_signed_areas(
+        ...     [Contour([Point(0, 0), Point(1, 0), Point(1, 1),
+        ...               Point(0, 1)]),
+        ...      Contour([Point(0, 0), Point(0, 2), Point(2, 0)])]
+        ... ) == [1, -2]
+        True
+        """
+        return self._measured_context.regions_signed_areas(
+            contours, self._coordinate_factory
+        )
+
     def replace(
         self,
         /,
         *,
+        angular_context: _angular.Context[_ScalarT] | None = None,
         box_cls: type[_Box[_ScalarT]] | None = None,
+        centroidal_context: _centroidal.Context[_ScalarT] | None = None,
+        circular_context: _circular.Context[_ScalarT] | None = None,
         contour_cls: type[_Contour[_ScalarT]] | None = None,
         coordinate_factory: _ScalarFactory[_ScalarT] | None = None,
         empty_cls: type[_Empty[_ScalarT]] | None = None,
+        measured_context: _measured.Context[_ScalarT] | None = None,
+        metric_context: _metric.Context[_ScalarT] | None = None,
         mix_cls: type[_Mix[_ScalarT]] | None = None,
         multipoint_cls: type[_Multipoint[_ScalarT]] | None = None,
         multipolygon_cls: type[_Multipolygon[_ScalarT]] | None = None,
         multisegment_cls: type[_Multisegment[_ScalarT]] | None = None,
         point_cls: type[_Point[_ScalarT]] | None = None,
         polygon_cls: type[_Polygon[_ScalarT]] | None = None,
+        rotation_context: _rotation.Context[_ScalarT] | None = None,
+        scaling_context: _scaling.Context[_ScalarT] | None = None,
         segment_cls: type[_Segment[_ScalarT]] | None = None,
+        segment_context: _segment.Context[_ScalarT] | None = None,
         sqrt: _SquareRooter[_ScalarT] | None = None,
+        translation_context: _translation.Context[_ScalarT] | None = None,
+        vector_context: _vector.Context[_ScalarT] | None = None,
     ) -> Context[_ScalarT]:
         """
         Constructs context from the original one replacing given parameters.
@@ -1079,9 +2252,32 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         True
         >>> fraction_context.coordinate_factory is Fraction
         True
+        >>> from ground import filtered
+        >>> filtered_context = context.replace(
+        ...     angular_context=filtered.angular_context
+        ... )
+        >>> filtered_context.angular_context is filtered.angular_context
+        True
+        >>> filtered_context == context
+        False
         """
         return Context(
+            angular_context=(
+                self._angular_context
+                if angular_context is None
+                else angular_context
+            ),
             box_cls=self._box_cls if box_cls is None else box_cls,
+            centroidal_context=(
+                self._centroidal_context
+                if centroidal_context is None
+                else centroidal_context
+            ),
+            circular_context=(
+                self._circular_context
+                if circular_context is None
+                else circular_context
+            ),
             contour_cls=(
                 self._contour_cls if contour_cls is None else contour_cls
             ),
@@ -1091,6 +2287,16 @@ class Context(_HasRepr, _Generic[_ScalarT]):
                 else coordinate_factory
             ),
             empty_cls=(self._empty_cls if empty_cls is None else empty_cls),
+            measured_context=(
+                self._measured_context
+                if measured_context is None
+                else measured_context
+            ),
+            metric_context=(
+                self._metric_context
+                if metric_context is None
+                else metric_context
+            ),
             mix_cls=self._mix_cls if mix_cls is None else mix_cls,
             multipoint_cls=(
                 self._multipoint_cls
@@ -1111,10 +2317,35 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             polygon_cls=(
                 self._polygon_cls if polygon_cls is None else polygon_cls
             ),
+            rotation_context=(
+                self._rotation_context
+                if rotation_context is None
+                else rotation_context
+            ),
+            scaling_context=(
+                self._scaling_context
+                if scaling_context is None
+                else scaling_context
+            ),
             segment_cls=(
                 self._segment_cls if segment_cls is None else segment_cls
             ),
+            segment_context=(
+                self._segment_context
+                if segment_context is None
+                else segment_context
+            ),
             sqrt=self._sqrt if sqrt is None else sqrt,
+            translation_context=(
+                self._translation_context
+                if translation_context is None
+                else translation_context
+            ),
+            vector_context=(
+                self._vector_context
+                if vector_context is None
+                else vector_context
+            ),
         )
 
     def rotate_contour(
@@ -2396,35 +3627,134 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             self._coordinate_factory,
         )
 
-    def segments_box(
-        self, segments: _Sequence[_Segment[_ScalarT]], /
-    ) -> _Box[_ScalarT]:
+    def segment_points_squared_distances(
+        self,
+        segment: _Segment[_ScalarT],
+        points: _Sequence[_Point[_ScalarT]] | _Buffer,
+        /,
+    ) -> _Sequence[_ScalarT] | _array[float]:
         """
-        Constructs box from segments.
+        Returns squared Euclidean distances between segment and points.
+
+        Points can be either a sequence of points
+        or a buffer with interleaved ``float`` coordinates,
+        distances are returned as a list for a sequence of points
+        and as an array of ``float`` values for a buffer.
 
         Time complexity:
-            ``O(len(segments))``
+            ``O(len(points))``
         Memory complexity:
-            ``O(1)``
+            ``O(len(points))``
 
+        >>> from array import array
         >>> import math
         >>> from fractions import Fraction
         >>> from ground.context import Context
         >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
-        >>> Box, Point, Segment = (
-        ...     context.box_cls,
-        ...     context.point_cls,
-        ...     context.segment_cls,
-        ... )
-        >>> (
-        ...     context.segments_box(
-        ...         [
-        ...             Segment(Point(0, 0), Point(1, 1)),
-        ...             Segment(Point(1, 1), Point(2, 2)),
-        ...         ]
-        ...     )
-        ...     == Box(0, 2, 0, 2)
-        ... )
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> context.segment_points_squared_distances(
+        ...     Segment(Point(0, 0), Point(1, 0)),
+        ...     [Point(0, 0), Point(0, 1), Point(2, 1)],
+        ... ) == [0, 1, 2]
+        True
+        >>> context.segment_points_squared_distances(
+        ...     Segment(Point(0, 0), Point(1, 0)),
+        ...     array('d', [0, 0, 0, 1, 2, 1]),
+        ... ) == array('d', [0, 1, 2])
+        True
+        """
+        return self._metric_context.segment_points_squared_metric(
+            segment.start,
+            segment.end,
+            points,
+            self.dot_product,
+            self._coordinate_factory,
+        )
+
+    def segments_any_intersect(
+        self, segments: _Sequence[_Segment[_ScalarT]], /
+    ) -> bool:
+        """
+        Checks if any pair of segments crosses or overlaps
+        (touching segments are not considered intersecting,
+        so consecutive segments of a contour are allowed).
+
+        Raises ``ValueError`` if any of segments is degenerate.
+
+        Time complexity:
+            ``O(segments_count * log segments_count)`` on average
+        Memory complexity:
+            ``O(segments_count)``
+        where ``segments_count = len(segments)``.
+
+        Reference:
+            https://en.wikipedia.org/wiki/Shamos%E2%80%93Hoey_algorithm
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> context.segments_any_intersect(
+        ...     context.contour_segments(
+        ...         Contour(
+        ...             [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+        ...         )
+        ...     )
+        ... )
+        False
+        >>> context.segments_any_intersect(
+        ...     context.contour_segments(
+        ...         Contour(
+        ...             [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        ...         )
+        ...     )
+        ... )
+        True
+        >>> context.segments_any_intersect(
+        ...     [
+        ...         Segment(Point(0, 0), Point(2, 0)),
+        ...         Segment(Point(1, 0), Point(3, 0)),
+        ...     ]
+        ... )
+        True
+        """
+        return _sweeping.segments_cross_or_overlap(
+            segments, self.angle_orientation, self.segments_relation
+        )
+
+    def segments_box(
+        self, segments: _Sequence[_Segment[_ScalarT]], /
+    ) -> _Box[_ScalarT]:
+        """
+        Constructs box from segments.
+
+        Time complexity:
+            ``O(len(segments))``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Box, Point, Segment = (
+        ...     context.box_cls,
+        ...     context.point_cls,
+        ...     context.segment_cls,
+        ... )
+        >>> (
+        ...     context.segments_box(
+        ...         [
+        ...             Segment(Point(0, 0), Point(1, 1)),
+        ...             Segment(Point(1, 1), Point(2, 2)),
+        ...         ]
+        ...     )
+        ...     == Box(0, 2, 0, 2)
+        ... )
         True
         """
         return _boxed.from_segments(segments, self._box_cls)
@@ -2480,6 +3810,107 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             self._segment_contains_point,
         )
 
+    def segments_intersections(
+        self, segments: _Sequence[_Segment[_ScalarT]], /
+    ) -> _Iterator[tuple[int, int, _Relation, _Point[_ScalarT]]]:
+        """
+        Yields intersections of segments
+        as tuples of indices of intersecting segments ``i < j``,
+        relation of ``segments[i]`` to ``segments[j]``
+        and their common point (intersection point for crossing/touching
+        segments & common endpoint for overlapping ones).
+
+        Raises ``ValueError`` if any of segments is degenerate.
+
+        For segments with floating point coordinates the sweep itself
+        evaluates orientations & crossing points exactly,
+        so each pair is reported once,
+        while relations & points are produced by the context.
+
+        Time complexity:
+            ``O((segments_count + intersections_count)
+            * log segments_count)`` on average
+        Memory complexity:
+            ``O(segments_count + intersections_count)``
+        where ``segments_count = len(segments)``,
+        ``intersections_count`` is the number of pairs
+        of intersecting segments.
+
+        Reference:
+            https://en.wikipedia.org/wiki/Bentley%E2%80%93Ottmann_algorithm
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> from ground.enums import Relation
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> (
+        ...     list(
+        ...         context.segments_intersections(
+        ...             [
+        ...                 Segment(Point(0, 0), Point(2, 2)),
+        ...                 Segment(Point(3, 0), Point(4, 0)),
+        ...                 Segment(Point(0, 2), Point(2, 0)),
+        ...             ]
+        ...         )
+        ...     )
+        ...     == [(0, 2, Relation.CROSS, Point(1, 1))]
+        ... )
+        True
+        """
+        return _sweeping.to_segments_intersections(
+            segments,
+            self.angle_orientation,
+            self.segments_relation,
+            self.segments_intersection,
+        )
+
+    def segments_points_squared_distances(
+        self,
+        starts: _Sequence[_Point[_ScalarT]] | _Buffer,
+        ends: _Sequence[_Point[_ScalarT]] | _Buffer,
+        points: _Sequence[_Point[_ScalarT]] | _Buffer,
+        /,
+    ) -> _Sequence[_ScalarT] | _array[float]:
+        """
+        Returns squared Euclidean distances between segments and points
+        given segments endpoints and points in parallel sequences.
+
+        Sequences should be either all of points or all buffers
+        with interleaved ``float`` coordinates,
+        distances are returned as a list for sequences of points
+        and as an array of ``float`` values for buffers.
+
+        Time complexity:
+            ``O(len(points))``
+        Memory complexity:
+            ``O(len(points))``
+
+        >>> from array import array
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Point = context.point_cls
+        >>> context.segments_points_squared_distances(
+        ...     [Point(0, 0), Point(0, 0), Point(0, 0)],
+        ...     [Point(1, 0), Point(0, 1), Point(1, 1)],
+        ...     [Point(0, 1), Point(0, 3), Point(1, 0)],
+        ... ) == [1, 4, Fraction(1, 2)]
+        True
+        >>> context.segments_points_squared_distances(
+        ...     array('d', [0, 0, 0, 0, 0, 0]),
+        ...     array('d', [1, 0, 0, 1, 1, 1]),
+        ...     array('d', [0, 1, 0, 3, 1, 0]),
+        ... ) == array('d', [1, 4, 0.5])
+        True
+        """
+        return self._metric_context.segments_points_squared_metric(
+            starts, ends, points, self.dot_product, self._coordinate_factory
+        )
+
     def segments_relation(
         self, test: _Segment[_ScalarT], goal: _Segment[_ScalarT], /
     ) -> _Relation:
@@ -2602,6 +4033,408 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             self._coordinate_factory,
         )
 
+    def transform_contour(
+        self,
+        contour: _Contour[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> _Contour[_ScalarT] | _Multipoint[_ScalarT] | _Segment[_ScalarT]:
+        """
+        Returns contour transformed by given affine transform.
+
+        Contour is packed into a segment or a multipoint
+        if the transform is degenerate.
+
+        Time complexity:
+            ``O(len(contour.vertices))``
+        Memory complexity:
+            ``O(len(contour.vertices))``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Multipoint = context.multipoint_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> (
+        ...     context.transform_contour(
+        ...         Contour([Point(0, 0), Point(1, 0), Point(0, 1)]),
+        ...         identity.rotated_around_origin(0, 1).translated(1, 0),
+        ...     )
+        ...     == Contour([Point(1, 0), Point(1, 1), Point(0, 0)])
+        ... )
+        True
+        >>> (
+        ...     context.transform_contour(
+        ...         Contour([Point(0, 0), Point(1, 0), Point(0, 1)]),
+        ...         identity.scaled(0, 2),
+        ...     )
+        ...     == Segment(Point(0, 0), Point(0, 2))
+        ... )
+        True
+        >>> (
+        ...     context.transform_contour(
+        ...         Contour([Point(0, 0), Point(1, 0), Point(0, 1)]),
+        ...         identity.scaled(0, 0).translated(1, 1),
+        ...     )
+        ...     == Multipoint([Point(1, 1)])
+        ... )
+        True
+        """
+        return _affine.transform_contour(
+            contour,
+            transform,
+            self._contour_cls,
+            self._multipoint_cls,
+            self._point_cls,
+            self._segment_cls,
+        )
+
+    def transform_multipoint(
+        self,
+        multipoint: _Multipoint[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> _Multipoint[_ScalarT]:
+        """
+        Returns multipoint transformed by given affine transform.
+
+        Time complexity:
+            ``O(len(multipoint.points))``
+        Memory complexity:
+            ``O(len(multipoint.points))``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Multipoint = context.multipoint_cls
+        >>> Point = context.point_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> (
+        ...     context.transform_multipoint(
+        ...         Multipoint([Point(0, 0), Point(1, 0)]),
+        ...         identity.scaled(2, 1).translated(0, 1),
+        ...     )
+        ...     == Multipoint([Point(0, 1), Point(2, 1)])
+        ... )
+        True
+        >>> (
+        ...     context.transform_multipoint(
+        ...         Multipoint([Point(0, 0), Point(0, 1)]),
+        ...         identity.scaled(1, 0),
+        ...     )
+        ...     == Multipoint([Point(0, 0)])
+        ... )
+        True
+        """
+        return _affine.transform_multipoint(
+            multipoint, transform, self._multipoint_cls, self._point_cls
+        )
+
+    def transform_multipolygon(
+        self,
+        multipolygon: _Multipolygon[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> (
+        _Multipoint[_ScalarT]
+        | _Multipolygon[_ScalarT]
+        | _Multisegment[_ScalarT]
+    ):
+        """
+        Returns multipolygon transformed by given affine transform.
+
+        Multipolygon is packed into a multisegment or a multipoint
+        if the transform is degenerate.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in multipolygon.polygons)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Multipoint = context.multipoint_cls
+        >>> Multipolygon = context.multipolygon_cls
+        >>> Multisegment = context.multisegment_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> Segment = context.segment_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> first_border = Contour([Point(0, 0), Point(1, 0), Point(0, 1)])
+        >>> second_border = Contour([Point(1, 1), Point(2, 1), Point(1, 2)])
+        >>> multipolygon = Multipolygon(
+        ...     [Polygon(first_border, []), Polygon(second_border, [])]
+        ... )
+        >>> (
+        ...     context.transform_multipolygon(
+        ...         multipolygon, identity.translated(1, 1)
+        ...     )
+        ...     == Multipolygon(
+        ...         [
+        ...             Polygon(second_border, []),
+        ...             Polygon(
+        ...                 Contour([Point(2, 2), Point(3, 2), Point(2, 3)]),
+        ...                 [],
+        ...             ),
+        ...         ]
+        ...     )
+        ... )
+        True
+        >>> (
+        ...     context.transform_multipolygon(
+        ...         multipolygon, identity.scaled(1, 0)
+        ...     )
+        ...     == Multisegment(
+        ...         [
+        ...             Segment(Point(0, 0), Point(1, 0)),
+        ...             Segment(Point(1, 0), Point(2, 0)),
+        ...         ]
+        ...     )
+        ... )
+        True
+        >>> (
+        ...     context.transform_multipolygon(
+        ...         multipolygon, identity.scaled(0, 0)
+        ...     )
+        ...     == Multipoint([Point(0, 0)])
+        ... )
+        True
+        """
+        return _affine.transform_multipolygon(
+            multipolygon,
+            transform,
+            self._contour_cls,
+            self._multipoint_cls,
+            self._multipolygon_cls,
+            self._multisegment_cls,
+            self._point_cls,
+            self._polygon_cls,
+            self._segment_cls,
+        )
+
+    def transform_multisegment(
+        self,
+        multisegment: _Multisegment[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> (
+        _Empty[_ScalarT]
+        | _Linear[_ScalarT]
+        | _Mix[_ScalarT]
+        | _Multipoint[_ScalarT]
+        | _Shaped[_ScalarT]
+    ):
+        """
+        Returns multisegment transformed by given affine transform.
+
+        Segments which are collapsed by the transform
+        are packed into points.
+
+        Time complexity:
+            ``O(len(multisegment.segments))``
+        Memory complexity:
+            ``O(len(multisegment.segments))``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> EMPTY = context.empty
+        >>> Mix = context.mix_cls
+        >>> Multipoint = context.multipoint_cls
+        >>> Multisegment = context.multisegment_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> multisegment = Multisegment(
+        ...     [
+        ...         Segment(Point(0, 0), Point(1, 0)),
+        ...         Segment(Point(0, 0), Point(0, 1)),
+        ...     ]
+        ... )
+        >>> (
+        ...     context.transform_multisegment(
+        ...         multisegment, identity.rotated_around_origin(0, 1)
+        ...     )
+        ...     == Multisegment(
+        ...         [
+        ...             Segment(Point(0, 0), Point(0, 1)),
+        ...             Segment(Point(0, 0), Point(-1, 0)),
+        ...         ]
+        ...     )
+        ... )
+        True
+        >>> (
+        ...     context.transform_multisegment(
+        ...         multisegment, identity.scaled(1, 0)
+        ...     )
+        ...     == Mix(
+        ...         Multipoint([Point(0, 0)]),
+        ...         Segment(Point(0, 0), Point(1, 0)),
+        ...         EMPTY,
+        ...     )
+        ... )
+        True
+        """
+        return _affine.transform_multisegment(
+            multisegment,
+            transform,
+            self._empty,
+            self._mix_cls,
+            self._multipoint_cls,
+            self._multisegment_cls,
+            self._point_cls,
+            self._segment_cls,
+        )
+
+    def transform_point(
+        self, point: _Point[_ScalarT], transform: _AffineTransform[_ScalarT], /
+    ) -> _Point[_ScalarT]:
+        """
+        Returns point transformed by given affine transform.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Point = context.point_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> context.transform_point(Point(1, 0), identity) == Point(1, 0)
+        True
+        >>> context.transform_point(
+        ...     Point(1, 0), identity.rotated(0, 1, Point(1, 1))
+        ... ) == Point(2, 1)
+        True
+        """
+        return _affine.transform_point(point, transform, self._point_cls)
+
+    def transform_polygon(
+        self,
+        polygon: _Polygon[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> _Multipoint[_ScalarT] | _Polygon[_ScalarT] | _Segment[_ScalarT]:
+        """
+        Returns polygon transformed by given affine transform.
+
+        Polygon is packed into a segment or a multipoint
+        if the transform is degenerate.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)``.
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> Segment = context.segment_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> border = Contour([Point(0, 0), Point(1, 0), Point(0, 1)])
+        >>> polygon = Polygon(border, [])
+        >>> (
+        ...     context.transform_polygon(
+        ...         polygon, identity.scaled(2, 2).translated(1, 1)
+        ...     )
+        ...     == Polygon(
+        ...         Contour([Point(1, 1), Point(3, 1), Point(1, 3)]), []
+        ...     )
+        ... )
+        True
+        >>> (
+        ...     context.transform_polygon(polygon, identity.scaled(0, 1))
+        ...     == Segment(Point(0, 0), Point(0, 1))
+        ... )
+        True
+        """
+        return _affine.transform_polygon(
+            polygon,
+            transform,
+            self._contour_cls,
+            self._multipoint_cls,
+            self._point_cls,
+            self._polygon_cls,
+            self._segment_cls,
+        )
+
+    def transform_segment(
+        self,
+        segment: _Segment[_ScalarT],
+        transform: _AffineTransform[_ScalarT],
+        /,
+    ) -> _Multipoint[_ScalarT] | _Segment[_ScalarT]:
+        """
+        Returns segment transformed by given affine transform.
+
+        Segment is packed into a multipoint if the transform collapses it.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> import math
+        >>> from fractions import Fraction
+        >>> from ground.affine import AffineTransform
+        >>> from ground.context import Context
+        >>> context = Context(coordinate_factory=Fraction, sqrt=math.sqrt)
+        >>> Multipoint = context.multipoint_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> identity = AffineTransform(*map(Fraction, (1, 0, 0, 1, 0, 0)))
+        >>> (
+        ...     context.transform_segment(
+        ...         Segment(Point(0, 0), Point(1, 0)), identity.scaled(2, 0)
+        ...     )
+        ...     == Segment(Point(0, 0), Point(2, 0))
+        ... )
+        True
+        >>> (
+        ...     context.transform_segment(
+        ...         Segment(Point(0, 0), Point(1, 0)), identity.scaled(0, 2)
+        ...     )
+        ...     == Multipoint([Point(0, 0)])
+        ... )
+        True
+        """
+        return _affine.transform_segment(
+            segment,
+            transform,
+            self._multipoint_cls,
+            self._point_cls,
+            self._segment_cls,
+        )
+
     def translate_contour(
         self,
         contour: _Contour[_ScalarT],
@@ -3120,10 +4953,21 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         cls,
         /,
         *,
+        angular_context: _angular.Context[_ScalarT] = _angular.plain_context,
         box_cls: type[_Box[_ScalarT]] = _geometries.Box,
+        centroidal_context: _centroidal.Context[
+            _ScalarT
+        ] = _centroidal.plain_context,
+        circular_context: _circular.Context[
+            _ScalarT
+        ] = _circular.plain_context,
         contour_cls: type[_Contour[_ScalarT]] = _geometries.Contour,
         coordinate_factory: _Callable[[int], _ScalarT],
         empty_cls: type[_Empty[_ScalarT]] = _geometries.Empty,
+        measured_context: _measured.Context[
+            _ScalarT
+        ] = _measured.plain_context,
+        metric_context: _metric.Context[_ScalarT] = _metric.plain_context,
         mix_cls: type[_Mix[_ScalarT]] = _geometries.Mix,
         multipoint_cls: type[_Multipoint[_ScalarT]] = _geometries.Multipoint,
         multipolygon_cls: type[
@@ -3134,8 +4978,17 @@ class Context(_HasRepr, _Generic[_ScalarT]):
         ] = _geometries.Multisegment,
         point_cls: type[_Point[_ScalarT]] = _geometries.Point,
         polygon_cls: type[_Polygon[_ScalarT]] = _geometries.Polygon,
+        rotation_context: _rotation.Context[
+            _ScalarT
+        ] = _rotation.plain_context,
+        scaling_context: _scaling.Context[_ScalarT] = _scaling.plain_context,
         segment_cls: type[_Segment[_ScalarT]] = _geometries.Segment,
+        segment_context: _segment.Context[_ScalarT] = _segment.plain_context,
         sqrt: _SquareRooter[_ScalarT],
+        translation_context: _translation.Context[
+            _ScalarT
+        ] = _translation.plain_context,
+        vector_context: _vector.Context[_ScalarT] = _vector.plain_context,
     ) -> _Self:
         zero = coordinate_factory(0)
         self = super().__new__(cls)
@@ -3184,34 +5037,44 @@ class Context(_HasRepr, _Generic[_ScalarT]):
             self._translation_context,
             self._vector_context,
         ) = (
-            _angular.plain_context,
-            _centroidal.plain_context,
-            _circular.plain_context,
-            _measured.plain_context,
-            _metric.plain_context,
-            _rotation.plain_context,
-            _scaling.plain_context,
-            _segment.plain_context,
-            _translation.plain_context,
-            _vector.plain_context,
+            angular_context,
+            centroidal_context,
+            circular_context,
+            measured_context,
+            metric_context,
+            rotation_context,
+            scaling_context,
+            segment_context,
+            translation_context,
+            vector_context,
         )
         return self
 
     def __eq__(self, other: _Any, /) -> _Any:
         return (
             (
-                self._box_cls is other._box_cls
+                self._angular_context == other._angular_context
+                and self._box_cls is other._box_cls
+                and self._centroidal_context == other._centroidal_context
+                and self._circular_context == other._circular_context
                 and self._contour_cls is other._contour_cls
                 and self._coordinate_factory is other._coordinate_factory
                 and self._empty_cls is other._empty_cls
+                and self._measured_context == other._measured_context
+                and self._metric_context == other._metric_context
                 and self._mix_cls is other._mix_cls
                 and self._multipoint_cls is other._multipoint_cls
                 and self._multipolygon_cls is other._multipolygon_cls
                 and self._multisegment_cls is other._multisegment_cls
                 and self._point_cls is other._point_cls
                 and self._polygon_cls is other._polygon_cls
+                and self._rotation_context == other._rotation_context
+                and self._scaling_context == other._scaling_context
                 and self._segment_cls is other._segment_cls
+                and self._segment_context == other._segment_context
                 and self._sqrt is other._sqrt
+                and self._translation_context == other._translation_context
+                and self._vector_context == other._vector_context
             )
             if isinstance(other, Context)
             else NotImplemented
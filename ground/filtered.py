@@ -0,0 +1,17 @@
+from typing import Any as _Any, Final as _Final
+
+from ._core import angular as _angular, circular as _circular
+
+#: Angular context with orientation & kind of angles
+#: evaluated in floating point arithmetic
+#: with fallback to exact rational arithmetic
+#: when the result can not be certified by the error bound,
+#: can be passed as ``angular_context`` to ``ground.context.Context``.
+angular_context: _Final[_angular.Context[_Any]] = _angular.filtered_context
+
+#: Circular context with location of a point relative to a circumcircle
+#: evaluated in floating point arithmetic
+#: with fallback to exact rational arithmetic
+#: when the result can not be certified by the error bound,
+#: can be passed as ``circular_context`` to ``ground.context.Context``.
+circular_context: _Final[_circular.Context[_Any]] = _circular.filtered_context
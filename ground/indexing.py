@@ -0,0 +1,7 @@
+from ._core import indexing as _indexing
+
+RTree = _indexing.RTree
+SlabDecomposition = _indexing.SlabDecomposition
+
+assert RTree.__module__ == __name__
+assert SlabDecomposition.__module__ == __name__
@@ -0,0 +1,68 @@
+"""
+Sub-contexts which evaluate geometries as a whole
+with NumPy arrays of coordinates instead of per-point Python loops.
+
+Module can be imported only when NumPy is installed.
+
+Coordinates of ``float`` type are represented by ``numpy.float64``
+(with point arrays viewed without copying),
+coordinates of other types are kept as Python objects,
+so exact arithmetic stays exact.
+"""
+
+from typing import Any as _Any, Final as _Final
+
+from ._core import (
+    angular as _angular,
+    centroidal as _centroidal,
+    measured as _measured,
+)
+from ._core.angular.plain.kind import kind as _plain_kind
+from ._core.angular.plain.orientation import orientation as _plain_orientation
+from ._core.angular.vectorized.orientations import (
+    orientations as _vectorized_orientations,
+)
+from ._core.centroidal.plain.segment import centroid as _segment_centroid
+from ._core.centroidal.vectorized import (
+    contour as _vectorized_contour,
+    multipoint as _vectorized_multipoint,
+    multipolygon as _vectorized_multipolygon,
+    multisegment as _vectorized_multisegment,
+    polygon as _vectorized_polygon,
+    region as _vectorized_region,
+)
+from ._core.measured.vectorized import region as _vectorized_measured_region
+
+#: Angular context with orientations of angles
+#: evaluated at once for sequences of points,
+#: can be passed as ``angular_context`` to ``ground.context.Context``.
+angular_context: _Final[_angular.Context[_Any]] = _angular.Context(
+    kind=_plain_kind,
+    orientation=_plain_orientation,
+    orientations=_vectorized_orientations,
+)
+
+#: Centroidal context with centroids of contours, multipoints,
+#: multisegments, polygons & multipolygons
+#: evaluated at once over all their vertices
+#: (and over vertices of all the polygons for batches),
+#: can be passed as ``centroidal_context`` to ``ground.context.Context``.
+centroidal_context: _Final[_centroidal.Context[_Any]] = _centroidal.Context(
+    contour_centroid=_vectorized_contour.centroid,
+    multipoint_centroid=_vectorized_multipoint.centroid,
+    multipolygon_centroid=_vectorized_multipolygon.centroid,
+    multisegment_centroid=_vectorized_multisegment.centroid,
+    polygon_centroid=_vectorized_polygon.centroid,
+    polygons_centroids=_vectorized_polygon.centroids,
+    region_centroid=_vectorized_region.centroid,
+    segment_centroid=_segment_centroid,
+)
+
+#: Measured context with signed areas of regions
+#: evaluated at once over all their vertices
+#: (and over vertices of all the regions for batches),
+#: can be passed as ``measured_context`` to ``ground.context.Context``.
+measured_context: _Final[_measured.Context[_Any]] = _measured.Context(
+    region_signed_area=_vectorized_measured_region.signed_area,
+    regions_signed_areas=_vectorized_measured_region.signed_areas,
+)
@@ -0,0 +1,9 @@
+from ._core import prepared as _prepared
+
+PreparedMultisegment = _prepared.PreparedMultisegment
+PreparedPolygon = _prepared.PreparedPolygon
+PreparedRegion = _prepared.PreparedRegion
+
+assert PreparedMultisegment.__module__ == __name__
+assert PreparedPolygon.__module__ == __name__
+assert PreparedRegion.__module__ == __name__
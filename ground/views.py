@@ -0,0 +1,13 @@
+from ._core import views as _views
+
+ContourView = _views.ContourView
+MultipointView = _views.MultipointView
+MultipolygonView = _views.MultipolygonView
+PointsView = _views.PointsView
+PolygonView = _views.PolygonView
+
+assert ContourView.__module__ == __name__
+assert MultipointView.__module__ == __name__
+assert MultipolygonView.__module__ == __name__
+assert PointsView.__module__ == __name__
+assert PolygonView.__module__ == __name__
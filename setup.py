@@ -4,7 +4,9 @@ project_base_url = 'https://github.com/lycantropos/ground/'
 
 
 setup(
-    packages=find_packages(exclude=('tests', 'tests.*')),
+    packages=find_packages(
+        exclude=('benchmarks', 'benchmarks.*', 'tests', 'tests.*')
+    ),
     url=project_base_url,
     download_url=project_base_url + 'archive/master.zip',
 )
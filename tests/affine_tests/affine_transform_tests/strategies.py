@@ -0,0 +1,31 @@
+from hypothesis import strategies as st
+
+from tests.strategies.contexts import rational_contexts
+from tests.strategies.coordinates import rational_coordinates_strategies
+from tests.strategies.geometries import to_affine_transforms, to_points
+from tests.utils import to_pairs
+
+contexts_with_points_and_transforms_pairs = st.tuples(
+    rational_contexts, rational_coordinates_strategies
+).flatmap(
+    lambda context_with_coordinates: st.tuples(
+        st.just(context_with_coordinates[0]),
+        to_points(*context_with_coordinates),
+        to_pairs(to_affine_transforms(context_with_coordinates[1])),
+    )
+)
+contexts_with_transforms_and_scalars_pairs = st.tuples(
+    rational_contexts, rational_coordinates_strategies
+).flatmap(
+    lambda context_with_coordinates: st.tuples(
+        st.just(context_with_coordinates[0]),
+        to_affine_transforms(context_with_coordinates[1]),
+        context_with_coordinates[1],
+        context_with_coordinates[1],
+    )
+)
+transforms_with_scalars_pairs = rational_coordinates_strategies.flatmap(
+    lambda coordinates: st.tuples(
+        to_affine_transforms(coordinates), coordinates, coordinates
+    )
+)
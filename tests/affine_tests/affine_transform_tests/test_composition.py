@@ -0,0 +1,55 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Point
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_points_and_transforms_pairs)
+def test_then(
+    context_with_point_and_transforms: tuple[
+        Context[ScalarT],
+        Point[ScalarT],
+        tuple[AffineTransform[ScalarT], AffineTransform[ScalarT]],
+    ],
+) -> None:
+    context, point, (first, second) = context_with_point_and_transforms
+
+    result = first.then(second)
+
+    assert context.transform_point(point, result) == context.transform_point(
+        context.transform_point(point, first), second
+    )
+
+
+@given(strategies.transforms_with_scalars_pairs)
+def test_scaled(
+    transform_with_factors: tuple[AffineTransform[ScalarT], ScalarT, ScalarT],
+) -> None:
+    transform, factor_x, factor_y = transform_with_factors
+    zero = factor_x - factor_x
+
+    result = transform.scaled(factor_x, factor_y)
+
+    assert result == transform.then(
+        AffineTransform(factor_x, zero, zero, factor_y, zero, zero)
+    )
+
+
+@given(strategies.contexts_with_transforms_and_scalars_pairs)
+def test_translated(
+    context_with_transform_and_steps: tuple[
+        Context[ScalarT], AffineTransform[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, transform, step_x, step_y = context_with_transform_and_steps
+    zero, one = context.coordinate_factory(0), context.coordinate_factory(1)
+
+    result = transform.translated(step_x, step_y)
+
+    assert result == transform.then(
+        AffineTransform(one, zero, zero, one, step_x, step_y)
+    )
@@ -0,0 +1,20 @@
+from array import array
+
+from hypothesis import strategies
+
+from ground.arrays import PointArray
+from tests.strategies.coordinates import MAX_COORDINATE, MIN_COORDINATE
+
+coordinates = strategies.floats(MIN_COORDINATE, MAX_COORDINATE)
+coordinates_pairs_lists = strategies.lists(
+    strategies.tuples(coordinates, coordinates)
+)
+point_arrays = coordinates_pairs_lists.map(
+    lambda coordinates_pairs: PointArray(
+        array(
+            'd',
+            [coordinate for pair in coordinates_pairs for coordinate in pair],
+        )
+    )
+)
+slices = strategies.slices(10)
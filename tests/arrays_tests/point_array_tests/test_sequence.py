@@ -0,0 +1,83 @@
+import sys
+from array import array
+from collections.abc import Sequence
+
+import pytest
+from hypothesis import given
+
+from ground.arrays import PointArray
+
+from . import strategies
+
+
+@given(strategies.coordinates_pairs_lists)
+def test_basic(coordinates_pairs: list[tuple[float, float]]) -> None:
+    coordinates = array(
+        'd', [coordinate for pair in coordinates_pairs for coordinate in pair]
+    )
+
+    result = PointArray(coordinates)
+
+    assert isinstance(result, Sequence)
+    assert len(result) == len(coordinates_pairs)
+    assert result.coordinates.tolist() == coordinates.tolist()
+    assert all(isinstance(point, result.point_cls) for point in result)
+    assert [(point.x, point.y) for point in result] == coordinates_pairs
+
+
+@given(strategies.point_arrays)
+def test_indexing(point_array: PointArray) -> None:
+    assert all(
+        point_array[index] == point
+        and point_array[index - len(point_array)] == point
+        for index, point in enumerate(point_array)
+    )
+    with pytest.raises(IndexError):
+        point_array[len(point_array)]
+
+
+@given(strategies.point_arrays, strategies.slices)
+def test_slicing(point_array: PointArray, slice_: slice) -> None:
+    result = point_array[slice_]
+
+    assert isinstance(result, PointArray)
+    assert list(result) == list(point_array)[slice_]
+
+
+@given(strategies.point_arrays)
+def test_buffer(point_array: PointArray) -> None:
+    result = memoryview(point_array.coordinates)
+
+    assert result.readonly
+    assert result.format == 'd'
+    assert result.tolist() == [
+        coordinate
+        for point in point_array
+        for coordinate in (point.x, point.y)
+    ]
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12),
+    reason='buffer protocol for Python classes requires Python 3.12+',
+)
+@given(strategies.point_arrays)
+def test_buffer_protocol(point_array: PointArray) -> None:
+    result = memoryview(point_array)
+
+    assert result.readonly
+    assert result.format == 'd'
+    assert result.tolist() == point_array.coordinates.tolist()
+
+
+@given(strategies.point_arrays)
+def test_repr_round_trip(point_array: PointArray) -> None:
+    result = repr(point_array)
+
+    assert (
+        eval(
+            result,
+            {array.__qualname__: array, PointArray.__qualname__: PointArray},
+        )
+        == point_array
+    )
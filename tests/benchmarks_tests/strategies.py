@@ -0,0 +1,13 @@
+from hypothesis import strategies
+
+from benchmarks.inputs import SCALAR_TYPES
+from benchmarks.running import Case, to_methods_names
+
+cases = strategies.builds(
+    Case,
+    strategies.sampled_from(to_methods_names()),
+    strategies.sampled_from(list(SCALAR_TYPES)),
+    strategies.integers(1, 10),
+)
+seconds = strategies.floats(1e-9, 1e3)
+thresholds = strategies.floats(0, 10)
@@ -0,0 +1,28 @@
+from hypothesis import given
+
+from benchmarks.running import Case, Measurement, measure, to_regressions
+
+from . import strategies
+
+
+@given(strategies.cases)
+def test_measure(case: Case) -> None:
+    result = measure(case, min_time=0.0, repeat=1, seed=0)
+
+    assert isinstance(result, Measurement)
+    assert result.case == case
+    assert result.seconds >= 0
+
+
+@given(strategies.cases, strategies.seconds, strategies.thresholds)
+def test_to_regressions(case: Case, seconds: float, threshold: float) -> None:
+    baseline = {case: seconds}
+
+    assert not to_regressions(
+        [Measurement(case, seconds)], baseline, threshold=threshold
+    )
+    assert to_regressions(
+        [Measurement(case, seconds * (2 + threshold))],
+        baseline,
+        threshold=threshold,
+    )
@@ -0,0 +1,36 @@
+from hypothesis import strategies as st
+
+from tests.context_tests.context_tests.strategies import (
+    contexts_with_contours as contexts_with_contours,
+    contexts_with_multipoints,
+    contexts_with_multipolygons,
+    contexts_with_multisegments,
+    contexts_with_polygons,
+)
+
+contexts_with_methods_names_and_geometries = st.one_of(
+    [
+        st.tuples(st.sampled_from(methods_names), contexts_with_geometries)
+        for methods_names, contexts_with_geometries in [
+            (
+                [
+                    'contour_box',
+                    'contour_centroid',
+                    'contour_length',
+                    'is_region_convex',
+                    'region_centroid',
+                    'region_signed_area',
+                ],
+                contexts_with_contours,
+            ),
+            (['multipoint_centroid'], contexts_with_multipoints),
+            (['multipolygon_centroid'], contexts_with_multipolygons),
+            (
+                ['multisegment_centroid', 'multisegment_length'],
+                contexts_with_multisegments,
+            ),
+            (['polygon_box', 'polygon_centroid'], contexts_with_polygons),
+        ]
+    ]
+)
+max_sizes = st.integers(1, 10)
@@ -0,0 +1,73 @@
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from ground.caching import CachedContext
+from ground.context import Context
+from ground.hints import Contour
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_methods_names_and_geometries)
+def test_alignment_with_context(
+    method_name_with_context_and_geometry: tuple[
+        str, tuple[Context[ScalarT], Any]
+    ],
+) -> None:
+    method_name, (context, geometry) = method_name_with_context_and_geometry
+    cached_context = CachedContext(context)
+
+    result = getattr(cached_context, method_name)(geometry)
+
+    assert result == getattr(context, method_name)(geometry)
+    assert cached_context.misses == 1
+    assert cached_context.hits == 0
+
+
+@given(strategies.contexts_with_methods_names_and_geometries)
+def test_hit(
+    method_name_with_context_and_geometry: tuple[
+        str, tuple[Context[ScalarT], Any]
+    ],
+) -> None:
+    method_name, (context, geometry) = method_name_with_context_and_geometry
+    cached_context = CachedContext(context)
+    first_result = getattr(cached_context, method_name)(geometry)
+
+    result = getattr(cached_context, method_name)(geometry)
+
+    assert result is first_result
+    assert cached_context.misses == 1
+    assert cached_context.hits == 1
+    assert cached_context.size == 1
+
+
+@given(strategies.contexts_with_contours, strategies.max_sizes)
+def test_eviction(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+    max_size: int,
+) -> None:
+    context, contour = context_with_contour
+    cached_context = CachedContext(context, max_size=max_size)
+    cached_context.region_signed_area(contour)
+    for _ in range(max_size):
+        cached_context.region_signed_area(
+            context.contour_cls(contour.vertices)
+        )
+
+    result = cached_context.region_signed_area(contour)
+
+    assert result == context.region_signed_area(contour)
+    assert cached_context.size == max_size
+    assert cached_context.hits == 0
+    assert cached_context.misses == max_size + 2
+
+
+def test_uninitialized() -> None:
+    cached_context = object.__new__(CachedContext)
+
+    with pytest.raises(AttributeError):
+        cached_context.contour_cls  # noqa: B018
@@ -1,30 +1,34 @@
 import sys
-from fractions import Fraction
 from functools import partial
 from operator import itemgetter
 
 from hypothesis import strategies as st
-from symba.base import sqrt
 
-from ground.context import Context
 from tests.strategies.contexts import (
     contexts_with_coordinates_strategies,
+    rational_contexts,
     rational_contexts_with_coordinates_strategies,
 )
+from tests.strategies.coordinates import MAX_COORDINATE, MIN_COORDINATE
 from tests.strategies.geometries import (
+    to_affine_transforms,
     to_boxes,
     to_contours,
+    to_contours_lists,
     to_contours_sequences,
     to_crossing_segments_pairs,
     to_multipoints,
     to_multipolygons,
     to_multisegments,
+    to_non_degenerate_affine_transforms,
     to_points,
     to_polygons,
+    to_polygons_lists,
     to_polygons_sequences,
     to_segments,
     to_segments_sequences,
     to_touching_segments_pairs,
+    to_vertical_multipoints,
     to_vertices_sequences,
 )
 from tests.utils import (
@@ -37,13 +41,32 @@ from tests.utils import (
     to_triplets,
 )
 
+MAX_BULK_SEQUENCE_SIZE = 50
+
 indices = st.integers(0, sys.maxsize)
-contexts = st.builds(
-    Context, coordinate_factory=st.just(Fraction), sqrt=st.just(sqrt)
+nearest_counts = st.integers(0, MAX_BULK_SEQUENCE_SIZE)
+contexts = rational_contexts
+sub_contexts_names = st.sampled_from(
+    [
+        'angular_context',
+        'centroidal_context',
+        'circular_context',
+        'measured_context',
+        'metric_context',
+        'rotation_context',
+        'scaling_context',
+        'segment_context',
+        'translation_context',
+        'vector_context',
+    ]
 )
 contexts_with_empty_lists = st.tuples(contexts, st.builds(list))
 to_contexts_with = partial(cleave_in_tuples, compose(st.just, itemgetter(0)))
+affine_transforms_factory = compose(to_affine_transforms, itemgetter(1))
 boxes_factory = pack(to_boxes)
+non_degenerate_affine_transforms_factory = compose(
+    to_non_degenerate_affine_transforms, itemgetter(1)
+)
 contours_factory = pack(to_contours)
 crossing_segments_pairs_factory = pack(to_crossing_segments_pairs)
 multipoints_factory = pack(to_multipoints)
@@ -65,6 +88,24 @@ contexts_with_boxes_pairs = contexts_with_coordinates_strategies.flatmap(
 contexts_with_boxes_triplets = contexts_with_coordinates_strategies.flatmap(
     to_contexts_with(compose(to_triplets, boxes_factory))
 )
+boxes_lists_factory = compose(
+    partial(st.lists, max_size=MAX_BULK_SEQUENCE_SIZE), boxes_factory
+)
+contexts_with_boxes_lists_and_boxes = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(boxes_lists_factory, boxes_factory)
+    )
+)
+contexts_with_boxes_lists_and_points = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(boxes_lists_factory, points_factory)
+    )
+)
+contexts_with_boxes_lists_and_segments = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(boxes_lists_factory, segments_factory)
+    )
+)
 contexts_with_boxes_and_points = contexts_with_coordinates_strategies.flatmap(
     to_contexts_with(boxes_factory, points_factory)
 )
@@ -151,6 +192,69 @@ contexts_with_segments_and_scalars_pairs = (
         to_contexts_with(segments_factory, itemgetter(1), itemgetter(1))
     )
 )
+contexts_with_contours_and_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(contours_factory, affine_transforms_factory)
+    )
+)
+contexts_with_multipoints_and_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(multipoints_factory, affine_transforms_factory)
+    )
+)
+contexts_with_multipolygons_and_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(multipolygons_factory, affine_transforms_factory)
+    )
+)
+contexts_with_multisegments_and_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(multisegments_factory, affine_transforms_factory)
+    )
+)
+contexts_with_points_and_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(points_factory, affine_transforms_factory)
+    )
+)
+contexts_with_polygons_and_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(polygons_factory, affine_transforms_factory)
+    )
+)
+contexts_with_segments_and_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(segments_factory, affine_transforms_factory)
+    )
+)
+contexts_with_contours_and_non_degenerate_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(
+            contours_factory, non_degenerate_affine_transforms_factory
+        )
+    )
+)
+contexts_with_multipoints_and_non_degenerate_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(
+            multipoints_factory, non_degenerate_affine_transforms_factory
+        )
+    )
+)
+contexts_with_multipolygons_and_non_degenerate_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(
+            multipolygons_factory, non_degenerate_affine_transforms_factory
+        )
+    )
+)
+contexts_with_polygons_and_non_degenerate_affine_transforms = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(
+            polygons_factory, non_degenerate_affine_transforms_factory
+        )
+    )
+)
 contexts_with_points_pairs = contexts_with_coordinates_strategies.flatmap(
     to_contexts_with(compose(to_pairs, points_factory))
 )
@@ -164,6 +268,34 @@ contexts_with_points_lists = contexts_with_coordinates_strategies.flatmap(
         compose(partial(st.lists, max_size=MAX_SEQUENCE_SIZE), points_factory)
     )
 )
+non_empty_float_coordinates_pairs_lists = st.lists(
+    st.tuples(
+        st.floats(MIN_COORDINATE, MAX_COORDINATE),
+        st.floats(MIN_COORDINATE, MAX_COORDINATE),
+    ),
+    min_size=1,
+    max_size=256,
+)
+unit_diamond_points_parameters_lists = st.lists(
+    st.tuples(
+        st.floats(0, 1) | st.floats(0.5 - 1e-9, 0.5 + 1e-9),
+        st.booleans(),
+        st.booleans(),
+        st.integers(-2, 2),
+    ),
+    max_size=MAX_SEQUENCE_SIZE,
+)
+float_contours_coordinates_pairs_lists = st.lists(
+    st.lists(
+        st.tuples(
+            st.floats(MIN_COORDINATE, MAX_COORDINATE),
+            st.floats(MIN_COORDINATE, MAX_COORDINATE),
+        ),
+        min_size=3,
+        max_size=MAX_SEQUENCE_SIZE,
+    ),
+    max_size=MAX_SEQUENCE_SIZE,
+)
 contexts_with_non_empty_points_lists = (
     contexts_with_coordinates_strategies.flatmap(
         to_contexts_with(
@@ -177,6 +309,17 @@ contexts_with_non_empty_points_lists = (
 contexts_with_points_triplets = contexts_with_coordinates_strategies.flatmap(
     to_contexts_with(compose(to_triplets, points_factory))
 )
+contexts_with_points_triplets_lists = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(
+            compose(
+                partial(st.lists, max_size=MAX_SEQUENCE_SIZE),
+                to_triplets,
+                points_factory,
+            )
+        )
+    )
+)
 contexts_with_points_quadruplets = (
     contexts_with_coordinates_strategies.flatmap(
         to_contexts_with(compose(to_quadruplets, points_factory))
@@ -203,11 +346,61 @@ contexts_with_rational_segments_and_points = (
         to_contexts_with(segments_factory, points_factory)
     )
 )
+contexts_with_contours_and_points = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(contours_factory, points_factory)
+    )
+)
+contexts_with_multisegments_and_points = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(multisegments_factory, points_factory)
+    )
+)
+contexts_with_multisegments_and_segments = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(multisegments_factory, segments_factory)
+    )
+)
+contexts_with_polygons_and_points = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(polygons_factory, points_factory)
+    )
+)
+contexts_with_contours_and_segments = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(contours_factory, segments_factory)
+    )
+)
+contexts_with_polygons_and_segments = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(polygons_factory, segments_factory)
+    )
+)
 contexts_with_segments_and_points = (
     contexts_with_coordinates_strategies.flatmap(
         to_contexts_with(segments_factory, points_factory)
     )
 )
+contexts_with_segments_and_points_lists = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(
+            segments_factory,
+            compose(
+                partial(st.lists, max_size=MAX_SEQUENCE_SIZE), points_factory
+            ),
+        )
+    )
+)
+contexts_with_segments_with_points_lists = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(
+            compose(
+                partial(st.lists, max_size=MAX_SEQUENCE_SIZE),
+                cleave_in_tuples(segments_factory, points_factory),
+            )
+        )
+    )
+)
 contexts_with_rational_crossing_or_touching_segments_pairs = (
     rational_contexts_with_coordinates_strategies.flatmap(
         to_contexts_with(crossing_segments_pairs_factory)
@@ -227,6 +420,24 @@ contexts_with_crossing_or_touching_segments_pairs = (
 contexts_with_multipoints = contexts_with_coordinates_strategies.flatmap(
     to_contexts_with(multipoints_factory)
 )
+contexts_with_non_singleton_multipoints = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(pack(partial(to_multipoints, min_size=2)))
+    )
+)
+contexts_with_vertical_non_singleton_multipoints = (
+    contexts_with_coordinates_strategies.flatmap(
+        to_contexts_with(
+            pack(
+                partial(
+                    to_vertical_multipoints,
+                    min_size=2,
+                    max_size=MAX_BULK_SEQUENCE_SIZE,
+                )
+            )
+        )
+    )
+)
 contexts_with_rational_multipoints = (
     rational_contexts_with_coordinates_strategies.flatmap(
         to_contexts_with(multipoints_factory)
@@ -253,6 +464,9 @@ contexts_with_contours_sequences = (
         to_contexts_with(pack(to_contours_sequences))
     )
 )
+contexts_with_contours_lists = contexts_with_coordinates_strategies.flatmap(
+    to_contexts_with(pack(to_contours_lists))
+)
 contexts_with_rational_polygons = (
     rational_contexts_with_coordinates_strategies.flatmap(
         to_contexts_with(polygons_factory)
@@ -266,6 +480,9 @@ contexts_with_polygons_sequences = (
         to_contexts_with(polygons_sequences_factory)
     )
 )
+contexts_with_polygons_lists = contexts_with_coordinates_strategies.flatmap(
+    to_contexts_with(pack(to_polygons_lists))
+)
 contexts_with_rational_multipolygons = (
     rational_contexts_with_coordinates_strategies.flatmap(
         to_contexts_with(multipolygons_factory)
@@ -274,6 +491,14 @@ contexts_with_rational_multipolygons = (
 contexts_with_multipolygons = contexts_with_coordinates_strategies.flatmap(
     to_contexts_with(multipolygons_factory)
 )
+contexts_with_segments_lists = contexts_with_coordinates_strategies.flatmap(
+    to_contexts_with(
+        compose(
+            partial(st.lists, max_size=MAX_BULK_SEQUENCE_SIZE),
+            segments_factory,
+        )
+    )
+)
 contexts_with_segments_sequences = (
     contexts_with_coordinates_strategies.flatmap(
         to_contexts_with(segments_sequences_factory)
@@ -3,6 +3,7 @@ from hypothesis import given
 from ground.context import Context
 from ground.enums import Kind
 from tests.hints import PointsPair, PointsTriplet, ScalarT
+from tests.utils import to_sign
 
 from . import strategies
 
@@ -21,6 +22,27 @@ def test_basic(
     assert isinstance(result, Kind)
 
 
+@given(strategies.contexts_with_points_triplets)
+def test_alignment_with_dot_product(
+    context_with_points_triplet: tuple[
+        Context[ScalarT], PointsTriplet[ScalarT]
+    ],
+) -> None:
+    context, points_triplet = context_with_points_triplet
+    vertex, first_ray_point, second_ray_point = points_triplet
+
+    result = context.angle_kind(vertex, first_ray_point, second_ray_point)
+
+    assert result is Kind(
+        to_sign(
+            context.dot_product(
+                vertex, first_ray_point, vertex, second_ray_point
+            ),
+            context.zero,
+        )
+    )
+
+
 @given(strategies.contexts_with_points_pairs)
 def test_same_endpoints(
     context_with_points_pair: tuple[Context[ScalarT], PointsPair[ScalarT]],
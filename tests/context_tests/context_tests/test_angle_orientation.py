@@ -5,7 +5,7 @@ from hypothesis import given
 from ground.context import Context
 from ground.enums import Orientation
 from tests.hints import PointsPair, PointsTriplet, ScalarT
-from tests.utils import is_even_permutation, permute
+from tests.utils import is_even_permutation, permute, to_sign
 
 from . import strategies
 
@@ -26,6 +26,29 @@ def test_basic(
     assert isinstance(result, Orientation)
 
 
+@given(strategies.contexts_with_points_triplets)
+def test_alignment_with_cross_product(
+    context_with_points_triplet: tuple[
+        Context[ScalarT], PointsTriplet[ScalarT]
+    ],
+) -> None:
+    context, points_triplet = context_with_points_triplet
+    vertex, first_ray_point, second_ray_point = points_triplet
+
+    result = context.angle_orientation(
+        vertex, first_ray_point, second_ray_point
+    )
+
+    assert result is Orientation(
+        to_sign(
+            context.cross_product(
+                vertex, first_ray_point, vertex, second_ray_point
+            ),
+            context.zero,
+        )
+    )
+
+
 @given(strategies.contexts_with_points_pairs)
 def test_same_endpoints(
     context_with_points_pair: tuple[Context[ScalarT], PointsPair[ScalarT]],
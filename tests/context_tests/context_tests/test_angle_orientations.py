@@ -0,0 +1,148 @@
+import math
+from array import array
+from collections.abc import Sequence
+from itertools import starmap
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Orientation
+from ground.hints import Point
+from tests.hints import PointsTriplet, ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_points_triplets_lists)
+def test_basic(
+    context_with_points_triplets: tuple[
+        Context[ScalarT], Sequence[PointsTriplet[ScalarT]]
+    ],
+) -> None:
+    context, points_triplets = context_with_points_triplets
+    vertices, first_ray_points, second_ray_points = _to_transposed(
+        points_triplets
+    )
+
+    result = context.angle_orientations(
+        vertices, first_ray_points, second_ray_points
+    )
+
+    assert isinstance(result, array)
+    assert result.typecode == 'b'
+    assert len(result) == len(points_triplets)
+    assert all(element in list(Orientation) for element in result)
+
+
+@given(strategies.contexts_with_points_triplets_lists)
+def test_alignment_with_angle_orientation(
+    context_with_points_triplets: tuple[
+        Context[ScalarT], Sequence[PointsTriplet[ScalarT]]
+    ],
+) -> None:
+    context, points_triplets = context_with_points_triplets
+    vertices, first_ray_points, second_ray_points = _to_transposed(
+        points_triplets
+    )
+
+    result = context.angle_orientations(
+        vertices, first_ray_points, second_ray_points
+    )
+
+    assert list(result) == list(
+        starmap(context.angle_orientation, points_triplets)
+    )
+
+
+@given(strategies.contexts_with_points_triplets_lists)
+def test_coordinates_buffers(
+    context_with_points_triplets: tuple[
+        Context[ScalarT], Sequence[PointsTriplet[ScalarT]]
+    ],
+) -> None:
+    context, points_triplets = context_with_points_triplets
+    angular_context: Any = context.angular_context
+    float_context = Context(
+        angular_context=angular_context,
+        coordinate_factory=float,
+        sqrt=math.sqrt,
+    )
+    float_points_triplets: list[PointsTriplet[float]] = [
+        (
+            _to_float_point(vertex, float_context),
+            _to_float_point(first_ray_point, float_context),
+            _to_float_point(second_ray_point, float_context),
+        )
+        for vertex, first_ray_point, second_ray_point in points_triplets
+    ]
+    vertices, first_ray_points, second_ray_points = _to_transposed(
+        float_points_triplets
+    )
+
+    result = float_context.angle_orientations(
+        _to_coordinates_buffer(vertices),
+        _to_coordinates_buffer(first_ray_points),
+        _to_coordinates_buffer(second_ray_points),
+    )
+
+    assert list(result) == list(
+        starmap(float_context.angle_orientation, float_points_triplets)
+    )
+
+
+@given(strategies.contexts_with_points_triplets_lists)
+def test_mixed_inputs(
+    context_with_points_triplets: tuple[
+        Context[ScalarT], Sequence[PointsTriplet[ScalarT]]
+    ],
+) -> None:
+    context, points_triplets = context_with_points_triplets
+    angular_context: Any = context.angular_context
+    float_context = Context(
+        angular_context=angular_context,
+        coordinate_factory=float,
+        sqrt=math.sqrt,
+    )
+    float_points_triplets: list[PointsTriplet[float]] = [
+        (
+            _to_float_point(vertex, float_context),
+            _to_float_point(first_ray_point, float_context),
+            _to_float_point(second_ray_point, float_context),
+        )
+        for vertex, first_ray_point, second_ray_point in points_triplets
+    ]
+    vertices, first_ray_points, second_ray_points = _to_transposed(
+        float_points_triplets
+    )
+
+    with pytest.raises(TypeError, match='either all buffers'):
+        float_context.angle_orientations(
+            _to_coordinates_buffer(vertices),
+            first_ray_points,
+            second_ray_points,
+        )
+
+
+def _to_coordinates_buffer(points: Sequence[Point[float]]) -> 'array[float]':
+    return array(
+        'd',
+        [coordinate for point in points for coordinate in (point.x, point.y)],
+    )
+
+
+def _to_float_point(
+    point: Point[Any], context: Context[float]
+) -> Point[float]:
+    return context.point_cls(float(point.x), float(point.y))
+
+
+def _to_transposed(
+    points_triplets: Sequence[PointsTriplet[ScalarT]],
+) -> tuple[list[Point[ScalarT]], list[Point[ScalarT]], list[Point[ScalarT]]]:
+    return (
+        [vertex for vertex, _, _ in points_triplets],
+        [first_ray_point for _, first_ray_point, _ in points_triplets],
+        [second_ray_point for _, _, second_ray_point in points_triplets],
+    )
@@ -0,0 +1,86 @@
+from collections.abc import Sequence
+from functools import reduce
+
+import pytest
+from hypothesis import given
+
+from ground.boxed import BoxAccumulator
+from ground.context import Context
+from ground.hints import Box, Point, Segment
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts)
+def test_basic(context: Context[ScalarT]) -> None:
+    result = context.box_accumulator()
+
+    assert isinstance(result, BoxAccumulator)
+    assert result.box_cls is context.box_cls
+    assert result.is_empty
+    with pytest.raises(ValueError, match='empty'):
+        result.to_box()
+
+
+@given(strategies.contexts_with_non_empty_points_lists)
+def test_points(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    result = context.box_accumulator()
+    for point in points:
+        result.add_point(point)
+
+    assert not result.is_empty
+    assert result.to_box() == context.points_box(points)
+
+
+@given(strategies.contexts_with_segments_lists)
+def test_segments(
+    context_with_segments: tuple[Context[ScalarT], Sequence[Segment[ScalarT]]],
+) -> None:
+    context, segments = context_with_segments
+
+    result = context.box_accumulator()
+    for segment in segments:
+        result.add_segment(segment)
+
+    assert result.is_empty is (not segments)
+    assert not segments or result.to_box() == context.segments_box(segments)
+
+
+@given(strategies.contexts_with_boxes_lists_and_boxes)
+def test_boxes(
+    context_with_boxes_and_box: tuple[
+        Context[ScalarT], Sequence[Box[ScalarT]], Box[ScalarT]
+    ],
+) -> None:
+    context, boxes, box = context_with_boxes_and_box
+
+    result = context.box_accumulator()
+    for box_ in [box, *boxes]:
+        result.add_box(box_)
+
+    assert result.to_box() == reduce(context.merged_box, boxes, box)
+
+
+@given(strategies.contexts_with_boxes_lists_and_boxes, strategies.indices)
+def test_merge(
+    context_with_boxes_and_box: tuple[
+        Context[ScalarT], Sequence[Box[ScalarT]], Box[ScalarT]
+    ],
+    index: int,
+) -> None:
+    context, boxes, box = context_with_boxes_and_box
+    boxes = [box, *boxes]
+    first, second = context.box_accumulator(), context.box_accumulator()
+    for box_ in boxes[:index]:
+        first.add_box(box_)
+    for box_ in boxes[index:]:
+        second.add_box(box_)
+
+    first.merge(second)
+
+    assert first.to_box() == reduce(context.merged_box, boxes)
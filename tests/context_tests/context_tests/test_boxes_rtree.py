@@ -0,0 +1,129 @@
+from collections.abc import Sequence
+
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Box, Point, Segment
+from ground.indexing import RTree
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_boxes_lists_and_boxes)
+def test_basic(
+    context_with_boxes_and_box: tuple[
+        Context[ScalarT], Sequence[Box[ScalarT]], Box[ScalarT]
+    ],
+) -> None:
+    context, boxes, _ = context_with_boxes_and_box
+
+    result = context.boxes_rtree(boxes)
+
+    assert isinstance(result, RTree)
+    assert result.boxes is boxes
+
+
+@given(strategies.contexts_with_boxes_lists_and_boxes)
+def test_find_intersecting(
+    context_with_boxes_and_box: tuple[
+        Context[ScalarT], Sequence[Box[ScalarT]], Box[ScalarT]
+    ],
+) -> None:
+    context, boxes, box = context_with_boxes_and_box
+
+    result = context.boxes_rtree(boxes).find_intersecting(box)
+
+    assert result == [
+        index
+        for index, candidate in enumerate(boxes)
+        if (
+            candidate.min_x <= box.max_x
+            and box.min_x <= candidate.max_x
+            and candidate.min_y <= box.max_y
+            and box.min_y <= candidate.max_y
+        )
+    ]
+
+
+@given(
+    strategies.contexts_with_boxes_lists_and_points, strategies.nearest_counts
+)
+def test_find_n_nearest_to_point(
+    context_with_boxes_and_point: tuple[
+        Context[ScalarT], Sequence[Box[ScalarT]], Point[ScalarT]
+    ],
+    n: int,
+) -> None:
+    context, boxes, point = context_with_boxes_and_point
+
+    result = context.boxes_rtree(boxes).find_n_nearest_to_point(n, point)
+
+    assert len(result) == len(set(result)) == min(n, len(boxes))
+    assert [
+        context.box_point_squared_distance(boxes[index], point)
+        for index in result
+    ] == sorted(
+        context.box_point_squared_distance(box, point) for box in boxes
+    )[:n]
+
+
+@given(
+    strategies.contexts_with_boxes_lists_and_segments,
+    strategies.nearest_counts,
+)
+def test_find_n_nearest_to_segment(
+    context_with_boxes_and_segment: tuple[
+        Context[ScalarT], Sequence[Box[ScalarT]], Segment[ScalarT]
+    ],
+    n: int,
+) -> None:
+    context, boxes, segment = context_with_boxes_and_segment
+
+    result = context.boxes_rtree(boxes).find_n_nearest_to_segment(n, segment)
+
+    assert len(result) == len(set(result)) == min(n, len(boxes))
+    assert [
+        context.box_segment_squared_distance(boxes[index], segment)
+        for index in result
+    ] == sorted(
+        context.box_segment_squared_distance(box, segment) for box in boxes
+    )[:n]
+
+
+@given(strategies.contexts_with_boxes_lists_and_points)
+def test_iter_nearest_to_point(
+    context_with_boxes_and_point: tuple[
+        Context[ScalarT], Sequence[Box[ScalarT]], Point[ScalarT]
+    ],
+) -> None:
+    context, boxes, point = context_with_boxes_and_point
+
+    result = list(context.boxes_rtree(boxes).iter_nearest_to_point(point))
+
+    assert sorted(result) == list(range(len(boxes)))
+    assert [
+        context.box_point_squared_distance(boxes[index], point)
+        for index in result
+    ] == sorted(
+        context.box_point_squared_distance(box, point) for box in boxes
+    )
+
+
+@given(strategies.contexts_with_boxes_lists_and_segments)
+def test_iter_nearest_to_segment(
+    context_with_boxes_and_segment: tuple[
+        Context[ScalarT], Sequence[Box[ScalarT]], Segment[ScalarT]
+    ],
+) -> None:
+    context, boxes, segment = context_with_boxes_and_segment
+
+    result = list(context.boxes_rtree(boxes).iter_nearest_to_segment(segment))
+
+    assert sorted(result) == list(range(len(boxes)))
+    assert [
+        context.box_segment_squared_distance(boxes[index], segment)
+        for index in result
+    ] == sorted(
+        context.box_segment_squared_distance(box, segment) for box in boxes
+    )
@@ -0,0 +1,61 @@
+import pytest
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Contour
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_contours_and_non_degenerate_affine_transforms)
+def test_basic(
+    context_with_contour_and_transform: tuple[
+        Context[ScalarT], Contour[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, contour, transform = context_with_contour_and_transform
+
+    result = context.contour_view(contour, transform)
+
+    assert result.source is contour
+    assert result.transform is transform
+
+
+@given(strategies.contexts_with_contours_and_non_degenerate_affine_transforms)
+def test_alignment_with_transform_contour(
+    context_with_contour_and_transform: tuple[
+        Context[ScalarT], Contour[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, contour, transform = context_with_contour_and_transform
+
+    result = context.contour_view(contour, transform)
+
+    transformed = context.transform_contour(contour, transform)
+    assert isinstance(transformed, context.contour_cls)
+    assert list(result.vertices) == list(transformed.vertices)
+    assert context.contour_box(result) == context.contour_box(transformed)
+    assert context.contour_length(result) == context.contour_length(
+        transformed
+    )
+    assert context.region_centroid(result) == context.region_centroid(
+        transformed
+    )
+    assert context.region_signed_area(result) == context.region_signed_area(
+        transformed
+    )
+
+
+@given(strategies.contexts_with_contours)
+def test_degenerate_transform(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+) -> None:
+    context, contour = context_with_contour
+    zero = context.zero
+
+    with pytest.raises(ValueError, match='non-degenerate'):
+        context.contour_view(
+            contour, AffineTransform(zero, zero, zero, zero, zero, zero)
+        )
@@ -1,5 +1,6 @@
 from hypothesis import given
 
+from ground._core import circular
 from ground.context import Context
 from ground.enums import Location
 from tests.hints import PointsQuadruplet, PointsTriplet, ScalarT
@@ -24,6 +25,25 @@ def test_basic(
     assert isinstance(result, Location)
 
 
+@given(strategies.contexts_with_points_quadruplets)
+def test_alignment_with_plain_context(
+    context_with_points_quadruplet: tuple[
+        Context[ScalarT], PointsQuadruplet[ScalarT]
+    ],
+) -> None:
+    context, points_quadruplet = context_with_points_quadruplet
+    point, first_point, second_point, third_point = points_quadruplet
+
+    result = context.locate_point_in_point_point_point_circle(
+        point, first_point, second_point, third_point
+    )
+
+    plain_context = context.replace(circular_context=circular.plain_context)
+    assert result is plain_context.locate_point_in_point_point_point_circle(
+        point, first_point, second_point, third_point
+    )
+
+
 @given(strategies.contexts_with_points_triplets)
 def test_degenerate_cases(
     context_with_points_triplet: tuple[
@@ -0,0 +1,83 @@
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Location
+from ground.hints import Point, Polygon
+from tests.hints import ScalarT
+from tests.utils import reverse_point_coordinates, reverse_polygon_coordinates
+
+from . import strategies
+
+
+@given(strategies.contexts_with_polygons_and_points)
+def test_basic(
+    context_with_polygon_and_point: tuple[
+        Context[ScalarT], Polygon[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, polygon, point = context_with_polygon_and_point
+
+    result = context.locate_point_in_polygon(point, polygon)
+
+    assert isinstance(result, Location)
+
+
+@given(strategies.contexts_with_polygons)
+def test_vertices(
+    context_with_polygon: tuple[Context[ScalarT], Polygon[ScalarT]],
+) -> None:
+    context, polygon = context_with_polygon
+
+    assert all(
+        context.locate_point_in_polygon(vertex, polygon) is Location.BOUNDARY
+        for contour in (polygon.border, *polygon.holes)
+        for vertex in contour.vertices
+    )
+
+
+@given(strategies.contexts_with_polygons_and_points)
+def test_reversals(
+    context_with_polygon_and_point: tuple[
+        Context[ScalarT], Polygon[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, polygon, point = context_with_polygon_and_point
+
+    result = context.locate_point_in_polygon(point, polygon)
+
+    assert result is context.locate_point_in_polygon(
+        reverse_point_coordinates(point), reverse_polygon_coordinates(polygon)
+    )
+
+
+@given(strategies.contexts_with_polygons_and_points)
+def test_alignment_with_locate_point_in_region(
+    context_with_polygon_and_point: tuple[
+        Context[ScalarT], Polygon[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, polygon, point = context_with_polygon_and_point
+
+    result = context.locate_point_in_polygon(point, polygon)
+
+    location_in_border = context.locate_point_in_region(point, polygon.border)
+    assert (result is Location.EXTERIOR) is (
+        location_in_border is Location.EXTERIOR
+        or any(
+            context.locate_point_in_region(point, hole) is Location.INTERIOR
+            for hole in polygon.holes
+        )
+    )
+
+
+@given(strategies.contexts_with_polygons_and_points)
+def test_alignment_with_polygon_slab_decomposition(
+    context_with_polygon_and_point: tuple[
+        Context[ScalarT], Polygon[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, polygon, point = context_with_polygon_and_point
+
+    result = context.locate_point_in_polygon(point, polygon)
+
+    assert result is context.polygon_slab_decomposition(polygon).locate(point)
@@ -0,0 +1,82 @@
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Location
+from ground.hints import Contour, Point
+from tests.hints import ScalarT
+from tests.utils import (
+    reverse_contour,
+    reverse_contour_coordinates,
+    reverse_point_coordinates,
+)
+
+from . import strategies
+
+
+@given(strategies.contexts_with_contours_and_points)
+def test_basic(
+    context_with_contour_and_point: tuple[
+        Context[ScalarT], Contour[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, contour, point = context_with_contour_and_point
+
+    result = context.locate_point_in_region(point, contour)
+
+    assert isinstance(result, Location)
+
+
+@given(strategies.contexts_with_contours)
+def test_vertices(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+) -> None:
+    context, contour = context_with_contour
+
+    assert all(
+        context.locate_point_in_region(vertex, contour) is Location.BOUNDARY
+        for vertex in contour.vertices
+    )
+
+
+@given(strategies.contexts_with_contours)
+def test_centroid(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+) -> None:
+    context, contour = context_with_contour
+
+    result = context.locate_point_in_region(
+        context.region_centroid(contour), contour
+    )
+
+    assert result is Location.INTERIOR
+
+
+@given(strategies.contexts_with_contours_and_points)
+def test_reversals(
+    context_with_contour_and_point: tuple[
+        Context[ScalarT], Contour[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, contour, point = context_with_contour_and_point
+
+    result = context.locate_point_in_region(point, contour)
+
+    assert result is context.locate_point_in_region(
+        point, reverse_contour(contour)
+    )
+    assert result is context.locate_point_in_region(
+        reverse_point_coordinates(point), reverse_contour_coordinates(contour)
+    )
+
+
+@given(strategies.contexts_with_contours_and_points)
+def test_alignment_with_region_slab_decomposition(
+    context_with_contour_and_point: tuple[
+        Context[ScalarT], Contour[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, contour, point = context_with_contour_and_point
+
+    result = context.locate_point_in_region(point, contour)
+
+    assert result is context.region_slab_decomposition(contour).locate(point)
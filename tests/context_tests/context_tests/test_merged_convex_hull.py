@@ -0,0 +1,43 @@
+from collections import abc
+from collections.abc import Sequence
+
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Point
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_points_lists, strategies.indices)
+def test_basic(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+    index: int,
+) -> None:
+    context, points = context_with_points
+    first_hull, second_hull = (
+        context.points_convex_hull(points[:index]),
+        context.points_convex_hull(points[index:]),
+    )
+
+    result = context.merged_convex_hull(first_hull, second_hull)
+
+    assert isinstance(result, abc.Sequence)
+    assert all(isinstance(element, context.point_cls) for element in result)
+
+
+@given(strategies.contexts_with_points_lists, strategies.indices)
+def test_alignment_with_points_convex_hull(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+    index: int,
+) -> None:
+    context, points = context_with_points
+    first_hull, second_hull = (
+        context.points_convex_hull(points[:index]),
+        context.points_convex_hull(points[index:]),
+    )
+
+    result = context.merged_convex_hull(first_hull, second_hull)
+
+    assert result == context.points_convex_hull(points)
@@ -0,0 +1,81 @@
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Multipoint
+from tests.hints import ScalarT
+from tests.utils import reverse_multipoint
+
+from . import strategies
+
+
+@given(strategies.contexts_with_non_singleton_multipoints)
+def test_basic(
+    context_with_multipoint: tuple[Context[ScalarT], Multipoint[ScalarT]],
+) -> None:
+    context, multipoint = context_with_multipoint
+
+    result = context.multipoint_closest_pair(multipoint)
+
+    assert isinstance(result, tuple)
+    assert len(result) == 2
+    assert all(isinstance(element, int) for element in result)
+    first_index, second_index = result
+    assert 0 <= first_index < second_index < len(multipoint.points)
+
+
+@given(strategies.contexts_with_non_singleton_multipoints)
+def test_alignment_with_points_squared_distance(
+    context_with_multipoint: tuple[Context[ScalarT], Multipoint[ScalarT]],
+) -> None:
+    context, multipoint = context_with_multipoint
+    points = multipoint.points
+
+    first_index, second_index = context.multipoint_closest_pair(multipoint)
+
+    assert context.points_squared_distance(
+        points[first_index], points[second_index]
+    ) == min(
+        context.points_squared_distance(point, other_point)
+        for index, point in enumerate(points)
+        for other_point in points[index + 1 :]
+    )
+
+
+@given(strategies.contexts_with_non_singleton_multipoints)
+def test_reversals(
+    context_with_multipoint: tuple[Context[ScalarT], Multipoint[ScalarT]],
+) -> None:
+    context, multipoint = context_with_multipoint
+    points = multipoint.points
+    reversed_multipoint = reverse_multipoint(multipoint)
+    reversed_points = reversed_multipoint.points
+
+    first_index, second_index = context.multipoint_closest_pair(multipoint)
+
+    reversed_first_index, reversed_second_index = (
+        context.multipoint_closest_pair(reversed_multipoint)
+    )
+    assert context.points_squared_distance(
+        points[first_index], points[second_index]
+    ) == context.points_squared_distance(
+        reversed_points[reversed_first_index],
+        reversed_points[reversed_second_index],
+    )
+
+
+@given(strategies.contexts_with_vertical_non_singleton_multipoints)
+def test_vertical(
+    context_with_multipoint: tuple[Context[ScalarT], Multipoint[ScalarT]],
+) -> None:
+    context, multipoint = context_with_multipoint
+    points = multipoint.points
+
+    first_index, second_index = context.multipoint_closest_pair(multipoint)
+
+    assert context.points_squared_distance(
+        points[first_index], points[second_index]
+    ) == min(
+        context.points_squared_distance(point, other_point)
+        for index, point in enumerate(points)
+        for other_point in points[index + 1 :]
+    )
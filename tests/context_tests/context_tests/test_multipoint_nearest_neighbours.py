@@ -0,0 +1,64 @@
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Multipoint
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_non_singleton_multipoints)
+def test_basic(
+    context_with_multipoint: tuple[Context[ScalarT], Multipoint[ScalarT]],
+) -> None:
+    context, multipoint = context_with_multipoint
+
+    result = context.multipoint_nearest_neighbours(multipoint)
+
+    assert isinstance(result, list)
+    assert len(result) == len(multipoint.points)
+    assert all(isinstance(element, int) for element in result)
+    assert all(
+        0 <= element < len(multipoint.points) and element != index
+        for index, element in enumerate(result)
+    )
+
+
+@given(strategies.contexts_with_non_singleton_multipoints)
+def test_alignment_with_points_squared_distance(
+    context_with_multipoint: tuple[Context[ScalarT], Multipoint[ScalarT]],
+) -> None:
+    context, multipoint = context_with_multipoint
+    points = multipoint.points
+
+    result = context.multipoint_nearest_neighbours(multipoint)
+
+    assert all(
+        context.points_squared_distance(point, points[neighbour_index])
+        == min(
+            context.points_squared_distance(point, other_point)
+            for other_index, other_point in enumerate(points)
+            if other_index != index
+        )
+        for index, (point, neighbour_index) in enumerate(
+            zip(points, result, strict=True)
+        )
+    )
+
+
+@given(strategies.contexts_with_non_singleton_multipoints)
+def test_alignment_with_multipoint_closest_pair(
+    context_with_multipoint: tuple[Context[ScalarT], Multipoint[ScalarT]],
+) -> None:
+    context, multipoint = context_with_multipoint
+    points = multipoint.points
+
+    result = context.multipoint_nearest_neighbours(multipoint)
+
+    first_index, second_index = context.multipoint_closest_pair(multipoint)
+    assert min(
+        context.points_squared_distance(point, points[neighbour_index])
+        for point, neighbour_index in zip(points, result, strict=True)
+    ) == context.points_squared_distance(
+        points[first_index], points[second_index]
+    )
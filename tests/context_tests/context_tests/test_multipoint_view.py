@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Multipoint
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(
+    strategies.contexts_with_multipoints_and_non_degenerate_affine_transforms
+)
+def test_alignment_with_transform_multipoint(
+    context_with_multipoint_and_transform: tuple[
+        Context[ScalarT], Multipoint[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, multipoint, transform = context_with_multipoint_and_transform
+
+    result = context.multipoint_view(multipoint, transform)
+
+    transformed = context.transform_multipoint(multipoint, transform)
+    assert list(result.points) == list(transformed.points)
+    assert context.multipoint_centroid(result) == (
+        context.multipoint_centroid(transformed)
+    )
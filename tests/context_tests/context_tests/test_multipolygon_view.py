@@ -0,0 +1,30 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Multipolygon
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(
+    strategies.contexts_with_multipolygons_and_non_degenerate_affine_transforms
+)
+def test_alignment_with_transform_multipolygon(
+    context_with_multipolygon_and_transform: tuple[
+        Context[ScalarT], Multipolygon[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, multipolygon, transform = context_with_multipolygon_and_transform
+
+    result = context.multipolygon_view(multipolygon, transform)
+
+    transformed = context.transform_multipolygon(multipolygon, transform)
+    assert isinstance(transformed, context.multipolygon_cls)
+    assert [context.polygon_box(polygon) for polygon in result.polygons] == [
+        context.polygon_box(polygon) for polygon in transformed.polygons
+    ]
+    assert context.multipolygon_centroid(result) == (
+        context.multipolygon_centroid(transformed)
+    )
@@ -0,0 +1,66 @@
+import pytest
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Multisegment, Point
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_multisegments_and_points)
+def test_basic(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+
+    result = context.nearest_segment(multisegment, point)
+
+    assert isinstance(result, int)
+    assert 0 <= result < len(multisegment.segments)
+
+
+@given(strategies.contexts_with_multisegments_and_points)
+def test_alignment(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+
+    result = context.nearest_segment(multisegment, point)
+
+    assert context.segment_point_squared_distance(
+        multisegment.segments[result], point
+    ) == min(
+        context.segment_point_squared_distance(segment, point)
+        for segment in multisegment.segments
+    )
+    assert result == context.nearest_segments(multisegment, point, 1)[0]
+
+
+@given(strategies.contexts_with_multisegments_and_points)
+def test_prepared(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+
+    result = context.nearest_segment(
+        context.prepare_multisegment(multisegment), point
+    )
+
+    assert result == context.nearest_segment(multisegment, point)
+
+
+@given(strategies.contexts_with_points)
+def test_empty(
+    context_with_point: tuple[Context[ScalarT], Point[ScalarT]],
+) -> None:
+    context, point = context_with_point
+
+    with pytest.raises(ValueError, match='at least 1 segment'):
+        context.nearest_segment(context.multisegment_cls([]), point)
@@ -0,0 +1,121 @@
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Multisegment, Point
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(
+    strategies.contexts_with_multisegments_and_points,
+    strategies.nearest_counts,
+)
+def test_basic(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+    count: int,
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+
+    result = context.nearest_segments(multisegment, point, count)
+
+    assert isinstance(result, list)
+    assert len(result) == min(count, len(multisegment.segments))
+    assert all(isinstance(element, int) for element in result)
+    assert len(set(result)) == len(result)
+
+
+@given(
+    strategies.contexts_with_multisegments_and_points,
+    strategies.nearest_counts,
+)
+def test_alignment(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+    count: int,
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+
+    result = context.nearest_segments(multisegment, point, count)
+
+    assert (
+        result
+        == [
+            index
+            for _, index in sorted(
+                (context.segment_point_squared_distance(segment, point), index)
+                for index, segment in enumerate(multisegment.segments)
+            )
+        ][:count]
+    )
+
+
+@given(
+    strategies.contexts_with_multisegments_and_points,
+    strategies.nearest_counts,
+    strategies.indices,
+)
+def test_max_squared_distance(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+    count: int,
+    index: int,
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+    squared_distances = [
+        context.segment_point_squared_distance(segment, point)
+        for segment in multisegment.segments
+    ]
+    max_squared_distance = squared_distances[index % len(squared_distances)]
+
+    result = context.nearest_segments(
+        multisegment, point, count, max_squared_distance=max_squared_distance
+    )
+
+    assert all(
+        squared_distances[element] <= max_squared_distance
+        for element in result
+    )
+    assert (
+        result
+        == [
+            element
+            for element in context.nearest_segments(
+                multisegment, point, len(squared_distances)
+            )
+            if squared_distances[element] <= max_squared_distance
+        ][:count]
+    )
+
+
+@given(
+    strategies.contexts_with_multisegments_and_points,
+    strategies.nearest_counts,
+    strategies.indices,
+)
+def test_prepared(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+    count: int,
+    index: int,
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+    max_squared_distance = context.segment_point_squared_distance(
+        multisegment.segments[index % len(multisegment.segments)], point
+    )
+
+    prepared = context.prepare_multisegment(multisegment)
+
+    assert context.nearest_segments(
+        prepared, point, count
+    ) == context.nearest_segments(multisegment, point, count)
+    assert context.nearest_segments(
+        prepared, point, count, max_squared_distance=max_squared_distance
+    ) == context.nearest_segments(
+        multisegment, point, count, max_squared_distance=max_squared_distance
+    )
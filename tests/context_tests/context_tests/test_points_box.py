@@ -1,7 +1,10 @@
+import math
+from array import array
 from collections.abc import Sequence
 
 from hypothesis import given
 
+from ground.arrays import PointArray
 from ground.context import Context
 from ground.hints import Point
 from tests.hints import ScalarT
@@ -50,3 +53,18 @@ def test_permutations(
     result = context.points_box(points)
 
     assert result == context.points_box(permute(points, index))
+
+
+@given(strategies.non_empty_float_coordinates_pairs_lists)
+def test_point_array(coordinates_pairs: list[tuple[float, float]]) -> None:
+    context = Context(coordinate_factory=float, sqrt=math.sqrt)
+    point_array = PointArray(
+        array(
+            'd',
+            [coordinate for pair in coordinates_pairs for coordinate in pair],
+        )
+    )
+
+    result = context.points_box(point_array)
+
+    assert result == context.points_box(list(point_array))
@@ -1,8 +1,12 @@
 from collections import abc
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
 
+import pytest
 from hypothesis import given
 
+from ground._core import discrete
 from ground.context import Context
 from ground.hints import Point
 from tests.hints import ScalarT
@@ -11,6 +15,12 @@ from tests.utils import equivalence, permute, to_contour_vertices_orientation
 from . import strategies
 
 
+@pytest.fixture(scope='module')
+def executor() -> Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor(2) as result:
+        yield result
+
+
 @given(strategies.contexts_with_points_lists)
 def test_basic(
     context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
@@ -85,3 +95,121 @@ def test_step(
         ),
         result == next_result,
     )
+
+
+@given(strategies.contexts_with_points_lists)
+def test_iterable(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    result = context.points_convex_hull(iter(points))
+
+    assert result == context.points_convex_hull(points)
+
+
+@given(strategies.contexts_with_points_lists)
+def test_output_sensitive(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    result = context.points_convex_hull(points, output_sensitive=True)
+
+    assert result == context.points_convex_hull(points)
+
+
+@given(strategies.contexts_with_points_lists)
+def test_output_sensitive_groups(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    with patch.object(discrete, 'CONVEX_HULL_INITIAL_GROUPS_SIZE', 2):
+        result = context.points_convex_hull(points, output_sensitive=True)
+
+    assert result == context.points_convex_hull(points)
+
+
+@given(strategies.contexts_with_points_lists)
+def test_prune(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    result = context.points_convex_hull(points, prune=True)
+
+    assert result == context.points_convex_hull(points)
+
+
+@given(strategies.contexts_with_points_lists)
+def test_parallel(
+    executor: ProcessPoolExecutor,
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    result = context.points_convex_hull(points, executor=executor)
+
+    assert result == context.points_convex_hull(points)
+
+
+@given(strategies.contexts_with_points_lists)
+def test_parallel_chunks(
+    executor: ProcessPoolExecutor,
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    # points are split into several chunks which hulls are merged
+    with patch.object(discrete, 'CONVEX_HULL_CHUNK_SIZE', 2):
+        result = context.points_convex_hull(points, executor=executor)
+
+    assert result == context.points_convex_hull(points)
+
+
+@given(strategies.contexts_with_points_lists)
+def test_prune_callback(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+    pruned_counts: list[int] = []
+
+    result = context.points_convex_hull(
+        points, prune_callback=pruned_counts.append
+    )
+
+    assert result == context.points_convex_hull(points)
+    assert pruned_counts == [
+        len(points) - len(context.points_convex_hull_candidates(points))
+    ]
+
+
+@given(strategies.contexts_with_points_lists)
+def test_prune_callback_chunks(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+    pruned_counts: list[int] = []
+
+    with patch.object(discrete, 'CONVEX_HULL_CHUNK_SIZE', 3):
+        result = context.points_convex_hull(
+            iter(points), prune_callback=pruned_counts.append
+        )
+
+    assert result == context.points_convex_hull(points)
+    assert len(pruned_counts) == -(-len(points) // 3)
+    assert sum(pruned_counts) <= len(points) - len(result)
+
+
+@given(strategies.contexts_with_points_lists)
+def test_prune_callback_with_executor(
+    executor: ProcessPoolExecutor,
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    with pytest.raises(ValueError, match='along with executor'):
+        context.points_convex_hull(
+            points, executor=executor, prune_callback=print
+        )
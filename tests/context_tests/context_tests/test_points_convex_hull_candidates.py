@@ -0,0 +1,92 @@
+import math
+from collections import abc
+from collections.abc import Sequence
+
+from hypothesis import given
+
+from ground import filtered
+from ground.context import Context
+from ground.hints import Point
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_points_lists)
+def test_basic(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    result = context.points_convex_hull_candidates(points)
+
+    assert isinstance(result, abc.Sequence)
+    assert all(isinstance(element, context.point_cls) for element in result)
+
+
+@given(strategies.contexts_with_points_lists)
+def test_subsequence(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    result = context.points_convex_hull_candidates(points)
+
+    points_iterator = iter(points)
+    assert all(
+        any(point is candidate for point in points_iterator)
+        for candidate in result
+    )
+
+
+@given(strategies.contexts_with_points_lists)
+def test_convex_hull(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+
+    result = context.points_convex_hull_candidates(points)
+
+    assert context.points_convex_hull(result) == context.points_convex_hull(
+        points
+    )
+
+
+@given(strategies.unit_diamond_points_parameters_lists)
+def test_near_degenerate_float_coordinates(
+    points_parameters: list[tuple[float, bool, bool, int]],
+) -> None:
+    context = Context(
+        angular_context=filtered.angular_context,
+        coordinate_factory=float,
+        sqrt=math.sqrt,
+    )
+    # points lie within few ulps from edges of the unit diamond
+    points = [
+        context.point_cls(-1.0, 0.0),
+        context.point_cls(0.0, -1.0),
+        context.point_cls(1.0, 0.0),
+        context.point_cls(0.0, 1.0),
+        *[
+            context.point_cls(
+                -abscissa if is_left else abscissa,
+                _shift_by_ulps(
+                    -(1.0 - abscissa) if is_lower else 1.0 - abscissa,
+                    ulps_shift,
+                ),
+            )
+            for abscissa, is_left, is_lower, ulps_shift in points_parameters
+        ],
+    ]
+
+    result = context.points_convex_hull_candidates(points)
+
+    assert context.points_convex_hull(result) == context.points_convex_hull(
+        points
+    )
+
+
+def _shift_by_ulps(value: float, ulps_shift: int, /) -> float:
+    for _ in range(abs(ulps_shift)):
+        value = math.nextafter(value, math.copysign(math.inf, ulps_shift))
+    return value
@@ -0,0 +1,34 @@
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Location
+from ground.hints import Polygon
+from ground.indexing import SlabDecomposition
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_polygons)
+def test_basic(
+    context_with_polygon: tuple[Context[ScalarT], Polygon[ScalarT]],
+) -> None:
+    context, polygon = context_with_polygon
+
+    result = context.polygon_slab_decomposition(polygon)
+
+    assert isinstance(result, SlabDecomposition)
+    assert result.contours == [polygon.border, *polygon.holes]
+
+
+@given(strategies.contexts_with_polygons)
+def test_centroid(
+    context_with_polygon: tuple[Context[ScalarT], Polygon[ScalarT]],
+) -> None:
+    context, polygon = context_with_polygon
+
+    result = context.polygon_slab_decomposition(polygon)
+
+    assert (
+        result.locate(context.polygon_centroid(polygon)) is Location.INTERIOR
+    )
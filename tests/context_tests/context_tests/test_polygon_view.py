@@ -0,0 +1,30 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Polygon
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_polygons_and_non_degenerate_affine_transforms)
+def test_alignment_with_transform_polygon(
+    context_with_polygon_and_transform: tuple[
+        Context[ScalarT], Polygon[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, polygon, transform = context_with_polygon_and_transform
+
+    result = context.polygon_view(polygon, transform)
+
+    transformed = context.transform_polygon(polygon, transform)
+    assert isinstance(transformed, context.polygon_cls)
+    assert list(result.border.vertices) == list(transformed.border.vertices)
+    assert [list(hole.vertices) for hole in result.holes] == [
+        list(hole.vertices) for hole in transformed.holes
+    ]
+    assert context.polygon_box(result) == context.polygon_box(transformed)
+    assert context.polygon_centroid(result) == context.polygon_centroid(
+        transformed
+    )
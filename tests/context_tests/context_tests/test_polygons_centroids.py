@@ -0,0 +1,101 @@
+import math
+from array import array
+from collections.abc import Sequence
+
+from hypothesis import assume, given
+
+from ground.arrays import PointArray
+from ground.context import Context
+from ground.hints import Polygon
+from tests.hints import ScalarT
+from tests.utils import reverse_sequence
+
+from . import strategies
+
+
+@given(strategies.contexts_with_polygons_lists)
+def test_basic(
+    context_with_polygons: tuple[Context[ScalarT], Sequence[Polygon[ScalarT]]],
+) -> None:
+    context, polygons = context_with_polygons
+
+    result = context.polygons_centroids(polygons)
+
+    assert len(result) == len(polygons)
+    assert all(isinstance(element, context.point_cls) for element in result)
+
+
+@given(strategies.contexts_with_empty_lists)
+def test_empty(
+    context_with_polygons: tuple[Context[ScalarT], Sequence[Polygon[ScalarT]]],
+) -> None:
+    context, polygons = context_with_polygons
+
+    result = context.polygons_centroids(polygons)
+
+    assert len(result) == 0
+
+
+@given(strategies.contexts_with_polygons_lists)
+def test_alignment_with_polygon_centroid(
+    context_with_polygons: tuple[Context[ScalarT], Sequence[Polygon[ScalarT]]],
+) -> None:
+    context, polygons = context_with_polygons
+
+    result = context.polygons_centroids(polygons)
+
+    assert list(result) == [
+        context.polygon_centroid(polygon) for polygon in polygons
+    ]
+
+
+@given(strategies.contexts_with_polygons_lists)
+def test_reversals(
+    context_with_polygons: tuple[Context[ScalarT], Sequence[Polygon[ScalarT]]],
+) -> None:
+    context, polygons = context_with_polygons
+
+    result = context.polygons_centroids(polygons)
+
+    assert list(result) == reverse_sequence(
+        list(context.polygons_centroids(reverse_sequence(polygons)))
+    )
+
+
+@given(strategies.float_contours_coordinates_pairs_lists)
+def test_point_arrays(
+    borders_coordinates_pairs: list[list[tuple[float, float]]],
+) -> None:
+    context = Context(coordinate_factory=float, sqrt=math.sqrt)
+    polygons = [
+        context.polygon_cls(
+            context.contour_cls(
+                PointArray(
+                    array(
+                        'd',
+                        [
+                            coordinate
+                            for pair in coordinates_pairs
+                            for coordinate in pair
+                        ],
+                    )
+                )
+            ),
+            [],
+        )
+        for coordinates_pairs in borders_coordinates_pairs
+    ]
+    assume(
+        all(context.region_signed_area(polygon.border) for polygon in polygons)
+    )
+
+    result = context.polygons_centroids(polygons)
+
+    assert list(result) == context.polygons_centroids(
+        [
+            context.polygon_cls(
+                context.contour_cls(list(polygon.border.vertices)), []
+            )
+            for polygon in polygons
+        ]
+    )
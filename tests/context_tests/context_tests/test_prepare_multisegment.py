@@ -0,0 +1,95 @@
+import pytest
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Multisegment, Point, Segment
+from ground.prepared import PreparedMultisegment
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_multisegments)
+def test_basic(
+    context_with_multisegment: tuple[Context[ScalarT], Multisegment[ScalarT]],
+) -> None:
+    context, multisegment = context_with_multisegment
+
+    result = context.prepare_multisegment(multisegment)
+
+    assert isinstance(result, PreparedMultisegment)
+    assert result.multisegment is multisegment
+    assert result.box == context.segments_box(multisegment.segments)
+    assert result.segments_rtree.boxes == [
+        context.segment_box(segment) for segment in multisegment.segments
+    ]
+
+
+@given(
+    strategies.contexts_with_multisegments_and_points,
+    strategies.nearest_counts,
+)
+def test_find_n_nearest_to_point(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+    n: int,
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+
+    result = context.prepare_multisegment(
+        multisegment
+    ).find_n_nearest_to_point(n, point)
+
+    assert (
+        result
+        == [
+            index
+            for _, index in sorted(
+                (context.segment_point_squared_distance(segment, point), index)
+                for index, segment in enumerate(multisegment.segments)
+            )
+        ][:n]
+    )
+
+
+@given(strategies.contexts_with_multisegments_and_points)
+def test_point_squared_distance(
+    context_with_multisegment_and_point: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, multisegment, point = context_with_multisegment_and_point
+
+    result = context.prepare_multisegment(multisegment).point_squared_distance(
+        point
+    )
+
+    assert result == min(
+        context.segment_point_squared_distance(segment, point)
+        for segment in multisegment.segments
+    )
+
+
+@given(strategies.contexts_with_multisegments_and_segments)
+def test_segment_squared_distance(
+    context_with_multisegment_and_segment: tuple[
+        Context[ScalarT], Multisegment[ScalarT], Segment[ScalarT]
+    ],
+) -> None:
+    context, multisegment, segment = context_with_multisegment_and_segment
+
+    result = context.prepare_multisegment(
+        multisegment
+    ).segment_squared_distance(segment)
+
+    assert result == min(
+        context.segments_squared_distance(multisegment_segment, segment)
+        for multisegment_segment in multisegment.segments
+    )
+
+
+@given(strategies.contexts)
+def test_empty(context: Context[ScalarT]) -> None:
+    with pytest.raises(ValueError, match='at least 1 segment'):
+        context.prepare_multisegment(context.multisegment_cls([]))
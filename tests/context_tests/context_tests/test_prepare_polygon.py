@@ -0,0 +1,92 @@
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Location
+from ground.hints import Point, Polygon, Segment
+from ground.prepared import PreparedPolygon
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_polygons)
+def test_basic(
+    context_with_polygon: tuple[Context[ScalarT], Polygon[ScalarT]],
+) -> None:
+    context, polygon = context_with_polygon
+
+    result = context.prepare_polygon(polygon)
+
+    assert isinstance(result, PreparedPolygon)
+    assert result.polygon is polygon
+    assert result.box == context.polygon_box(polygon)
+    assert result.edges == [
+        edge
+        for contour in (polygon.border, *polygon.holes)
+        for edge in context.contour_segments(contour)
+    ]
+    assert result.area > context.zero
+    assert result.is_convex is (
+        not polygon.holes and context.is_region_convex(polygon.border)
+    )
+
+
+@given(strategies.contexts_with_polygons_and_points)
+def test_locate_point(
+    context_with_polygon_and_point: tuple[
+        Context[ScalarT], Polygon[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, polygon, point = context_with_polygon_and_point
+
+    result = context.prepare_polygon(polygon).locate_point(point)
+
+    assert result is context.locate_point_in_polygon(point, polygon)
+
+
+@given(strategies.contexts_with_polygons_and_points)
+def test_point_squared_distance(
+    context_with_polygon_and_point: tuple[
+        Context[ScalarT], Polygon[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, polygon, point = context_with_polygon_and_point
+
+    prepared = context.prepare_polygon(polygon)
+    result = prepared.point_squared_distance(point)
+
+    assert result == (
+        context.zero
+        if (
+            context.locate_point_in_polygon(point, polygon)
+            is not Location.EXTERIOR
+        )
+        else min(
+            context.segment_point_squared_distance(edge, point)
+            for edge in prepared.edges
+        )
+    )
+
+
+@given(strategies.contexts_with_polygons_and_segments)
+def test_segment_squared_distance(
+    context_with_polygon_and_segment: tuple[
+        Context[ScalarT], Polygon[ScalarT], Segment[ScalarT]
+    ],
+) -> None:
+    context, polygon, segment = context_with_polygon_and_segment
+
+    prepared = context.prepare_polygon(polygon)
+    result = prepared.segment_squared_distance(segment)
+
+    assert result == (
+        context.zero
+        if (
+            context.locate_point_in_polygon(segment.start, polygon)
+            is not Location.EXTERIOR
+        )
+        else min(
+            context.segments_squared_distance(edge, segment)
+            for edge in prepared.edges
+        )
+    )
@@ -0,0 +1,84 @@
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Location
+from ground.hints import Contour, Point, Segment
+from ground.prepared import PreparedRegion
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_contours)
+def test_basic(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+) -> None:
+    context, contour = context_with_contour
+
+    result = context.prepare_region(contour)
+
+    assert isinstance(result, PreparedRegion)
+    assert result.contour is contour
+    assert result.box == context.contour_box(contour)
+    assert result.edges == context.contour_segments(contour)
+    assert result.is_convex is context.is_region_convex(contour)
+    assert result.signed_area == context.region_signed_area(contour)
+
+
+@given(strategies.contexts_with_contours_and_points)
+def test_locate_point(
+    context_with_contour_and_point: tuple[
+        Context[ScalarT], Contour[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, contour, point = context_with_contour_and_point
+
+    result = context.prepare_region(contour).locate_point(point)
+
+    assert result is context.locate_point_in_region(point, contour)
+
+
+@given(strategies.contexts_with_contours_and_points)
+def test_point_squared_distance(
+    context_with_contour_and_point: tuple[
+        Context[ScalarT], Contour[ScalarT], Point[ScalarT]
+    ],
+) -> None:
+    context, contour, point = context_with_contour_and_point
+
+    result = context.prepare_region(contour).point_squared_distance(point)
+
+    assert result == (
+        context.zero
+        if (
+            context.locate_point_in_region(point, contour)
+            is not Location.EXTERIOR
+        )
+        else min(
+            context.segment_point_squared_distance(edge, point)
+            for edge in context.contour_segments(contour)
+        )
+    )
+
+
+@given(strategies.contexts_with_contours_and_segments)
+def test_segment_squared_distance(
+    context_with_contour_and_segment: tuple[
+        Context[ScalarT], Contour[ScalarT], Segment[ScalarT]
+    ],
+) -> None:
+    context, contour, segment = context_with_contour_and_segment
+
+    result = context.prepare_region(contour).segment_squared_distance(segment)
+
+    assert result == (
+        context.zero
+        if (
+            context.locate_point_in_region(segment.start, contour)
+            is not Location.EXTERIOR
+        )
+        else min(
+            context.segments_squared_distance(edge, segment)
+            for edge in context.contour_segments(contour)
+        )
+    )
@@ -0,0 +1,86 @@
+import math
+from itertools import starmap
+
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Location
+from ground.hints import Contour
+from ground.indexing import SlabDecomposition
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_contours)
+def test_basic(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+) -> None:
+    context, contour = context_with_contour
+
+    result = context.region_slab_decomposition(contour)
+
+    assert isinstance(result, SlabDecomposition)
+    assert result.contours == [contour]
+
+
+@given(strategies.contexts_with_contours)
+def test_vertices(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+) -> None:
+    context, contour = context_with_contour
+
+    result = context.region_slab_decomposition(contour)
+
+    assert all(
+        result.locate(vertex) is Location.BOUNDARY
+        for vertex in contour.vertices
+    )
+
+
+@given(strategies.contexts_with_contours)
+def test_edges_midpoints(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+) -> None:
+    context, contour = context_with_contour
+
+    result = context.region_slab_decomposition(contour)
+
+    assert all(
+        result.locate(context.segment_centroid(edge)) is Location.BOUNDARY
+        for edge in context.contour_segments(contour)
+    )
+
+
+def test_float_nearly_parallel_edges() -> None:
+    context = Context(coordinate_factory=float, sqrt=math.sqrt)
+    contours_coordinates = [
+        [
+            (-0.5327936504304869, 0.25702344596787796),
+            (-0.09880039595845791, -0.29805987742430873),
+            (-0.3950883619040097, 0.08089649372539019),
+            (-0.5327936504304869, 0.2570234459678781),
+            (0.7954015052514997, -1.441756370382646),
+            (0.4600106135829716, -1.0127868210533169),
+        ],
+        [
+            (-0.6786274780511992, -0.6316632263187054),
+            (1.9873090308819235, -4.926003321977198),
+            (0.4422608212301634, -2.4372109391877967),
+            (-0.6786274780511992, -0.6316632263187052),
+            (0.5114855806726392, -2.548719468775812),
+            (1.3571620528550685, -3.9109508536115163),
+        ],
+    ]
+
+    for coordinates_pairs in contours_coordinates:
+        contour = context.contour_cls(
+            list(starmap(context.point_cls, coordinates_pairs))
+        )
+
+        result = context.region_slab_decomposition(contour)
+
+        assert all(
+            result.locate(vertex) is Location.BOUNDARY
+            for vertex in contour.vertices
+        )
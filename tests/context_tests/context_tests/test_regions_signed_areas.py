@@ -0,0 +1,89 @@
+import math
+from array import array
+from collections.abc import Sequence
+
+from hypothesis import given
+
+from ground.arrays import PointArray
+from ground.context import Context
+from ground.hints import Contour
+from tests.hints import ScalarT
+from tests.utils import reverse_sequence
+
+from . import strategies
+
+
+@given(strategies.contexts_with_contours_lists)
+def test_basic(
+    context_with_contours: tuple[Context[ScalarT], Sequence[Contour[ScalarT]]],
+) -> None:
+    context, contours = context_with_contours
+
+    result = context.regions_signed_areas(contours)
+
+    assert len(result) == len(contours)
+
+
+@given(strategies.contexts_with_empty_lists)
+def test_empty(
+    context_with_contours: tuple[Context[ScalarT], Sequence[Contour[ScalarT]]],
+) -> None:
+    context, contours = context_with_contours
+
+    result = context.regions_signed_areas(contours)
+
+    assert len(result) == 0
+
+
+@given(strategies.contexts_with_contours_lists)
+def test_alignment_with_region_signed_area(
+    context_with_contours: tuple[Context[ScalarT], Sequence[Contour[ScalarT]]],
+) -> None:
+    context, contours = context_with_contours
+
+    result = context.regions_signed_areas(contours)
+
+    assert list(result) == [
+        context.region_signed_area(contour) for contour in contours
+    ]
+
+
+@given(strategies.contexts_with_contours_lists)
+def test_reversals(
+    context_with_contours: tuple[Context[ScalarT], Sequence[Contour[ScalarT]]],
+) -> None:
+    context, contours = context_with_contours
+
+    result = context.regions_signed_areas(contours)
+
+    assert list(result) == reverse_sequence(
+        list(context.regions_signed_areas(reverse_sequence(contours)))
+    )
+
+
+@given(strategies.float_contours_coordinates_pairs_lists)
+def test_point_arrays(
+    contours_coordinates_pairs: list[list[tuple[float, float]]],
+) -> None:
+    context = Context(coordinate_factory=float, sqrt=math.sqrt)
+    contours = [
+        context.contour_cls(
+            PointArray(
+                array(
+                    'd',
+                    [
+                        coordinate
+                        for pair in coordinates_pairs
+                        for coordinate in pair
+                    ],
+                )
+            )
+        )
+        for coordinates_pairs in contours_coordinates_pairs
+    ]
+
+    result = context.regions_signed_areas(contours)
+
+    assert list(result) == context.regions_signed_areas(
+        [context.contour_cls(list(contour.vertices)) for contour in contours]
+    )
@@ -0,0 +1,24 @@
+from hypothesis import given
+
+from ground.context import Context
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts)
+def test_basic(context: Context[ScalarT]) -> None:
+    result = context.replace()
+
+    assert isinstance(result, Context)
+    assert result == context
+
+
+@given(strategies.contexts, strategies.sub_contexts_names)
+def test_sub_contexts(context: Context[ScalarT], name: str) -> None:
+    sub_context = getattr(context, name)
+
+    result = context.replace(**{name: sub_context})
+
+    assert getattr(result, name) is sub_context
+    assert result == context
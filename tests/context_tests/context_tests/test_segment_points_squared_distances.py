@@ -0,0 +1,108 @@
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Point, Segment
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_segments_and_points_lists)
+def test_basic(
+    context_with_segment_and_points: tuple[
+        Context[ScalarT], Segment[ScalarT], Sequence[Point[ScalarT]]
+    ],
+) -> None:
+    context, segment, points = context_with_segment_and_points
+
+    result = context.segment_points_squared_distances(segment, points)
+
+    assert isinstance(result, Sequence)
+    assert len(result) == len(points)
+    assert all(isinstance(element, type(context.zero)) for element in result)
+
+
+@given(strategies.contexts_with_segments_and_points_lists)
+def test_alignment_with_segment_point_squared_distance(
+    context_with_segment_and_points: tuple[
+        Context[ScalarT], Segment[ScalarT], Sequence[Point[ScalarT]]
+    ],
+) -> None:
+    context, segment, points = context_with_segment_and_points
+
+    result = context.segment_points_squared_distances(segment, points)
+
+    assert list(result) == [
+        context.segment_point_squared_distance(segment, point)
+        for point in points
+    ]
+
+
+@given(strategies.contexts_with_segments_and_points_lists)
+def test_coordinates_buffer(
+    context_with_segment_and_points: tuple[
+        Context[ScalarT], Segment[ScalarT], Sequence[Point[ScalarT]]
+    ],
+) -> None:
+    context, segment, points = context_with_segment_and_points
+    metric_context: Any = context.metric_context
+    float_context = Context(
+        coordinate_factory=float, metric_context=metric_context, sqrt=math.sqrt
+    )
+    float_segment = float_context.segment_cls(
+        _to_float_point(segment.start, float_context),
+        _to_float_point(segment.end, float_context),
+    )
+    float_points = [_to_float_point(point, float_context) for point in points]
+
+    result = float_context.segment_points_squared_distances(
+        float_segment, _to_coordinates_buffer(float_points)
+    )
+
+    assert isinstance(result, array)
+    assert result.typecode == 'd'
+    assert list(result) == [
+        float_context.segment_point_squared_distance(float_segment, point)
+        for point in float_points
+    ]
+
+
+@given(strategies.contexts_with_non_empty_points_lists)
+def test_degenerate_segment(
+    context_with_points: tuple[Context[ScalarT], Sequence[Point[ScalarT]]],
+) -> None:
+    context, points = context_with_points
+    metric_context: Any = context.metric_context
+    float_context = Context(
+        coordinate_factory=float, metric_context=metric_context, sqrt=math.sqrt
+    )
+    float_points = [_to_float_point(point, float_context) for point in points]
+    float_segment = float_context.segment_cls(float_points[0], float_points[0])
+
+    with pytest.raises(ZeroDivisionError):
+        float_context.segment_points_squared_distances(
+            float_segment, float_points
+        )
+    with pytest.raises(ZeroDivisionError):
+        float_context.segment_points_squared_distances(
+            float_segment, _to_coordinates_buffer(float_points)
+        )
+
+
+def _to_coordinates_buffer(points: Sequence[Point[float]]) -> 'array[float]':
+    return array(
+        'd',
+        [coordinate for point in points for coordinate in (point.x, point.y)],
+    )
+
+
+def _to_float_point(
+    point: Point[Any], context: Context[float]
+) -> Point[float]:
+    return context.point_cls(float(point.x), float(point.y))
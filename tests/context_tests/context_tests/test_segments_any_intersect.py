@@ -0,0 +1,68 @@
+from collections.abc import Sequence
+from itertools import combinations
+
+import pytest
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Relation
+from ground.hints import Contour, Segment
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_segments_lists)
+def test_basic(
+    context_with_segments: tuple[Context[ScalarT], Sequence[Segment[ScalarT]]],
+) -> None:
+    context, segments = context_with_segments
+
+    result = context.segments_any_intersect(segments)
+
+    assert isinstance(result, bool)
+
+
+@given(strategies.contexts_with_segments_lists)
+def test_alignment_with_segments_relation(
+    context_with_segments: tuple[Context[ScalarT], Sequence[Segment[ScalarT]]],
+) -> None:
+    context, segments = context_with_segments
+
+    result = context.segments_any_intersect(segments)
+
+    assert result is any(
+        context.segments_relation(first, second)
+        not in (Relation.DISJOINT, Relation.TOUCH)
+        for first, second in combinations(segments, 2)
+    )
+
+
+@given(strategies.contexts_with_contours)
+def test_contour_segments(
+    context_with_contour: tuple[Context[ScalarT], Contour[ScalarT]],
+) -> None:
+    context, contour = context_with_contour
+
+    result = context.segments_any_intersect(context.contour_segments(contour))
+
+    assert result is any(
+        context.segments_relation(first, second)
+        not in (Relation.DISJOINT, Relation.TOUCH)
+        for first, second in combinations(context.contour_segments(contour), 2)
+    )
+
+
+@given(strategies.contexts_with_segments_lists)
+def test_degenerate_segment(
+    context_with_segments: tuple[Context[ScalarT], Sequence[Segment[ScalarT]]],
+) -> None:
+    context, segments = context_with_segments
+    point = context.point_cls(
+        context.coordinate_factory(0), context.coordinate_factory(0)
+    )
+
+    with pytest.raises(ValueError, match='non-degenerate'):
+        context.segments_any_intersect(
+            [*segments, context.segment_cls(point, point)]
+        )
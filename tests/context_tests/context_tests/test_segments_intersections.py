@@ -0,0 +1,129 @@
+import math
+from collections.abc import Iterator, Sequence
+from itertools import combinations
+
+import pytest
+from hypothesis import given
+
+from ground.context import Context
+from ground.enums import Relation
+from ground.hints import Segment
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_segments_lists)
+def test_basic(
+    context_with_segments: tuple[Context[ScalarT], Sequence[Segment[ScalarT]]],
+) -> None:
+    context, segments = context_with_segments
+
+    result = context.segments_intersections(segments)
+
+    assert isinstance(result, Iterator)
+    assert all(
+        isinstance(intersection, tuple) and len(intersection) == 4
+        for intersection in result
+    )
+
+
+@given(strategies.contexts_with_segments_lists)
+def test_alignment_with_segments_relation(
+    context_with_segments: tuple[Context[ScalarT], Sequence[Segment[ScalarT]]],
+) -> None:
+    context, segments = context_with_segments
+
+    result = context.segments_intersections(segments)
+
+    assert sorted(
+        (first_index, second_index, relation)
+        for first_index, second_index, relation, _ in result
+    ) == [
+        (first_index, second_index, relation)
+        for (first_index, first), (second_index, second) in combinations(
+            enumerate(segments), 2
+        )
+        if (
+            (relation := context.segments_relation(first, second))
+            is not Relation.DISJOINT
+        )
+    ]
+
+
+@given(strategies.contexts_with_segments_lists)
+def test_points(
+    context_with_segments: tuple[Context[ScalarT], Sequence[Segment[ScalarT]]],
+) -> None:
+    context, segments = context_with_segments
+
+    result = context.segments_intersections(segments)
+
+    assert all(
+        context.segment_contains_point(segments[first_index], point)
+        and context.segment_contains_point(segments[second_index], point)
+        for first_index, second_index, _, point in result
+    )
+
+
+@given(strategies.contexts_with_segments_lists)
+def test_degenerate_segment(
+    context_with_segments: tuple[Context[ScalarT], Sequence[Segment[ScalarT]]],
+) -> None:
+    context, segments = context_with_segments
+    point = context.point_cls(
+        context.coordinate_factory(0), context.coordinate_factory(0)
+    )
+
+    with pytest.raises(ValueError, match='non-degenerate'):
+        context.segments_intersections(
+            [*segments, context.segment_cls(point, point)]
+        )
+
+
+def test_float_coordinates() -> None:
+    context = Context(coordinate_factory=float, sqrt=math.sqrt)
+    segments_coordinates = [
+        [((1.0, 6 / 7), (1.0, 2.0)), ((4 / 3, 0.0), (1 / 3, 6.0))],
+        [((4.0, 0.0), (0.0, 2.0)), ((0.0, 1 / 3), (2 / 3, 5 / 3))],
+        [((0.0, 1.0), (3 / 7, 0.0)), ((1 / 7, 2 / 3), (2.0, 2 / 3))],
+        [
+            ((1 / 3, 0.0), (0.0, 2.0)),
+            ((1 / 7, 2 / 7), (5 / 3, 2 / 3)),
+            ((5 / 7, 4 / 3), (1 / 7, 0.0)),
+        ],
+        [
+            ((2.0, 3 / 7), (0.0, 0.0)),
+            ((2 / 7, 0.0), (4.0, 1.0)),
+            ((0.0, 1.0), (2.0, 0.0)),
+        ],
+        [
+            ((5 / 3, 4 / 3), (4.0, 1.0)),
+            ((3.0, 5.0), (2.0, 0.0)),
+            ((3.0, 0.0), (0.0, 5.0)),
+        ],
+    ]
+
+    for coordinates_pairs in segments_coordinates:
+        segments = [
+            context.segment_cls(
+                context.point_cls(*start), context.point_cls(*end)
+            )
+            for start, end in coordinates_pairs
+        ]
+
+        result = context.segments_intersections(segments)
+
+        assert sorted(
+            (first_index, second_index, relation)
+            for first_index, second_index, relation, _ in result
+        ) == [
+            (first_index, second_index, relation)
+            for (first_index, first), (second_index, second) in combinations(
+                enumerate(segments), 2
+            )
+            if (
+                (relation := context.segments_relation(first, second))
+                is not Relation.DISJOINT
+            )
+        ]
@@ -0,0 +1,137 @@
+import math
+from array import array
+from collections.abc import Sequence
+from itertools import starmap
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from ground.context import Context
+from ground.hints import Point, Segment
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_segments_with_points_lists)
+def test_basic(
+    context_with_segments_with_points: tuple[
+        Context[ScalarT], Sequence[tuple[Segment[ScalarT], Point[ScalarT]]]
+    ],
+) -> None:
+    context, segments_with_points = context_with_segments_with_points
+    starts, ends, points = _to_transposed(segments_with_points)
+
+    result = context.segments_points_squared_distances(starts, ends, points)
+
+    assert isinstance(result, Sequence)
+    assert len(result) == len(segments_with_points)
+    assert all(isinstance(element, type(context.zero)) for element in result)
+
+
+@given(strategies.contexts_with_segments_with_points_lists)
+def test_alignment_with_segment_point_squared_distance(
+    context_with_segments_with_points: tuple[
+        Context[ScalarT], Sequence[tuple[Segment[ScalarT], Point[ScalarT]]]
+    ],
+) -> None:
+    context, segments_with_points = context_with_segments_with_points
+    starts, ends, points = _to_transposed(segments_with_points)
+
+    result = context.segments_points_squared_distances(starts, ends, points)
+
+    assert list(result) == list(
+        starmap(context.segment_point_squared_distance, segments_with_points)
+    )
+
+
+@given(strategies.contexts_with_segments_with_points_lists)
+def test_coordinates_buffers(
+    context_with_segments_with_points: tuple[
+        Context[ScalarT], Sequence[tuple[Segment[ScalarT], Point[ScalarT]]]
+    ],
+) -> None:
+    context, segments_with_points = context_with_segments_with_points
+    metric_context: Any = context.metric_context
+    float_context = Context(
+        coordinate_factory=float, metric_context=metric_context, sqrt=math.sqrt
+    )
+    float_segments_with_points = [
+        (
+            float_context.segment_cls(
+                _to_float_point(segment.start, float_context),
+                _to_float_point(segment.end, float_context),
+            ),
+            _to_float_point(point, float_context),
+        )
+        for segment, point in segments_with_points
+    ]
+    starts, ends, points = _to_transposed(float_segments_with_points)
+
+    result = float_context.segments_points_squared_distances(
+        _to_coordinates_buffer(starts),
+        _to_coordinates_buffer(ends),
+        _to_coordinates_buffer(points),
+    )
+
+    assert isinstance(result, array)
+    assert result.typecode == 'd'
+    assert list(result) == list(
+        starmap(
+            float_context.segment_point_squared_distance,
+            float_segments_with_points,
+        )
+    )
+
+
+@given(strategies.contexts_with_segments_with_points_lists)
+def test_mixed_inputs(
+    context_with_segments_with_points: tuple[
+        Context[ScalarT], Sequence[tuple[Segment[ScalarT], Point[ScalarT]]]
+    ],
+) -> None:
+    context, segments_with_points = context_with_segments_with_points
+    metric_context: Any = context.metric_context
+    float_context = Context(
+        coordinate_factory=float, metric_context=metric_context, sqrt=math.sqrt
+    )
+    float_segments_with_points = [
+        (
+            float_context.segment_cls(
+                _to_float_point(segment.start, float_context),
+                _to_float_point(segment.end, float_context),
+            ),
+            _to_float_point(point, float_context),
+        )
+        for segment, point in segments_with_points
+    ]
+    starts, ends, points = _to_transposed(float_segments_with_points)
+
+    with pytest.raises(TypeError, match='either all buffers'):
+        float_context.segments_points_squared_distances(
+            _to_coordinates_buffer(starts), ends, points
+        )
+
+
+def _to_coordinates_buffer(points: Sequence[Point[float]]) -> 'array[float]':
+    return array(
+        'd',
+        [coordinate for point in points for coordinate in (point.x, point.y)],
+    )
+
+
+def _to_float_point(
+    point: Point[Any], context: Context[float]
+) -> Point[float]:
+    return context.point_cls(float(point.x), float(point.y))
+
+
+def _to_transposed(
+    segments_with_points: Sequence[tuple[Segment[ScalarT], Point[ScalarT]]],
+) -> tuple[list[Point[ScalarT]], list[Point[ScalarT]], list[Point[ScalarT]]]:
+    return (
+        [segment.start for segment, _ in segments_with_points],
+        [segment.end for segment, _ in segments_with_points],
+        [point for _, point in segments_with_points],
+    )
@@ -0,0 +1,56 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Contour
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_contours_and_affine_transforms)
+def test_basic(
+    context_with_contour_and_transform: tuple[
+        Context[ScalarT], Contour[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, contour, transform = context_with_contour_and_transform
+
+    result = context.transform_contour(contour, transform)
+
+    assert isinstance(
+        result,
+        (context.contour_cls, context.multipoint_cls, context.segment_cls),
+    )
+
+
+@given(strategies.contexts_with_contours_and_scalars_pairs)
+def test_scaling(
+    context_with_contour_and_factors: tuple[
+        Context[ScalarT], Contour[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, contour, factor_x, factor_y = context_with_contour_and_factors
+    zero = context.zero
+
+    result = context.transform_contour(
+        contour, AffineTransform(factor_x, zero, zero, factor_y, zero, zero)
+    )
+
+    assert result == context.scale_contour(contour, factor_x, factor_y)
+
+
+@given(strategies.contexts_with_contours_and_scalars_pairs)
+def test_translation(
+    context_with_contour_and_steps: tuple[
+        Context[ScalarT], Contour[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, contour, step_x, step_y = context_with_contour_and_steps
+    zero, one = context.zero, context.coordinate_factory(1)
+
+    result = context.transform_contour(
+        contour, AffineTransform(one, zero, zero, one, step_x, step_y)
+    )
+
+    assert result == context.translate_contour(contour, step_x, step_y)
@@ -0,0 +1,55 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Multipoint
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_multipoints_and_affine_transforms)
+def test_basic(
+    context_with_multipoint_and_transform: tuple[
+        Context[ScalarT], Multipoint[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, multipoint, transform = context_with_multipoint_and_transform
+
+    result = context.transform_multipoint(multipoint, transform)
+
+    assert isinstance(result, context.multipoint_cls)
+
+
+@given(strategies.contexts_with_multipoints_and_scalars_pairs)
+def test_scaling(
+    context_with_multipoint_and_factors: tuple[
+        Context[ScalarT], Multipoint[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, multipoint, factor_x, factor_y = (
+        context_with_multipoint_and_factors
+    )
+    zero = context.zero
+
+    result = context.transform_multipoint(
+        multipoint, AffineTransform(factor_x, zero, zero, factor_y, zero, zero)
+    )
+
+    assert result == context.scale_multipoint(multipoint, factor_x, factor_y)
+
+
+@given(strategies.contexts_with_multipoints_and_scalars_pairs)
+def test_translation(
+    context_with_multipoint_and_steps: tuple[
+        Context[ScalarT], Multipoint[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, multipoint, step_x, step_y = context_with_multipoint_and_steps
+    zero, one = context.zero, context.coordinate_factory(1)
+
+    result = context.transform_multipoint(
+        multipoint, AffineTransform(one, zero, zero, one, step_x, step_y)
+    )
+
+    assert result == context.translate_multipoint(multipoint, step_x, step_y)
@@ -0,0 +1,67 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Multipolygon
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_multipolygons_and_affine_transforms)
+def test_basic(
+    context_with_multipolygon_and_transform: tuple[
+        Context[ScalarT], Multipolygon[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, multipolygon, transform = context_with_multipolygon_and_transform
+
+    result = context.transform_multipolygon(multipolygon, transform)
+
+    assert isinstance(
+        result,
+        (
+            context.multipoint_cls,
+            context.multipolygon_cls,
+            context.multisegment_cls,
+        ),
+    )
+
+
+@given(strategies.contexts_with_multipolygons_and_scalars_pairs)
+def test_scaling(
+    context_with_multipolygon_and_factors: tuple[
+        Context[ScalarT], Multipolygon[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, multipolygon, factor_x, factor_y = (
+        context_with_multipolygon_and_factors
+    )
+    zero = context.zero
+
+    result = context.transform_multipolygon(
+        multipolygon,
+        AffineTransform(factor_x, zero, zero, factor_y, zero, zero),
+    )
+
+    assert result == context.scale_multipolygon(
+        multipolygon, factor_x, factor_y
+    )
+
+
+@given(strategies.contexts_with_multipolygons_and_scalars_pairs)
+def test_translation(
+    context_with_multipolygon_and_steps: tuple[
+        Context[ScalarT], Multipolygon[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, multipolygon, step_x, step_y = context_with_multipolygon_and_steps
+    zero, one = context.zero, context.coordinate_factory(1)
+
+    result = context.transform_multipolygon(
+        multipolygon, AffineTransform(one, zero, zero, one, step_x, step_y)
+    )
+
+    assert result == context.translate_multipolygon(
+        multipolygon, step_x, step_y
+    )
@@ -0,0 +1,68 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Multisegment
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_multisegments_and_affine_transforms)
+def test_basic(
+    context_with_multisegment_and_transform: tuple[
+        Context[ScalarT], Multisegment[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, multisegment, transform = context_with_multisegment_and_transform
+
+    result = context.transform_multisegment(multisegment, transform)
+
+    assert isinstance(
+        result,
+        (
+            context.mix_cls,
+            context.multipoint_cls,
+            context.multisegment_cls,
+            context.segment_cls,
+        ),
+    )
+
+
+@given(strategies.contexts_with_multisegments_and_scalars_pairs)
+def test_scaling(
+    context_with_multisegment_and_factors: tuple[
+        Context[ScalarT], Multisegment[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, multisegment, factor_x, factor_y = (
+        context_with_multisegment_and_factors
+    )
+    zero = context.zero
+
+    result = context.transform_multisegment(
+        multisegment,
+        AffineTransform(factor_x, zero, zero, factor_y, zero, zero),
+    )
+
+    assert result == context.scale_multisegment(
+        multisegment, factor_x, factor_y
+    )
+
+
+@given(strategies.contexts_with_multisegments_and_scalars_pairs)
+def test_translation(
+    context_with_multisegment_and_steps: tuple[
+        Context[ScalarT], Multisegment[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, multisegment, step_x, step_y = context_with_multisegment_and_steps
+    zero, one = context.zero, context.coordinate_factory(1)
+
+    result = context.transform_multisegment(
+        multisegment, AffineTransform(one, zero, zero, one, step_x, step_y)
+    )
+
+    assert result == context.translate_multisegment(
+        multisegment, step_x, step_y
+    )
@@ -0,0 +1,53 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Point
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_points_and_affine_transforms)
+def test_basic(
+    context_with_point_and_transform: tuple[
+        Context[ScalarT], Point[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, point, transform = context_with_point_and_transform
+
+    result = context.transform_point(point, transform)
+
+    assert isinstance(result, context.point_cls)
+
+
+@given(strategies.contexts_with_points_and_scalars_pairs)
+def test_scaling(
+    context_with_point_and_factors: tuple[
+        Context[ScalarT], Point[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, point, factor_x, factor_y = context_with_point_and_factors
+    zero = context.zero
+
+    result = context.transform_point(
+        point, AffineTransform(factor_x, zero, zero, factor_y, zero, zero)
+    )
+
+    assert result == context.scale_point(point, factor_x, factor_y)
+
+
+@given(strategies.contexts_with_points_and_scalars_pairs)
+def test_translation(
+    context_with_point_and_steps: tuple[
+        Context[ScalarT], Point[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, point, step_x, step_y = context_with_point_and_steps
+    zero, one = context.zero, context.coordinate_factory(1)
+
+    result = context.transform_point(
+        point, AffineTransform(one, zero, zero, one, step_x, step_y)
+    )
+
+    assert result == context.translate_point(point, step_x, step_y)
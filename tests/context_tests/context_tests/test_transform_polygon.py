@@ -0,0 +1,56 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Polygon
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_polygons_and_affine_transforms)
+def test_basic(
+    context_with_polygon_and_transform: tuple[
+        Context[ScalarT], Polygon[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, polygon, transform = context_with_polygon_and_transform
+
+    result = context.transform_polygon(polygon, transform)
+
+    assert isinstance(
+        result,
+        (context.multipoint_cls, context.polygon_cls, context.segment_cls),
+    )
+
+
+@given(strategies.contexts_with_polygons_and_scalars_pairs)
+def test_scaling(
+    context_with_polygon_and_factors: tuple[
+        Context[ScalarT], Polygon[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, polygon, factor_x, factor_y = context_with_polygon_and_factors
+    zero = context.zero
+
+    result = context.transform_polygon(
+        polygon, AffineTransform(factor_x, zero, zero, factor_y, zero, zero)
+    )
+
+    assert result == context.scale_polygon(polygon, factor_x, factor_y)
+
+
+@given(strategies.contexts_with_polygons_and_scalars_pairs)
+def test_translation(
+    context_with_polygon_and_steps: tuple[
+        Context[ScalarT], Polygon[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, polygon, step_x, step_y = context_with_polygon_and_steps
+    zero, one = context.zero, context.coordinate_factory(1)
+
+    result = context.transform_polygon(
+        polygon, AffineTransform(one, zero, zero, one, step_x, step_y)
+    )
+
+    assert result == context.translate_polygon(polygon, step_x, step_y)
@@ -0,0 +1,53 @@
+from hypothesis import given
+
+from ground.affine import AffineTransform
+from ground.context import Context
+from ground.hints import Segment
+from tests.hints import ScalarT
+
+from . import strategies
+
+
+@given(strategies.contexts_with_segments_and_affine_transforms)
+def test_basic(
+    context_with_segment_and_transform: tuple[
+        Context[ScalarT], Segment[ScalarT], AffineTransform[ScalarT]
+    ],
+) -> None:
+    context, segment, transform = context_with_segment_and_transform
+
+    result = context.transform_segment(segment, transform)
+
+    assert isinstance(result, (context.multipoint_cls, context.segment_cls))
+
+
+@given(strategies.contexts_with_segments_and_scalars_pairs)
+def test_scaling(
+    context_with_segment_and_factors: tuple[
+        Context[ScalarT], Segment[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, segment, factor_x, factor_y = context_with_segment_and_factors
+    zero = context.zero
+
+    result = context.transform_segment(
+        segment, AffineTransform(factor_x, zero, zero, factor_y, zero, zero)
+    )
+
+    assert result == context.scale_segment(segment, factor_x, factor_y)
+
+
+@given(strategies.contexts_with_segments_and_scalars_pairs)
+def test_translation(
+    context_with_segment_and_steps: tuple[
+        Context[ScalarT], Segment[ScalarT], ScalarT, ScalarT
+    ],
+) -> None:
+    context, segment, step_x, step_y = context_with_segment_and_steps
+    zero, one = context.zero, context.coordinate_factory(1)
+
+    result = context.transform_segment(
+        segment, AffineTransform(one, zero, zero, one, step_x, step_y)
+    )
+
+    assert result == context.translate_segment(segment, step_x, step_y)
@@ -0,0 +1,67 @@
+import math
+
+from hypothesis import strategies as st
+
+from ground.context import Context
+from tests.strategies.geometries import (
+    to_contours,
+    to_contours_lists,
+    to_multipoints,
+    to_multipolygons,
+    to_multisegments,
+    to_polygons,
+    to_polygons_lists,
+)
+
+MAX_COORDINATE = 10**3
+
+float_context = Context(coordinate_factory=float, sqrt=math.sqrt)
+# integral coordinates of small magnitude keep sums of their products
+# exact in floating point arithmetic, so the summation order does not matter
+float_coordinates = st.integers(-MAX_COORDINATE, MAX_COORDINATE).map(float)
+exact_methods_names_with_geometries = st.one_of(
+    [
+        st.tuples(st.sampled_from(methods_names), geometries)
+        for methods_names, geometries in [
+            (
+                ['region_centroid', 'region_signed_area'],
+                to_contours(float_context, float_coordinates),
+            ),
+            (
+                ['multipoint_centroid'],
+                to_multipoints(float_context, float_coordinates),
+            ),
+            (
+                ['multipolygon_centroid'],
+                to_multipolygons(float_context, float_coordinates),
+            ),
+            (
+                ['polygon_centroid'],
+                to_polygons(float_context, float_coordinates),
+            ),
+            (
+                ['polygons_centroids'],
+                to_polygons_lists(float_context, float_coordinates),
+            ),
+            (
+                ['regions_signed_areas'],
+                to_contours_lists(float_context, float_coordinates),
+            ),
+        ]
+    ]
+)
+inexact_methods_names_with_geometries = st.one_of(
+    [
+        st.tuples(st.sampled_from(methods_names), geometries)
+        for methods_names, geometries in [
+            (
+                ['contour_centroid'],
+                to_contours(float_context, float_coordinates),
+            ),
+            (
+                ['multisegment_centroid'],
+                to_multisegments(float_context, float_coordinates),
+            ),
+        ]
+    ]
+)
@@ -0,0 +1,21 @@
+from typing import Any
+
+import numpy
+from hypothesis import given, strategies as st
+
+from ground.affine import AffineTransform
+
+from . import strategies
+
+
+@given(st.lists(strategies.float_coordinates, min_size=6, max_size=6))
+def test_is_degenerate(coefficients: list[float]) -> None:
+    numpy_coefficients: list[Any] = [
+        numpy.float64(coefficient) for coefficient in coefficients
+    ]
+    transform = AffineTransform(*numpy_coefficients)
+
+    result = transform.is_degenerate
+
+    assert isinstance(result, bool)
+    assert result is AffineTransform(*coefficients).is_degenerate
@@ -0,0 +1,39 @@
+import math
+from typing import Any
+
+from hypothesis import given
+
+from ground import numpy
+
+from . import strategies
+
+float_context = strategies.float_context
+vectorized_float_context = float_context.replace(
+    centroidal_context=numpy.centroidal_context,
+    measured_context=numpy.measured_context,
+)
+
+
+@given(strategies.exact_methods_names_with_geometries)
+def test_exact(method_name_with_geometry: tuple[str, Any]) -> None:
+    method_name, geometry = method_name_with_geometry
+
+    result = getattr(vectorized_float_context, method_name)(geometry)
+
+    assert result == getattr(float_context, method_name)(geometry)
+
+
+@given(strategies.inexact_methods_names_with_geometries)
+def test_inexact(method_name_with_geometry: tuple[str, Any]) -> None:
+    method_name, geometry = method_name_with_geometry
+
+    result = getattr(vectorized_float_context, method_name)(geometry)
+
+    assert isinstance(result, float_context.point_cls)
+    expected = getattr(float_context, method_name)(geometry)
+    assert _are_close(result.x, expected.x)
+    assert _are_close(result.y, expected.y)
+
+
+def _are_close(left: float, right: float, /) -> bool:
+    return math.isclose(left, right, abs_tol=strategies.MAX_COORDINATE * 1e-12)
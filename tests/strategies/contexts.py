@@ -3,12 +3,33 @@ from fractions import Fraction
 from hypothesis import strategies as st
 from symba.base import sqrt
 
+from ground import filtered
+from ground._core import angular, centroidal, circular, measured
 from ground.context import Context
 
 from .coordinates import rational_coordinates_strategies
 
+angular_contexts = [angular.plain_context, filtered.angular_context]
+centroidal_contexts = [centroidal.plain_context]
+measured_contexts = [measured.plain_context]
+try:
+    from ground import numpy
+except ImportError:
+    pass
+else:
+    angular_contexts.append(numpy.angular_context)
+    centroidal_contexts.append(numpy.centroidal_context)
+    measured_contexts.append(numpy.measured_context)
 rational_contexts = st.builds(
-    Context, coordinate_factory=st.just(Fraction), sqrt=st.just(sqrt)
+    Context,
+    angular_context=st.sampled_from(angular_contexts),
+    centroidal_context=st.sampled_from(centroidal_contexts),
+    circular_context=st.sampled_from(
+        [circular.plain_context, filtered.circular_context]
+    ),
+    coordinate_factory=st.just(Fraction),
+    measured_context=st.sampled_from(measured_contexts),
+    sqrt=st.just(sqrt),
 )
 rational_contexts_with_coordinates_strategies = st.tuples(
     rational_contexts, rational_coordinates_strategies
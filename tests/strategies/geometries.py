@@ -4,6 +4,7 @@ from typing import TypeVar
 
 from hypothesis import strategies
 
+from ground.affine import AffineTransform
 from ground.context import Context
 from ground.enums import Orientation
 from ground.hints import (
@@ -34,6 +35,29 @@ from tests.utils import (
 )
 
 
+def to_affine_transforms(
+    coordinates: Strategy[ScalarT],
+) -> Strategy[AffineTransform[ScalarT]]:
+    return strategies.builds(
+        AffineTransform,
+        coordinates,
+        coordinates,
+        coordinates,
+        coordinates,
+        coordinates,
+        coordinates,
+    )
+
+
+def to_non_degenerate_affine_transforms(
+    coordinates: Strategy[ScalarT],
+) -> Strategy[AffineTransform[ScalarT]]:
+    def is_non_degenerate(transform: AffineTransform[ScalarT]) -> bool:
+        return not transform.is_degenerate
+
+    return to_affine_transforms(coordinates).filter(is_non_degenerate)
+
+
 def to_boxes(
     context: Context[ScalarT], coordinates: Strategy[ScalarT]
 ) -> Strategy[Box[ScalarT]]:
@@ -73,6 +97,25 @@ def to_multipoints(
     )
 
 
+def to_vertical_multipoints(
+    context: Context[ScalarT],
+    coordinates: Strategy[ScalarT],
+    *,
+    min_size: int = 1,
+    max_size: int | None = None,
+) -> Strategy[Multipoint[ScalarT]]:
+    def to_multipoint(x: ScalarT, ys: list[ScalarT]) -> Multipoint[ScalarT]:
+        return context.multipoint_cls([context.point_cls(x, y) for y in ys])
+
+    return strategies.builds(
+        to_multipoint,
+        coordinates,
+        strategies.lists(
+            coordinates, min_size=min_size, max_size=max_size, unique=True
+        ),
+    )
+
+
 def to_multipolygons(
     context: Context[ScalarT], coordinates: Strategy[ScalarT]
 ) -> Strategy[Multipolygon[ScalarT]]:
@@ -174,6 +217,16 @@ def to_borders_and_holes_sequences(
     )
 
 
+def to_polygons_lists(
+    context: Context[ScalarT], coordinates: Strategy[ScalarT]
+) -> Strategy[list[Polygon[ScalarT]]]:
+    return strategies.lists(
+        to_polygons(context, coordinates),
+        min_size=1,
+        max_size=MAX_SEQUENCE_SIZE,
+    )
+
+
 def to_polygons_sequences(
     context: Context[ScalarT], coordinates: Strategy[ScalarT]
 ) -> Strategy[Sequence[Polygon[ScalarT]]]:
@@ -189,6 +242,16 @@ def to_polygons(
     )
 
 
+def to_contours_lists(
+    context: Context[ScalarT], coordinates: Strategy[ScalarT]
+) -> Strategy[list[Contour[ScalarT]]]:
+    return strategies.lists(
+        to_contours(context, coordinates),
+        min_size=1,
+        max_size=MAX_SEQUENCE_SIZE,
+    )
+
+
 def to_contours_sequences(
     context: Context[ScalarT], coordinates: Strategy[ScalarT]
 ) -> Strategy[Sequence[Contour[ScalarT]]]: